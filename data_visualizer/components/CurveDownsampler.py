@@ -0,0 +1,91 @@
+# Standard library imports
+
+# External dependencies imports
+import numpy as np
+import pandas as pd
+
+### CurveDownsampler is used for reducing the number of points in a curve that are sent to the browser, while keeping the curve's visual shape. ###
+class CurveDownsampler:
+    # -------------------------------------------------- Constructor --------------------------------------------------
+    def __init__(self, max_points: int, method: str = "lttb") -> None:
+        """
+        Creates a new instance of the CurveDownsampler class with its instance variables.
+
+        Args:
+            max_points (int): Maximum number of points kept in a downsampled curve
+            method (str): Either "lttb" (Largest-Triangle-Three-Buckets, which keeps the points that contribute most to the curve's shape)
+                or "minmax" (keeps the lowest and highest point within evenly spaced bins along the x-axis)
+        """
+        # -------------------------------------------------- Constants --------------------------------------------------
+        self._max_points = max(max_points, 3)
+        self._method = method
+
+    # -------------------------------------------------- Private Class Methods --------------------------------------------------
+    def _get_lttb_indices(self, x_vals: np.ndarray, y_vals: np.ndarray) -> np.ndarray:
+        """
+        Returns the indices of the points selected by the Largest-Triangle-Three-Buckets algorithm, which always keeps the first and last point.
+
+        Args:
+            x_vals (np.ndarray): Sorted x-axis values of the curve's points
+            y_vals (np.ndarray): y-axis values of the curve's points
+        """
+        num_points = len(x_vals)
+        # Split the points between the first and last point into (max_points - 2) buckets.
+        bucket_edges = np.linspace(1, num_points - 1, self._max_points - 1).astype(int)
+        selected_indices = np.zeros(self._max_points, dtype = int)
+        selected_index = 0
+        for bucket in range(self._max_points - 2):
+            start, end = bucket_edges[bucket], bucket_edges[bucket + 1]
+            # Use the average point of the next bucket (or the last point) as the triangle's third vertex.
+            if bucket == self._max_points - 3:
+                next_x, next_y = x_vals[-1], y_vals[-1]
+            else:
+                next_end = bucket_edges[bucket + 2]
+                next_x, next_y = x_vals[end:next_end].mean(), y_vals[end:next_end].mean()
+            # Select the point in the bucket that forms the largest triangle with the previously selected point and the third vertex.
+            areas = np.abs(
+                (x_vals[selected_index] - next_x) * (y_vals[start:end] - y_vals[selected_index]) -
+                (x_vals[selected_index] - x_vals[start:end]) * (next_y - y_vals[selected_index])
+            )
+            selected_index = start + int(np.argmax(areas))
+            selected_indices[bucket + 1] = selected_index
+        selected_indices[-1] = num_points - 1
+        return selected_indices
+
+    def _get_minmax_indices(self, x_vals: np.ndarray, y_vals: np.ndarray) -> np.ndarray:
+        """
+        Returns the sorted indices of the lowest and highest point within each of (max_points / 2) evenly spaced bins along the x-axis.
+
+        Args:
+            x_vals (np.ndarray): Sorted x-axis values of the curve's points
+            y_vals (np.ndarray): y-axis values of the curve's points
+        """
+        num_bins = max(self._max_points // 2, 1)
+        bins = np.minimum(((x_vals - x_vals[0]) / ((x_vals[-1] - x_vals[0]) or 1) * num_bins).astype(int), num_bins - 1)
+        grouped_y_vals = pd.Series(y_vals).groupby(bins)
+        return np.unique(np.concatenate([grouped_y_vals.idxmin().to_numpy(), grouped_y_vals.idxmax().to_numpy()]))
+
+    # -------------------------------------------------- Public Class Properties & Methods --------------------------------------------------
+    def downsample(self, dataframe: pd.DataFrame, x_col: str, y_col: str, x_range: tuple[float] | None = None) -> pd.DataFrame:
+        """
+        Returns the rows of the given dataframe that are kept in the downsampled curve, with all of their columns (e.g. for hover information).
+
+        Args:
+            dataframe (pandas.DataFrame): Curve's points, sorted by their x-axis values
+            x_col (str): Name of the column with the curve's x-axis values
+            y_col (str): Name of the column with the curve's y-axis values
+            x_range (tuple[float] or None): Visible range of the x-axis, or None to downsample the whole curve
+                ^ the nearest point outside each end of the range is also kept, so that the curve still reaches the edges of the plot
+        """
+        dataframe = dataframe.dropna(subset = [x_col, y_col])
+        if x_range is not None:
+            x_start, x_end = x_range
+            sorted_x_vals = dataframe[x_col].to_numpy(dtype = float)
+            start_index = max(int(np.searchsorted(sorted_x_vals, x_start, side = "left")) - 1, 0)
+            end_index = min(int(np.searchsorted(sorted_x_vals, x_end, side = "right")) + 1, len(sorted_x_vals))
+            dataframe = dataframe.iloc[start_index:end_index]
+        if len(dataframe) <= self._max_points: return dataframe
+        x_vals, y_vals = dataframe[x_col].to_numpy(dtype = float), dataframe[y_col].to_numpy(dtype = float)
+        if self._method == "minmax": selected_indices = self._get_minmax_indices(x_vals, y_vals)
+        else: selected_indices = self._get_lttb_indices(x_vals, y_vals)
+        return dataframe.iloc[selected_indices]
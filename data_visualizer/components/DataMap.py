@@ -12,6 +12,8 @@ import geoviews as gv
 import geoviews.tile_sources as gts
 import holoviews as hv
 from holoviews.operation.datashader import dynspread, rasterize, inspect_points, datashade
+from datashader.utils import lnglat_to_meters
+import dask.dataframe as dd
 import dask_geopandas
 import spatialpandas as spd
 import geopandas as gpd
@@ -20,6 +22,13 @@ from shapely.geometry import LineString
 from bokeh.models import HoverTool
 from bokeh.palettes import Bokeh
 from io import BytesIO
+from .PlotCache import PlotCache
+from .SharedDatasetCache import SharedDatasetCache
+from .TransectIndex import TransectIndex
+from .GeoParquetReader import GeoParquetReader
+from .ViewportPointSource import ViewportPointSource
+from .ViewportRasterSource import ViewportRasterSource
+from .LatencyTracker import LatencyTracker
 
 ### DataMap is used for displaying the inputted data files onto a map. ###
 class DataMap(param.Parameterized):
@@ -34,22 +43,45 @@ class DataMap(param.Parameterized):
     update_accordion_section = param.Event(label = "Indicator for Updating the DataMap's Accordion Sections")
 
     # -------------------------------------------------- Constructor --------------------------------------------------
-    def __init__(self, time_series_data: list[str] = [], **params) -> None:
+    def __init__(self, time_series_data: list[str] = [], hover_data: dict = {}, plot_cache_max_bytes: int = 2 * 1024 ** 3, data_loading_mode: str = "eager", tiles_url: str = "/data", **params) -> None:
         """
         Creates a new instance of the DataMap class with its instance variables.
 
         Args:
             time_series_data (list[str]): List of column names for columns containing data for the time-series' y-axis
+            hover_data (dict): Dictionary mapping each collection (key) to a list of column names (value) that are read from Parquet files in addition to the time-series data
+                ^ only the geometry, time-series data, and these columns are read from the collection's Parquet files
+            plot_cache_max_bytes (int): Maximum number of bytes that created plots can use before the least recently used plots are evicted (evicted plots are recreated when needed again)
+            data_loading_mode (str): How data files are loaded for the map
+                ^ "eager" reads all of a file's data before plotting it
+                ^ "viewport" only reads the Parquet partitions that intersect the map's visible extent, reading more partitions as the user pans or zooms,
+                  and only reads the visible window of the GeoTIFF overview level that matches the map's zoom
+                ^ "out_of_core" keeps Parquet points as a lazy Dask DataFrame that datashader aggregates one partition at a time, so files larger than memory can be displayed
+                ^ "tiles" displays the tile pyramid baked by utils/preprocess_data.py for each data file (files without baked tiles are loaded eagerly)
+            tiles_url (str): URL where the root data directory is served in the "tiles" data loading mode (e.g. "/data" when running `panel serve app.ipynb --static-dirs data=./data`)
         """
         super().__init__(**params)
 
         # -------------------------------------------------- Constants --------------------------------------------------
         # _all_time_series_data = dictionary mapping each collection (key) to a list of column names (value) containing data for the collection's time-series
         self._all_time_series_data = time_series_data
+        # _all_hover_data = dictionary mapping each collection (key) to a list of column names (value) that are read from the collection's Parquet files besides the geometry and time-series data
+        self._all_hover_data = hover_data
         # _root_data_dir_path = path to the root directory that contains all available datasets/collections for the app
         self._root_data_dir_path = os.path.relpath("./data")
         # _default_crs = default coordinate reference system for the user-drawn transect and other plots
         self._default_crs = ccrs.PlateCarree()
+        # _eager_loading_mode, _viewport_loading_mode = options for how data files are loaded for the map
+        self._eager_loading_mode = "eager"
+        self._viewport_loading_mode = "viewport"
+        self._out_of_core_loading_mode = "out_of_core"
+        self._tiles_loading_mode = "tiles"
+        # _data_loading_mode = selected option for how data files are loaded for the map
+        self._data_loading_mode = data_loading_mode
+        # _latency_tracker = process-wide tracker that records how long each of the map's operations take
+        self._latency_tracker = LatencyTracker.get_instance()
+        # _session_id = ID of the Panel session that the latencies are recorded for, which is tagged on every recorded latency
+        self._session_id = LatencyTracker.get_session_id()
         # _app_main_color = theme color used for all the Panel widgets in this app
         self._app_main_color = "#2196f3"
         
@@ -94,6 +126,13 @@ class DataMap(param.Parameterized):
         # _transects_folder_name = Name of the folder containing files with transect data
         # ^ should be same as `transects_subdir_name` in utils/preprocess_data.py
         self._transects_folder_name = "Transects"
+        # _tiles_folder_name = Name of the folder containing a tile pyramid for each data file
+        # ^ should be same as `tiles_subdir_name` in utils/preprocess_data.py
+        self._tiles_folder_name = "Tiles"
+        # _time_series_store_folder_name = Name of the folder containing time-series data precomputed for every predefined transect by utils/precompute_time_series.py
+        self._time_series_store_folder_name = "time_series_store"
+        # _tiles_url = URL where the root data directory is served, which is used to request baked tiles in the "tiles" data loading mode
+        self._tiles_url = tiles_url.rstrip("/")
         # _transects_id_col_name = Name of the column containing the ID of each clicked transect
         # ^ should be same as `transect_geojson_id_property` in utils/preprocess_data.py because it was used to assign the ID property for each transect in the outputted GeoJSON
         self._transects_id_col_name = "Transect ID"
@@ -110,11 +149,18 @@ class DataMap(param.Parameterized):
         # -------------------------------------------------- Internal Class Properties --------------------------------------------------
         # _data_map_plot = overlay plot containing the selected basemap and all the data (categories, transects, etc.) plots
         self._data_map_plot = pn.pane.HoloViews(object = None, sizing_mode = "stretch_both")
-        # _created_plots = dictionary mapping each file's path (key) to its created plot (value)
-        self._created_plots = {}
+        # _created_plots = cache mapping each data/transect file's path (key) to its created point/image element or path plot (value), which evicts the least recently used plots when the byte budget is exceeded
+        self._created_plots = PlotCache(max_bytes = plot_cache_max_bytes)
         
-        # _selected_basemap_plot = WMTS (web mapping tile source) layer containing the user's selected basemap
-        self._selected_basemap_plot = list(self._all_basemaps.values())[0]
+        # _basemap_layer = map layer that swaps its tile source in place whenever the selected basemap changes, so that the rest of the map isn't recreated
+        self._basemap_layer = hv.DynamicMap(self._get_basemap_tiles)
+        # _layer_visibility_stream_type = stream type for showing or hiding a data/transect file's layer in place, without recreating the map
+        self._layer_visibility_stream_type = hv.streams.Stream.define("LayerVisibility", visible = True)
+        # _layer_visibility_streams = dictionary mapping each data/transect file's path (key) to the visibility stream (value) of the file's layer
+        self._layer_visibility_streams = {}
+        # _composed_plot_layers = tuple containing the data and transect layers (and whether the user-drawn transect is editable) that were last composed into the map
+        # ^ used to skip recomposing the map when no layer was added or removed
+        self._composed_plot_layers = None
         
         # _collection_dir_path = path to the selected collection's directory
         self._collection_dir_path = None
@@ -128,9 +174,9 @@ class DataMap(param.Parameterized):
         self._all_transect_files = []
         # _transect_colors = dictionary mapping each transect file (key) to a color (value), which will be used for the color of its path plots
         self._transect_colors = {}
-        # _selected_transects_plot = overlay of path plots if the user selected one or more transect files to display on the map
-        # ^ None if the user didn't provide any transect files or the user didn't select to display a transect file
-        self._selected_transects_plot = None
+        # _transect_file_layers = dictionary mapping the path (key) of each transect file that was selected at least once to its map layer (value)
+        # ^ layers are kept until the collection changes, so deselecting and reselecting a file only hides and shows its layer
+        self._transect_file_layers = {}
         # _tapped_data_streams = dictionary mapping each transect file's path (key) to a selection stream (value), which saves the file's most recently clicked data element (path) on the map
         self._tapped_data_streams = {}
 
@@ -148,9 +194,10 @@ class DataMap(param.Parameterized):
 
         # _data_file_options_dict = dictionary mapping the option name (key) of each data file in the selected collection to the data file's path (value)
         self._data_file_options_dict = {}
-        # _selected_data_plot = point or image plot for the most recently selected data file
-        # ^ None if the no data file was selected by the user
-        self._selected_data_plot = None
+        # _data_file_layers = dictionary mapping the path (key) of each data file that was selected at least once to its map layer (value)
+        # ^ layers are kept until the collection changes, so deselecting and reselecting a file only hides and shows its layer
+        # ^ each layer only holds a DynamicMap that fetches the file's element from _created_plots when redrawn, so the cache's byte budget still bounds the loaded data
+        self._data_file_layers = {}
 
         # -------------------------------------------------- Widget and Plot Options --------------------------------------------------
         # Set basemap widget's options.
@@ -242,30 +289,98 @@ class DataMap(param.Parameterized):
         )
 
     # -------------------------------------------------- Private Class Methods --------------------------------------------------    
-    def _plot_parquet_points(self, data_file_path: str, data_file_option: str) -> gv.Points:
+    def _get_parquet_point_cols(self, parquet_reader: GeoParquetReader) -> tuple[str, str, str, list[str]]:
         """
-        Creates a point plot from Parquet partition files containing Points.
+        Returns a tuple containing the names of the Parquet file's longitude column, latitude column, time-series data column, and requested hover columns.
 
         Args:
-            data_file_path (str): Path to the directory containing data to plot
-            data_file_option (str): Option name of the most recently selected data file from PopupModal's _data_files_checkbox_group widget
+            parquet_reader (GeoParquetReader): Reader containing the metadata of the Parquet file
         """
-        start_time = time.time()
         collection_time_series_data_cols = self._all_time_series_data[self.collection]
-        # Read the Parquet file as a geopandas GeoDataFrame.
-        geodataframe = dask_geopandas.read_parquet(data_file_path).compute()
-        latitude_col, longitude_col, time_series_data_col, non_lat_long_cols = None, None, None, []
-        for col in geodataframe.columns:
+        collection_hover_data_cols = self._all_hover_data.get(self.collection, [])
+        latitude_col, longitude_col, time_series_data_col, hover_cols = None, None, None, []
+        for col in parquet_reader.columns:
             col_name = col.lower()
             if "lat" in col_name: latitude_col = col
             elif "lon" in col_name: longitude_col = col
             elif col in collection_time_series_data_cols: time_series_data_col = col
-            elif col_name != "geometry": non_lat_long_cols.append(col)
-        geodataframe = geodataframe.drop(columns = [latitude_col, longitude_col])
-        mid_time = time.time()
-        print("Reading parquet data took {} seconds.".format(mid_time - start_time))
+            elif col in collection_hover_data_cols: hover_cols.append(col)
+        return longitude_col, latitude_col, time_series_data_col, hover_cols
+
+    def _read_parquet_points(self, parquet_reader: GeoParquetReader, cols: list[str], bbox: tuple[float] | None = None) -> spd.GeoDataFrame:
+        """
+        Reads the geometry and the given columns from Parquet partition files containing Points as a spatialpandas GeoDataFrame.
+
+        Args:
+            parquet_reader (GeoParquetReader): Reader for the Parquet file containing the points
+            cols (list[str]): Names of the columns to read besides the geometry column
+            bbox (tuple[float] or None): Bounding box (minx, miny, maxx, maxy) in the Parquet file's CRS that the read points must lie within, or None to read all points
+        """
+        # Read only the needed columns from the partitions that intersect the bounding box as a geopandas GeoDataFrame.
+        geodataframe = parquet_reader.read(columns = cols, bbox = bbox)
         # Convert the geopandas GeoDataFrame into a spatialpandas GeoDataFrame for the geometry values to be compatible with GeoViews.
-        spatial_pandas_geodataframe = spd.GeoDataFrame(geodataframe)
+        return spd.GeoDataFrame(geodataframe)
+
+    def _plot_parquet_points(self, data_file_path: str, data_file_option: str, visibility_stream: hv.streams.Stream, bbox: tuple[float] | None = None) -> gv.Points:
+        """
+        Creates a point plot from Parquet partition files containing Points.
+
+        Args:
+            data_file_path (str): Path to the directory containing data to plot
+            data_file_option (str): Option name of the most recently selected data file from PopupModal's _data_files_checkbox_group widget
+            visibility_stream (hv.streams.Stream): Stream indicating whether the point plot's layer is shown on the map
+            bbox (tuple[float] or None): Bounding box (minx, miny, maxx, maxy) in the Parquet file's CRS that plotted points must lie within, or None to plot all points
+        """
+        start_time = time.perf_counter()
+        # Only read the geometry, time-series data, and hover columns instead of every column in the file.
+        parquet_reader = GeoParquetReader(data_file_path)
+        longitude_col, latitude_col, time_series_data_col, non_lat_long_cols = self._get_parquet_point_cols(parquet_reader)
+        read_cols = [col for col in [time_series_data_col] + non_lat_long_cols if col is not None]
+        kdims, vdims = [longitude_col, latitude_col], [time_series_data_col] + non_lat_long_cols
+        if self._data_loading_mode == self._viewport_loading_mode:
+            # Only load the partitions that intersect the map's visible extent whenever the extent changes.
+            viewport_point_source = ViewportPointSource(parquet_reader = parquet_reader, cols = read_cols, kdims = kdims, vdims = vdims)
+            points = hv.DynamicMap(viewport_point_source.load, streams = [hv.streams.RangeXY(), visibility_stream])
+            self._latency_tracker.record("read_parquet_points", time.perf_counter() - start_time, file_path = data_file_path, collection = self.collection, mode = self._data_loading_mode, session = self._session_id)
+        else:
+            out_of_core = (self._data_loading_mode == self._out_of_core_loading_mode) and (longitude_col is not None) and (latitude_col is not None)
+            def create_points() -> gv.Points:
+                read_start_time = time.perf_counter()
+                if out_of_core:
+                    # Lazily read the longitude, latitude, and data columns without decoding geometries, and lazily project the coordinates into Web Mercator (the map's projection).
+                    # ^ datashader aggregates each partition separately when rasterizing, so the points never have to fit into memory all at once
+                    dask_dataframe = dd.read_parquet(data_file_path, columns = [longitude_col, latitude_col] + read_cols)
+                    easting_vals, northing_vals = lnglat_to_meters(dask_dataframe[longitude_col], dask_dataframe[latitude_col])
+                    dask_dataframe = dask_dataframe.assign(**{longitude_col: easting_vals, latitude_col: northing_vals})
+                    file_points = gv.Points(
+                        data = dask_dataframe,
+                        kdims = kdims,
+                        vdims = vdims,
+                        crs = ccrs.GOOGLE_MERCATOR
+                    )
+                else:
+                    # Get the file's points from the dataset cache that is shared by all sessions, which only reads the file if no session has read it yet.
+                    spatial_pandas_geodataframe = SharedDatasetCache.get_instance().get(
+                        file_path = data_file_path,
+                        loader = lambda: self._read_parquet_points(parquet_reader, read_cols, bbox),
+                        variant = "points:{}:{}".format(",".join(read_cols), bbox)
+                    )
+                    file_points = gv.Points(
+                        data = spatial_pandas_geodataframe,
+                        kdims = kdims,
+                        vdims = vdims,
+                        # label = data_file_option
+                    )
+                self._latency_tracker.record("read_parquet_points", time.perf_counter() - read_start_time, file_path = data_file_path, collection = self.collection, mode = self._data_loading_mode, session = self._session_id)
+                return file_points
+            # Rasterize empty points while the layer is hidden, so that panning or zooming doesn't aggregate the file's points.
+            hidden_points = gv.Points([], kdims = kdims, vdims = vdims, crs = ccrs.GOOGLE_MERCATOR) if out_of_core else gv.Points([], kdims = kdims, vdims = vdims)
+            # Fetch the file's points from the cache of created plots whenever the layer is redrawn, so that evicted points are recreated instead of being kept alive by the layer.
+            points = hv.DynamicMap(
+                lambda visible: self._get_data_element(data_file_path, create_points) if visible else hidden_points,
+                streams = [visibility_stream]
+            )
+        mid_time = time.perf_counter()
         # Create a point plot with the spatialpandas GeoDataFrame.
         custom_hover_tool = HoverTool(tooltips = [
             ("Longitude", "$x"),
@@ -273,21 +388,13 @@ class DataMap(param.Parameterized):
             (time_series_data_col, "@image")
         ])
         point_plot = dynspread(
-            rasterize(
-                gv.Points(
-                    data = spatial_pandas_geodataframe,
-                    kdims = [longitude_col, latitude_col],
-                    vdims = [time_series_data_col] + non_lat_long_cols,
-                    # label = data_file_option
-                ),
-            ).opts(
+            rasterize(points).opts(
                 cmap = "Turbo", tools = [custom_hover_tool],
                 cnorm = "eq_hist", responsive = True
             ),
             max_px = 5
         )
-        end_time = time.time()
-        print("Creating point plot took {} seconds.".format(end_time - mid_time))
+        self._latency_tracker.record("create_point_plot", time.perf_counter() - mid_time, file_path = data_file_path, collection = self.collection, mode = self._data_loading_mode, session = self._session_id)
         # Return the point plot.
         return point_plot
     
@@ -377,34 +484,67 @@ class DataMap(param.Parameterized):
             tools = ["hover", "tap"], responsive = True
         )
 
-    def _create_data_plot(self, data_file_path: str) -> None:
+    def _create_data_plot(self, data_file_path: str, visibility_stream: hv.streams.Stream) -> any:
         """
-        Creates and returns a point/image plot containing the given file's data.
+        Creates and returns a point/image layer containing the given file's data, which is hidden in place whenever the visibility stream's value is False.
 
         Args:
             data_file_path (str): Path to the file containing data to plot
+            visibility_stream (hv.streams.Stream): Stream indicating whether the file's layer is shown on the map
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         # Read the file and create a plot from it.
         subdir_path, filename = os.path.split(data_file_path)
         subdir_name = os.path.basename(subdir_path)
         _, extension = os.path.splitext(filename)
         extension = extension.lower()
         plot = None
-        if extension in [".parq", ".parquet"]:
+        tiles_dir_path = os.path.join(self._collection_dir_path, self._tiles_folder_name, filename)
+        if (self._data_loading_mode == self._tiles_loading_mode) and os.path.isdir(tiles_dir_path):
+            # Display the file's baked tiles, which were already rendered by utils/preprocess_data.py, instead of rasterizing the file's data.
+            tiles = gv.WMTS(
+                "{}/{}/{}/{}/{{Z}}/{{X}}/{{Y}}.png".format(self._tiles_url, self.collection, self._tiles_folder_name, filename)
+            ).opts(alpha = 0.5)
+            plot = hv.DynamicMap(lambda visible: tiles, streams = [visibility_stream])
+        elif extension in [".parq", ".parquet"]:
             # Create a point plot with the Parquet partition files.
             plot = self._plot_parquet_points(
                 data_file_path = data_file_path,
-                data_file_option = self._selected_collection_info.get(data_file_path, "{}: {}".format(subdir_name, filename))
+                data_file_option = self._selected_collection_info.get(data_file_path, "{}: {}".format(subdir_name, filename)),
+                visibility_stream = visibility_stream
+            )
+        elif (extension in [".tif", ".tiff"]) and (self._data_loading_mode == self._viewport_loading_mode):
+            # Create an image plot that only reads a screen's worth of pixels from the GeoTIFF whenever the map's extent or size changes.
+            viewport_raster_source = ViewportRasterSource(geotiff_path = data_file_path, vdim = "Elevation (meters)")
+            plot = rasterize(
+                hv.DynamicMap(viewport_raster_source.load, streams = [hv.streams.RangeXY(), hv.streams.PlotSize(), visibility_stream])
+            ).opts(
+                cmap = "Turbo",
+                tools = ["hover"],
+                alpha = 0.5,
+                responsive = True
             )
         elif extension in [".tif", ".tiff"]:
-            # Create an image plot with the GeoTIFF.
+            def create_image() -> gv.Image:
+                # Get the GeoTIFF's image from the dataset cache that is shared by all sessions, so that the file is only read once.
+                return SharedDatasetCache.get_instance().get(
+                    file_path = data_file_path,
+                    loader = lambda: gv.load_tiff(
+                        data_file_path,
+                        vdims = "Elevation (meters)",
+                        nan_nodata = True,
+                        # label = self._selected_collection_info.get(data_file_path, "{}: {}".format(subdir_name, filename))
+                    ),
+                    variant = "image"
+                )
+            # Rasterize an empty image while the layer is hidden, so that panning or zooming doesn't regrid the file's pixels.
+            image = self._get_data_element(data_file_path, create_image)
+            hidden_image = gv.Image([], kdims = image.kdims, vdims = image.vdims, crs = image.crs)
+            # Fetch the image from the cache of created plots whenever the layer is redrawn, so that an evicted image is recreated instead of being kept alive by the layer.
             plot = rasterize(
-                gv.load_tiff(
-                    data_file_path,
-                    vdims = "Elevation (meters)",
-                    nan_nodata = True,
-                    # label = self._selected_collection_info.get(data_file_path, "{}: {}".format(subdir_name, filename))
+                hv.DynamicMap(
+                    lambda visible: self._get_data_element(data_file_path, create_image) if visible else hidden_image,
+                    streams = [visibility_stream]
                 )
             ).opts(
                 cmap = "Turbo",
@@ -415,14 +555,14 @@ class DataMap(param.Parameterized):
         if plot is None:
             print("Error displaying", filename, "as a point/image plot:", "Input files with the", extension, "file format are not supported yet.")
         else:
-            # Save the created plot.
-            self._created_plots[data_file_path] = plot
-        end_time = time.time()
-        print("Creating data plot for {} took {} seconds.".format(data_file_path, end_time - start_time))
+            plot = plot.opts(hooks = [self._get_layer_visibility_hook(visibility_stream)])
+        self._latency_tracker.record("create_data_plot", time.perf_counter() - start_time, file_path = data_file_path, collection = self.collection, mode = self._data_loading_mode, session = self._session_id)
+        return plot
     
-    def _create_path_plot(self, filename: str) -> None:
+    def _create_path_plot(self, filename: str) -> gv.Path | gv.Contours | None:
         """
-        Creates a path/contour plot containing the given file's transects.
+        Creates and returns a path/contour plot containing the given file's transects.
+        Returns None if the file isn't supported or contains an invalid transect.
 
         Args:
             filename (str): Name of the file containing transects
@@ -441,6 +581,54 @@ class DataMap(param.Parameterized):
             print("Error displaying", filename, "as a transect plot:", "Input files with the", extension, "file format are not supported yet.")
         # Save the transect plot, if created.
         if plot is not None: self._created_plots[file_path] = plot
+        return plot
+
+    def _get_path_plot(self, file_path: str) -> gv.Path | gv.Contours | None:
+        """
+        Returns the given transect file's path/contour plot, which is recreated if it was evicted from the cache of created plots.
+
+        Args:
+            file_path (str): Path to the file containing transects
+        """
+        plot = self._created_plots.get(file_path)
+        if plot is None: plot = self._create_path_plot(os.path.basename(file_path))
+        return plot
+
+    def _get_data_element(self, data_file_path: str, create_element: callable) -> any:
+        """
+        Returns the given data file's point/image element, which is recreated if it was evicted from the cache of created plots.
+
+        Args:
+            data_file_path (str): Path to the file containing data to plot
+            create_element (callable): Function that creates the file's point/image element
+        """
+        element = self._created_plots.get(data_file_path)
+        if element is None:
+            element = create_element()
+            self._created_plots[data_file_path] = element
+        return element
+
+    def _get_layer_visibility_hook(self, visibility_stream: hv.streams.Stream) -> callable:
+        """
+        Returns a plot hook that shows or hides a layer's glyphs in place, depending on the value of the layer's visibility stream.
+
+        Args:
+            visibility_stream (hv.streams.Stream): Stream indicating whether the layer is shown on the map
+        """
+        def set_layer_visibility(plot: any, element: any) -> None:
+            plot.handles["glyph_renderer"].visible = visibility_stream.visible
+        return set_layer_visibility
+
+    def _set_layer_visibility(self, file_path: str, visible: bool) -> None:
+        """
+        Shows or hides the given file's layer without recreating the map, which only updates the layer if its visibility changed.
+
+        Args:
+            file_path (str): Path to the data/transect file whose layer is shown or hidden
+            visible (bool): Whether the file's layer should be shown on the map
+        """
+        visibility_stream = self._layer_visibility_streams[file_path]
+        if visibility_stream.visible != visible: visibility_stream.event(visible = visible)
 
     def _get_clicked_transect_info(self, **params: dict) -> None:
         """
@@ -452,8 +640,8 @@ class DataMap(param.Parameterized):
         # print("Selection1D stream's parameter:", params)
         with pn.param.set_values(self._data_map_plot, loading = True):
             # Set names for the longitude and latitude data columns in the popup modal's data table.
-            long_col_name = "Easting (meters)"
-            lat_col_name = "Northing (meters)"
+            long_col_name = TransectIndex.longitude_col_name
+            lat_col_name = TransectIndex.latitude_col_name
             # Save information about the recently clicked transect(s) in a dictionary.
             clicked_transects_info_dict = {}
             # Find the user's clicked/selected transect(s).
@@ -462,16 +650,17 @@ class DataMap(param.Parameterized):
                 if (filename in self._all_transect_files) and params[file_path]:
                     clicked_transect_indices = params[file_path]
                     num_clicked_transects = len(clicked_transect_indices)
-                    # Transform the transect's coordinates into a CRS with meters as a unit.
-                    if filename.endswith(".geojson"): transect_file_geodataframe = gpd.read_file(filename = file_path)
-                    elif filename.endswith(".parq"): transect_file_geodataframe = dask_geopandas.read_parquet(file_path).compute()
-                    transect_crs, transect_geodataframe_crs = self._collection_crs, transect_file_geodataframe.crs
-                    if transect_geodataframe_crs is not None:
-                        geojson_epsg_code = ccrs.CRS(transect_geodataframe_crs).to_epsg()
-                        if geojson_epsg_code == 4326: transect_file_geodataframe = transect_file_geodataframe.to_crs(crs = self._collection_crs)
-                        else: transect_crs = ccrs.epsg(geojson_epsg_code)
-                    else:
-                        transect_file_geodataframe = transect_file_geodataframe.set_crs(crs = self._collection_crs)
+                    # Get the file's transect index (built once for all sessions), which already contains the transects' coordinates in a CRS with meters as a unit.
+                    transect_index = SharedDatasetCache.get_instance().get(
+                        file_path = file_path,
+                        loader = lambda: TransectIndex(
+                            file_path = file_path,
+                            collection_crs = self._collection_crs,
+                            transect_id_col_name = self._transects_id_col_name
+                        ),
+                        variant = "transect_index:{}".format(self._collection_crs.to_epsg())
+                    )
+                    transect_crs = transect_index.crs
                     # Reset transect file's Selection1D stream parameter to its default value (empty list []).
                     self._tapped_data_streams[file_path].reset()
                     # Add information about the clicked transect(s).
@@ -486,22 +675,14 @@ class DataMap(param.Parameterized):
                     clicked_transects_info_dict[long_col_name] = []
                     clicked_transects_info_dict[lat_col_name] = []
                     clicked_transects_info_dict[self._transects_id_col_name] = []
-                    # Get all the transects/paths from the clicked transect's file.
-                    transects_file_plot = self._created_plots[file_path]
-                    transect_file_paths = transects_file_plot.split()
                     # Get data for each of the user's clicked transect(s).
-                    for transect_index in clicked_transect_indices:
-                        path_plot = transect_file_paths[transect_index]
-                        path_info = path_plot.columns(dimensions = [self._transects_id_col_name])
-                        transect_id_col_vals = path_info[self._transects_id_col_name].tolist()
-                        clicked_transects_info_dict[self._transects_id_col_name].extend(transect_id_col_vals)
-                        transect_id = list(set(transect_id_col_vals))[0]
+                    for plot_index in clicked_transect_indices:
+                        transect_id = transect_index.get_id(plot_index)
                         # Make sure to get each transect's easting and northing (meters) coordinates because the time-series calculations only work with non-negative values.
-                        transect_geodataframe = transect_file_geodataframe[transect_file_geodataframe[self._transects_id_col_name] == transect_id]
-                        transect_geojson = json.loads(transect_geodataframe.to_json())
-                        transect_points = transect_geojson["features"][0]["geometry"]["coordinates"]
-                        clicked_transects_info_dict[long_col_name].extend([point[0] for point in transect_points])
-                        clicked_transects_info_dict[lat_col_name].extend([point[1] for point in transect_points])
+                        transect_points = transect_index.get_coordinates(transect_id)
+                        clicked_transects_info_dict[self._transects_id_col_name].extend([transect_id] * len(transect_points))
+                        clicked_transects_info_dict[long_col_name].extend(transect_points[:, 0].tolist())
+                        clicked_transects_info_dict[lat_col_name].extend(transect_points[:, 1].tolist())
                     # Stop iterating through all the transect files once a clicked transect is found.
                     break
             # Update the clicked_transects_info parameter in order to update the time-series plot, transect data table, or error message in the popup modal.
@@ -592,20 +773,12 @@ class DataMap(param.Parameterized):
             self._view_user_transect_time_series_button.disabled = True
             if (not len(data["xs"])) and (not len(data["ys"])): self._user_transect_plot.data = []
 
-    @param.depends("basemap", watch = True)
-    def _update_basemap_plot(self) -> None:
+    @param.depends("basemap")
+    def _get_basemap_tiles(self) -> gv.WMTS:
         """
-        Creates basemap WMTS (web mapping tile source) plot whenever the selected basemap name changes.
+        Returns the WMTS (web mapping tile source) layer of the selected basemap, which is the callback for the map's basemap layer.
         """
-        # Get the name of the newly selected basemap.
-        if self.basemap is None:
-            selected_basemap_name = list(self._all_basemaps.keys())[0]
-        else:
-            selected_basemap_name = self.basemap
-        # Create the plot containing the basemap.
-        new_basemap_plot = self._all_basemaps[selected_basemap_name]
-        # Save basemap plot.
-        self._selected_basemap_plot = new_basemap_plot
+        return self._all_basemaps[self.basemap if self.basemap is not None else list(self._all_basemaps.keys())[0]]
 
     @param.depends("collection", watch = True)
     def _update_collection_objects(self) -> None:
@@ -623,10 +796,11 @@ class DataMap(param.Parameterized):
             self._collection_crs = ccrs.epsg(collection_epsg_code)
             # Get all data files' widget option names (i.e. data file names) from collection directory.
             self._data_file_options_dict = {}
-            collection_subdirs = [file for file in os.listdir(self._collection_dir_path) if os.path.isdir(os.path.join(self._collection_dir_path, file)) and (file != self._transects_folder_name)]
+            collection_subdirs = [file for file in os.listdir(self._collection_dir_path) if os.path.isdir(os.path.join(self._collection_dir_path, file)) and (file not in [self._transects_folder_name, self._tiles_folder_name, self._time_series_store_folder_name])]
             for subdir in collection_subdirs:
                 subdir_path = os.path.join(self._collection_dir_path, subdir)
-                for file in [file for file in os.listdir(subdir_path) if os.path.isfile(os.path.join(subdir_path, file)) or file.endswith(".parq") or file.endswith(".parquet")]:
+                # Ignore outputs of conversions that utils/preprocess_data.py didn't finish.
+                for file in [file for file in os.listdir(subdir_path) if (os.path.isfile(os.path.join(subdir_path, file)) or file.endswith(".parq") or file.endswith(".parquet")) and not file.endswith(".tmp")]:
                     data_file_path = os.path.join(subdir_path, file)
                     self._data_file_options_dict[file] = data_file_path
             # Get the transect widget's new options.
@@ -646,9 +820,10 @@ class DataMap(param.Parameterized):
                     self._tapped_data_streams[transect_file_path] = hv.streams.Selection1D(source = None, rename = {"index": transect_file_path})
                     # Specify a callable subscriber function that gets called whenever any transect from the file is clicked/tapped.
                     self._tapped_data_streams[transect_file_path].add_subscriber(self._get_clicked_transect_info)
-            # Reset the map's plots.
-            self._selected_data_plot = None
-            self._selected_transects_plot = None
+            # Reset the map's layers.
+            self._data_file_layers = {}
+            self._transect_file_layers = {}
+            self._layer_visibility_streams = {}
         else:
             self._selected_collection_info = {}
             print("Error with collection {}: Please preprocess the chosen collection with `preprocess_data.py`.".format(self.collection))
@@ -656,12 +831,10 @@ class DataMap(param.Parameterized):
     @param.depends("transects", watch = True)
     def _update_selected_transects_plot(self) -> None:
         """
-        Creates an overlay of path plots whenever the selected transect files change.
+        Shows the layers of the selected transect files (creating layers for newly selected files) and hides the rest whenever the selected transect files change.
         """
-        # Only when the widget is initialized and at least one transect file is selected...
+        # Only when the widget is initialized...
         if self.transects is not None:
-            # Create an overlay of path plots with transects from each selected transect file.
-            new_transects_plot = None
             # If the user wants to create their own transect, display widgets related to the user-drawn transect.
             if self._create_own_transect_option in self.transects:
                 self._view_user_transect_time_series_button.visible = True
@@ -675,57 +848,47 @@ class DataMap(param.Parameterized):
             self.update_accordion_section = True
             for file in self.transects:
                 file_path = os.path.join(self._collection_dir_path, self._transects_folder_name, file)
-                # Allow user to draw start and end points when they selected to draw their own transect.
-                if file == self._create_own_transect_option:
-                    # Display an editable path plot for the user to modify their transect's start and end points.
-                    if new_transects_plot is None:
-                        new_transects_plot = self._user_transect_plot
-                    else:
-                        new_transects_plot = (new_transects_plot * self._user_transect_plot)
-                else:
-                    # Create the selected transect file's path plot if we never read the file before.
-                    if file_path not in self._created_plots:
-                        self._create_path_plot(file)
-                        # Save the new plot as a source for the transect file's Selection1D stream.
-                        if file_path in self._created_plots: self._tapped_data_streams[file_path].source = self._created_plots[file_path]
-                    # Display the transect file's path plot if it was created.
-                    # ^ plots aren't created for unsupported files
-                    if file_path in self._created_plots:
-                        if new_transects_plot is None:
-                            new_transects_plot = self._created_plots[file_path]
-                        else:
-                            new_transects_plot = (new_transects_plot * self._created_plots[file_path])
-            # Save overlaid transect plots.
-            self._selected_transects_plot = new_transects_plot
+                # Create a layer for the selected transect file the first time it's selected.
+                # ^ the user-drawn transect's editable path plot is added to the map by plot()
+                if (file != self._create_own_transect_option) and (file_path not in self._transect_file_layers):
+                    # Only add a layer if the file's path plot was created.
+                    # ^ plots aren't created for unsupported files or files containing invalid transects
+                    if self._get_path_plot(file_path) is not None:
+                        visibility_stream = self._layer_visibility_stream_type(visible = True)
+                        layer = hv.DynamicMap(lambda visible, file_path = file_path: self._get_path_plot(file_path), streams = [visibility_stream]).opts(
+                            hooks = [self._get_layer_visibility_hook(visibility_stream)]
+                        )
+                        # Save the new layer as a source for the transect file's Selection1D stream.
+                        self._tapped_data_streams[file_path].source = layer
+                        self._layer_visibility_streams[file_path] = visibility_stream
+                        self._transect_file_layers[file_path] = layer
+            # Show the layers of selected transect files and hide the rest in place.
+            for file_path in self._transect_file_layers:
+                self._set_layer_visibility(file_path, os.path.basename(file_path) in self.transects)
     
     @param.depends("data_file_paths", watch = True)
     def _update_selected_data_plots(self) -> None:
         """
-        Creates an overlay of point or image plots whenever the list of paths for time-series data changes.
+        Shows the layers of the selected data files (creating layers for newly selected files) and hides the rest whenever the list of paths for time-series data changes.
         """
         with pn.param.set_values(self._data_map_plot, loading = True):
             print("_update_selected_data_plots", self.data_file_paths)
             # Only when the list of time-series data files is initiated...
             if self.data_file_paths is not None:
-                # Overlay all data files' plots.
-                start_time = time.time()
-                new_data_plot = None
-                for file_path in self.data_file_paths:
-                    # Create the selected data file's plot if we never read the file before.
-                    if file_path not in self._created_plots: self._create_data_plot(file_path)
-                    # Display the data file's plot if it was created.
-                    # ^ plots aren't created for unsupported files
-                    if file_path in self._created_plots:
-                        if new_data_plot is None:
-                            new_data_plot = self._created_plots[file_path]
-                        else:
-                            new_data_plot = (new_data_plot * self._created_plots[file_path])            
-                end_time = time.time()
-                print("Overlaying all data plots took {} seconds.".format(end_time - start_time))
-                # Save the new data plot.
-                self._selected_data_plot = new_data_plot
-            else:
-                self._selected_data_plot = None
+                with self._latency_tracker.span("update_data_layers", collection = self.collection, session = self._session_id):
+                    for file_path in self.data_file_paths:
+                        # Create a layer for the selected data file the first time it's selected.
+                        if file_path not in self._data_file_layers:
+                            visibility_stream = self._layer_visibility_stream_type(visible = True)
+                            layer = self._create_data_plot(file_path, visibility_stream)
+                            # Only add a layer if the file's plot was created.
+                            # ^ plots aren't created for unsupported files
+                            if layer is not None:
+                                self._layer_visibility_streams[file_path] = visibility_stream
+                                self._data_file_layers[file_path] = layer
+                    # Show the layers of selected data files and hide the rest in place.
+                    for file_path in self._data_file_layers:
+                        self._set_layer_visibility(file_path, file_path in self.data_file_paths)
 
     def _update_map_data_ranges(self, plot: any, element: any) -> None:
         """
@@ -751,39 +914,46 @@ class DataMap(param.Parameterized):
             plot.handles["y_range"].end = plot.handles["y_range"].reset_end = 20037508.342789248
 
     # -------------------------------------------------- Public Class Properties & Methods --------------------------------------------------
-    @param.depends("_update_basemap_plot", "_update_collection_objects", "_update_selected_transects_plot", "_update_selected_data_plots", "_get_clicked_transect_info")
+    @param.depends("_update_collection_objects", "_update_selected_transects_plot", "_update_selected_data_plots")
     def plot(self) -> gv.Overlay:
         """
-        Returns the selected basemap and data plots as an overlay whenever any of the plots are updated.
+        Returns the selected basemap and data plots as an overlay whenever a data or transect layer is added.
+        The basemap layer updates its tile source in place and existing layers are shown or hidden in place,
+        so changing the basemap, toggling previously selected files, or clicking a transect doesn't recreate the map.
         """
-        start_time = time.time()
-        # Overlay the selected plots.
-        current_active_tools = ["pan", "wheel_zoom"]
-        new_plot = self._selected_basemap_plot
-        if self._selected_data_plot is not None:
-            new_plot = (new_plot * self._selected_data_plot)
-        if self._selected_transects_plot is not None:
-            new_plot = (new_plot * self._selected_transects_plot)
-            if self._create_own_transect_option in self.transects:
-                current_active_tools.append("poly_draw")
-        mid_time = time.time()
-        print("Plotting all selected plots on the map took {} seconds.".format(mid_time - start_time))
-        # Save the overlaid plots.
-        self._data_map_plot.object = new_plot.opts(
-            xaxis = None, yaxis = None,
-            tools = ["zoom_in", "zoom_out", "tap"],
-            active_tools = current_active_tools,
-            toolbar = "below",#None,"above"
-            title = "", show_legend = True,
-            hooks = [self._update_map_data_ranges]
-        )
-        end_time = time.time()
-        print("Rendering new data map on browser took {} seconds.".format(end_time - mid_time))
+        start_time = time.perf_counter()
         # Display browser popup for any errors that occurred while updating the data map.
         if self._error_messages:
             self._error_popup_text.value = "\n".join(self._error_messages)
             # Reset the error messages to an empty list in order to indicate that there are no errors by default.
             self._error_messages = []
+        # Keep the current map if no data or transect layer was added or removed.
+        is_drawing_user_transect = (self.transects is not None) and (self._create_own_transect_option in self.transects)
+        file_layers = tuple(self._data_file_layers.values()) + tuple(self._transect_file_layers.values())
+        plot_layers = file_layers + (is_drawing_user_transect,)
+        if (self._composed_plot_layers is not None) and (len(plot_layers) == len(self._composed_plot_layers)) and all(layer is composed_layer for layer, composed_layer in zip(plot_layers, self._composed_plot_layers)):
+            return self._data_map_plot
+        self._composed_plot_layers = plot_layers
+        # Overlay the data and transect layers.
+        current_active_tools = ["pan", "wheel_zoom"]
+        new_plot = self._basemap_layer
+        for layer in file_layers:
+            new_plot = (new_plot * layer)
+        # Display an editable path plot for the user to modify their transect's start and end points.
+        if is_drawing_user_transect:
+            new_plot = (new_plot * self._user_transect_plot)
+            current_active_tools.append("poly_draw")
+        self._latency_tracker.record("compose_data_map", time.perf_counter() - start_time, collection = self.collection, session = self._session_id)
+        # Save the overlaid plots.
+        with self._latency_tracker.span("render_data_map", collection = self.collection, session = self._session_id):
+            self._data_map_plot.object = new_plot.opts(
+                xaxis = None, yaxis = None,
+                tools = ["zoom_in", "zoom_out", "tap"],
+                active_tools = current_active_tools,
+                toolbar = "below",#None,"above"
+                title = "", show_legend = True,
+                hooks = [self._update_map_data_ranges]
+            )
         return self._data_map_plot
     
     def get_accordion_sections(self) -> list:
@@ -816,13 +986,6 @@ class DataMap(param.Parameterized):
         """
         return self._app_main_color
 
-    @property
-    def selected_basemap(self) -> any:
-        """
-        Returns the user's selected basemap.
-        """
-        return self._selected_basemap_plot
-    
     @property
     def selected_collection_dir_path(self) -> str:
         """
@@ -888,6 +1051,13 @@ class DataMap(param.Parameterized):
             self._clicked_transects_id_key
         ]
     
+    @property
+    def plot_cache_stats(self) -> dict:
+        """
+        Returns the hit, miss, and eviction counters and the current size of the cache containing created plots.
+        """
+        return self._created_plots.stats
+
     @property
     def all_data_cols(self) -> list[str]:
         """
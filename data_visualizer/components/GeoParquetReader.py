@@ -0,0 +1,129 @@
+# Standard library imports
+import os
+import re
+import json
+
+# External dependencies imports
+import geopandas as gpd
+import pandas as pd
+import pyarrow.parquet as pq
+import pyproj
+
+### GeoParquetReader is used for reading only the needed columns and partitions of a Parquet directory containing geometries. ###
+class GeoParquetReader:
+    # -------------------------------------------------- Constructor --------------------------------------------------
+    def __init__(self, parquet_path: str) -> None:
+        """
+        Creates a new instance of the GeoParquetReader class by reading the metadata (not the data) of each partition file.
+
+        Args:
+            parquet_path (str): Path to the Parquet directory of partition files (or to a single Parquet file)
+        """
+        # -------------------------------------------------- Internal Class Properties --------------------------------------------------
+        # _parquet_path = path to the Parquet directory or file
+        self._parquet_path = parquet_path
+        # _partition_paths = list of paths to each partition file, in the same order that dask_geopandas reads the partitions
+        if os.path.isdir(parquet_path):
+            partition_files = [file for file in os.listdir(parquet_path) if file.endswith(".parquet") and not file.startswith("_")]
+            partition_files.sort(key = lambda file: [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", file)])
+            self._partition_paths = [os.path.join(parquet_path, file) for file in partition_files]
+        else:
+            self._partition_paths = [parquet_path]
+        # _partition_bounds = list of bounding boxes (minx, miny, maxx, maxy) for each partition file's geometries
+        # ^ None for partitions that weren't saved with a bounding box in their GeoParquet metadata, which are never skipped
+        self._partition_bounds = []
+        # _partition_bbox_cols = list of names of each partition file's bbox covering column, which stores each geometry's bounding box so that row groups outside a bounding box can be skipped
+        # ^ None for partitions that weren't saved with a bbox covering column, whose row groups are all read
+        self._partition_bbox_cols = []
+        schema = None
+        for partition_path in self._partition_paths:
+            schema = pq.read_schema(partition_path)
+            geo_metadata = json.loads(schema.metadata[b"geo"])
+            geometry_col = geo_metadata["primary_column"]
+            self._partition_bounds.append(geo_metadata["columns"][geometry_col].get("bbox", None))
+            bbox_covering = geo_metadata["columns"][geometry_col].get("covering", {}).get("bbox", None)
+            self._partition_bbox_cols.append(bbox_covering["xmin"][0] if bbox_covering is not None else None)
+        # _geometry_col = name of the column containing the geometries
+        self._geometry_col = geometry_col
+        # _columns = list of names of all columns in the Parquet file, including the geometry column (but not the bbox covering column)
+        self._columns = [name for name in schema.names if not name.startswith("__index_level_") and (name not in self._partition_bbox_cols)]
+        # _crs = coordinate reference system of the geometries (GeoParquet files without a CRS use longitude/latitude coordinates)
+        geometry_crs = geo_metadata["columns"][geometry_col].get("crs", None)
+        self._crs = pyproj.CRS.from_json_dict(geometry_crs) if geometry_crs is not None else pyproj.CRS.from_epsg(4326)
+
+    # -------------------------------------------------- Private Class Methods --------------------------------------------------
+    def _intersects(self, partition_bounds: list[float] | None, bbox: tuple[float] | None) -> bool:
+        """
+        Checks if a partition might contain geometries within the given bounding box.
+
+        Args:
+            partition_bounds (list[float] or None): Bounding box (minx, miny, maxx, maxy) of the partition's geometries
+            bbox (tuple[float] or None): Bounding box (minx, miny, maxx, maxy) that geometries should lie within
+        """
+        if (partition_bounds is None) or (bbox is None): return True
+        return (partition_bounds[0] <= bbox[2]) and (bbox[0] <= partition_bounds[2]) and (partition_bounds[1] <= bbox[3]) and (bbox[1] <= partition_bounds[3])
+
+    # -------------------------------------------------- Public Class Properties & Methods --------------------------------------------------
+    def get_partition_paths(self, bbox: tuple[float] | None = None) -> list[str]:
+        """
+        Returns the paths to the partition files that might contain geometries within the given bounding box.
+
+        Args:
+            bbox (tuple[float] or None): Bounding box (minx, miny, maxx, maxy) in the Parquet file's CRS, or None to get all partitions
+        """
+        return [path for path, bounds in zip(self._partition_paths, self._partition_bounds) if self._intersects(bounds, bbox)]
+
+    def read(self, columns: list[str] | None = None, bbox: tuple[float] | None = None) -> gpd.GeoDataFrame:
+        """
+        Reads the geometry column and the given columns from only the partitions (and, for partitions with a bbox covering column, only the row groups) that intersect the given bounding box.
+        Geometries outside of the bounding box are removed from the returned GeoDataFrame.
+
+        Args:
+            columns (list[str] or None): Names of the non-geometry columns to read, or None to read all columns
+            bbox (tuple[float] or None): Bounding box (minx, miny, maxx, maxy) in the Parquet file's CRS, or None to read all geometries
+        """
+        if columns is None: columns = [col for col in self._columns if col != self._geometry_col]
+        read_columns = [col for col in columns if col != self._geometry_col] + [self._geometry_col]
+        partition_geodataframes = [
+            gpd.read_parquet(path, columns = read_columns, bbox = bbox if bbox_col is not None else None)
+            for path, bounds, bbox_col in zip(self._partition_paths, self._partition_bounds, self._partition_bbox_cols) if self._intersects(bounds, bbox)
+        ]
+        if not partition_geodataframes:
+            return gpd.GeoDataFrame(
+                data = pd.DataFrame(columns = read_columns[:-1]),
+                geometry = gpd.GeoSeries([], crs = self._crs),
+                crs = self._crs
+            )
+        geodataframe = pd.concat(partition_geodataframes) if len(partition_geodataframes) > 1 else partition_geodataframes[0]
+        if bbox is not None:
+            minx, miny, maxx, maxy = bbox
+            geodataframe = geodataframe.cx[minx:maxx, miny:maxy]
+        return geodataframe
+
+    @property
+    def columns(self) -> list[str]:
+        """
+        Returns the names of all columns in the Parquet file, including the geometry column.
+        """
+        return self._columns
+
+    @property
+    def geometry_col(self) -> str:
+        """
+        Returns the name of the column containing the geometries.
+        """
+        return self._geometry_col
+
+    @property
+    def crs(self) -> pyproj.CRS:
+        """
+        Returns the coordinate reference system of the geometries.
+        """
+        return self._crs
+
+    @property
+    def partition_bounds(self) -> list[list[float] | None]:
+        """
+        Returns the bounding box (minx, miny, maxx, maxy) of each partition's geometries.
+        """
+        return self._partition_bounds
@@ -0,0 +1,156 @@
+# Standard library imports
+import os
+import time
+import threading
+import uuid
+from collections import defaultdict, deque, OrderedDict
+from contextlib import contextmanager
+
+# External dependencies imports
+import numpy as np
+import pandas as pd
+import panel as pn
+
+### LatencyTracker is used for recording how long each named operation takes, so that latencies can be aggregated across all sessions. ###
+class LatencyTracker:
+    # -------------------------------------------------- Class Properties --------------------------------------------------
+    # _instance = process-wide instance of the LatencyTracker class that is shared by every session
+    _instance = None
+    # _instance_lock = lock that prevents two sessions from creating the process-wide instance at the same time
+    _instance_lock = threading.Lock()
+
+    # -------------------------------------------------- Constructor --------------------------------------------------
+    def __init__(self, max_samples: int = 10000, max_keys: int = 1000, verbose: bool = False) -> None:
+        """
+        Creates a new instance of the LatencyTracker class with its instance variables.
+        Use get_instance() to get the instance that is shared by every session instead of creating a new one.
+
+        Args:
+            max_samples (int): Maximum number of most recent latencies kept for each operation and combination of tags
+            max_keys (int): Maximum number of operation and tag combinations kept, where the least recently recorded combination is removed when a new one exceeds the limit
+            verbose (bool): Whether to also print each recorded latency
+        """
+        # -------------------------------------------------- Constants --------------------------------------------------
+        self._max_samples = max_samples
+        self._max_keys = max_keys
+        self._verbose = verbose
+
+        # -------------------------------------------------- Internal Class Properties --------------------------------------------------
+        # _lock = lock that guards the recorded latencies, which are shared by the threads serving each session
+        self._lock = threading.Lock()
+        # _latencies = ordered dictionary mapping each operation's name and tags (key) to a queue containing its most recent latencies in seconds (value)
+        # ^ ordered from the least to the most recently recorded key, so that the least recently recorded key is removed first when there are too many keys
+        self._latencies = OrderedDict()
+
+    # -------------------------------------------------- Public Class Properties & Methods --------------------------------------------------
+    @classmethod
+    def get_instance(cls) -> "LatencyTracker":
+        """
+        Returns the process-wide instance of the LatencyTracker class, which is created the first time it's needed.
+        """
+        with cls._instance_lock:
+            if cls._instance is None: cls._instance = cls()
+            return cls._instance
+
+    @staticmethod
+    def get_session_id() -> str:
+        """
+        Returns the ID of the Panel session that is currently being served, or a new unique ID if the code isn't running in a server session.
+        Components should get the ID once when they're created and pass it as the `session` tag, since the current session isn't known in executor threads.
+        """
+        session_context = getattr(pn.state.curdoc, "session_context", None)
+        session_id = getattr(session_context, "id", None)
+        return session_id if session_id is not None else uuid.uuid4().hex
+
+    def record(self, name: str, seconds: float, **tags: any) -> None:
+        """
+        Records the latency of an operation.
+
+        Args:
+            name (str): Name of the operation (e.g. "read_parquet_points")
+            seconds (float): Duration of the operation in seconds
+            tags (any): Information about the operation (e.g. file_path, collection, session), which is used to group and filter latencies
+                ^ every combination of tags is kept separately, so the least recently recorded combinations are removed once there are more than max_keys of them
+        """
+        key = (name, tuple(sorted((tag, str(value)) for tag, value in tags.items())))
+        with self._lock:
+            if key in self._latencies:
+                self._latencies.move_to_end(key)
+            else:
+                self._latencies[key] = deque(maxlen = self._max_samples)
+                if len(self._latencies) > self._max_keys: self._latencies.popitem(last = False)
+            self._latencies[key].append(seconds)
+        if self._verbose: print("{} took {:.3f} seconds ({}).".format(name, seconds, ", ".join("{}={}".format(tag, value) for tag, value in key[1])))
+
+    @contextmanager
+    def span(self, name: str, **tags: any) -> any:
+        """
+        Records the latency of the code that runs within this context manager (e.g. `with tracker.span("read_parquet_points", file_path = path): ...`).
+
+        Args:
+            name (str): Name of the operation
+            tags (any): Information about the operation, which is used to group latencies
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start_time, **tags)
+
+    def summary(self, group_by: list[str] = ["file_path", "collection"], filters: dict = {}) -> pd.DataFrame:
+        """
+        Returns a DataFrame containing the number of calls and the mean, p50, p95, p99, and max latency (in seconds) of each operation, grouped by the given tags.
+
+        Args:
+            group_by (list[str]): Names of the tags to group latencies by in addition to the operation's name (tags not listed here are combined, e.g. all sessions and loading modes)
+            filters (dict): Dictionary mapping tag names (key) to the only value (value) that the summarized latencies must have (e.g. {"session": session_id})
+        """
+        grouped_latencies = defaultdict(list)
+        with self._lock:
+            for (name, tags), latencies in self._latencies.items():
+                tags_dict = dict(tags)
+                if any(tags_dict.get(tag, None) != str(value) for tag, value in filters.items()): continue
+                grouped_latencies[(name, *[tags_dict.get(tag, None) for tag in group_by])].extend(latencies)
+        rows = []
+        for key, latencies in grouped_latencies.items():
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+            rows.append([*key, len(latencies), np.mean(latencies), p50, p95, p99, np.max(latencies)])
+        summary_cols = ["operation", *group_by, "count", "mean", "p50", "p95", "p99", "max"]
+        return pd.DataFrame(rows, columns = summary_cols).sort_values(by = "p95", ascending = False).reset_index(drop = True)
+
+    def export(self, file_path: str, group_by: list[str] = ["file_path", "collection"], filters: dict = {}) -> None:
+        """
+        Saves the latency summary as a CSV or JSON file, depending on the given file's extension.
+
+        Args:
+            file_path (str): Path to the outputted .csv or .json file
+            group_by (list[str]): Names of the tags to group latencies by in addition to the operation's name
+            filters (dict): Dictionary mapping tag names (key) to the only value (value) that the summarized latencies must have
+        """
+        summary_dataframe = self.summary(group_by = group_by, filters = filters)
+        if file_path.lower().endswith(".json"): summary_dataframe.to_json(file_path, orient = "records", indent = 4)
+        else: summary_dataframe.to_csv(file_path, index = False)
+        print("Saved latency statistics to {}.".format(os.path.abspath(file_path)))
+
+    def reset(self) -> None:
+        """
+        Removes all recorded latencies.
+        """
+        with self._lock: self._latencies.clear()
+
+    @property
+    def verbose(self) -> bool:
+        """
+        Returns whether each recorded latency is also printed.
+        """
+        return self._verbose
+
+    @verbose.setter
+    def verbose(self, is_verbose: bool) -> None:
+        """
+        Sets whether each recorded latency is also printed.
+
+        Args:
+            is_verbose (bool): True to print each recorded latency, False otherwise
+        """
+        self._verbose = is_verbose
@@ -0,0 +1,154 @@
+# Standard library imports
+import sys
+from collections import OrderedDict
+
+# External dependencies imports
+import holoviews as hv
+
+### PlotCache is used for keeping the most recently used plots in memory without exceeding a byte budget. ###
+class PlotCache:
+    # -------------------------------------------------- Constructor --------------------------------------------------
+    def __init__(self, max_bytes: int = 2 * 1024 ** 3) -> None:
+        """
+        Creates a new instance of the PlotCache class with its instance variables.
+
+        Args:
+            max_bytes (int): Maximum number of bytes that all cached plots are allowed to use before the least recently used plots are evicted
+        """
+        # -------------------------------------------------- Constants --------------------------------------------------
+        # _max_bytes = byte budget for all the cached plots
+        self._max_bytes = max_bytes
+
+        # -------------------------------------------------- Internal Class Properties --------------------------------------------------
+        # _entries = ordered dictionary mapping each file's path (key) to a tuple (value) containing its created plot and the plot's estimated size in bytes
+        # ^ least recently used plots are at the start of the dictionary, and most recently used plots are at the end
+        self._entries = OrderedDict()
+        # _total_bytes = estimated number of bytes used by all the cached plots
+        self._total_bytes = 0
+        # _hits, _misses, _evictions = counters for requested plots that were cached, requested plots that weren't cached, and plots removed to stay within the byte budget
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # -------------------------------------------------- Private Class Methods --------------------------------------------------
+    def _evict_least_recently_used(self) -> None:
+        """
+        Removes the least recently used plots until the cached plots fit within the byte budget.
+        The most recently used plot is always kept, even if it alone exceeds the byte budget.
+        """
+        while (self._total_bytes > self._max_bytes) and (len(self._entries) > 1):
+            evicted_key, (_, evicted_bytes) = self._entries.popitem(last = False)
+            self._total_bytes -= evicted_bytes
+            self._evictions += 1
+            print("Evicted plot for {} ({:.1f} MB) from the plot cache.".format(evicted_key, evicted_bytes / 1e6))
+
+    # -------------------------------------------------- Public Class Properties & Methods --------------------------------------------------
+    @staticmethod
+    def estimate_nbytes(obj: any, seen: set = None) -> int:
+        """
+        Estimates the number of bytes used by the data underlying the given object.
+        HoloViews objects are searched for their data (e.g. (spatial)pandas DataFrames or xarray arrays), including the inputs of DynamicMaps created by operations like rasterize.
+
+        Args:
+            obj (any): HoloViews object, dataframe, array, or container of them
+            seen (set): IDs of objects that were already counted, which prevents data shared by several plots from being counted more than once
+        """
+        if seen is None: seen = set()
+        if (obj is None) or (id(obj) in seen): return 0
+        seen.add(id(obj))
+        if isinstance(obj, hv.DynamicMap):
+            # Count the elements that the DynamicMap's operation was applied to and the DynamicMap's cached outputs.
+            inputs = getattr(obj.callback, "inputs", [])
+            return sum(PlotCache.estimate_nbytes(input, seen) for input in inputs) + PlotCache.estimate_nbytes(obj.data, seen)
+        elif isinstance(obj, hv.core.dimension.Dimensioned):
+            return PlotCache.estimate_nbytes(obj.data, seen)
+        elif hasattr(obj, "dask"):
+            # Lazy Dask collections don't hold their data in memory.
+            return 0
+        elif hasattr(obj, "memory_usage"):
+            # pandas and spatialpandas DataFrames
+            return int(obj.memory_usage(deep = True).sum())
+        elif hasattr(obj, "nbytes"):
+            # xarray and NumPy arrays
+            return int(obj.nbytes)
+        elif isinstance(obj, dict):
+            return sum(PlotCache.estimate_nbytes(value, seen) for value in obj.values())
+        elif isinstance(obj, (list, tuple)):
+            return sum(PlotCache.estimate_nbytes(item, seen) for item in obj)
+        return sys.getsizeof(obj)
+
+    def get(self, key: str) -> any:
+        """
+        Returns the cached plot for the given key and marks it as the most recently used plot.
+        Returns None if the plot was never created or was evicted.
+
+        Args:
+            key (str): Path to the file that the plot was created from
+        """
+        if key in self._entries:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+        self._misses += 1
+        return None
+
+    def __setitem__(self, key: str, plot: any) -> None:
+        """
+        Caches the given plot as the most recently used plot, and evicts the least recently used plots if the byte budget is exceeded.
+
+        Args:
+            key (str): Path to the file that the plot was created from
+            plot (any): Created plot
+        """
+        if key in self._entries: self._total_bytes -= self._entries.pop(key)[1]
+        plot_bytes = PlotCache.estimate_nbytes(plot)
+        self._entries[key] = (plot, plot_bytes)
+        self._total_bytes += plot_bytes
+        self._evict_least_recently_used()
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Checks if a plot is cached for the given key without changing the order of the least recently used plots.
+
+        Args:
+            key (str): Path to the file that the plot was created from
+        """
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cached plots.
+        """
+        return len(self._entries)
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        Returns the byte budget for all the cached plots.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, new_max_bytes: int) -> None:
+        """
+        Sets a new byte budget, evicting the least recently used plots if the cached plots don't fit within it.
+
+        Args:
+            new_max_bytes (int): New maximum number of bytes that all cached plots are allowed to use
+        """
+        self._max_bytes = new_max_bytes
+        self._evict_least_recently_used()
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns a dictionary containing the cache's hit, miss, and eviction counters, as well as its current and maximum size.
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "entries": len(self._entries),
+            "total_bytes": self._total_bytes,
+            "max_bytes": self._max_bytes
+        }
@@ -5,21 +5,27 @@ from collections import Counter
 import asyncio
 import datetime as dt
 import time
+from typing import AsyncGenerator
+from functools import partial
+import threading
+import multiprocessing
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 
 # External dependencies imports
 import param
 import panel as pn
 import holoviews as hv
-import rioxarray as rxr
-import geopandas as gpd
 import pandas as pd
-import dask_geopandas
-from shapely.geometry import Point, LineString
 import cartopy.crs as ccrs
 import numpy as np
 from bokeh.models.formatters import PrintfTickFormatter
 from bokeh.palettes import Turbo256
 from .DataMap import DataMap
+from .LatencyTracker import LatencyTracker
+from .TimeSeriesExtractor import TimeSeriesExtractor
+from .TimeSeriesCache import TimeSeriesCache
+from .TimeSeriesStore import TimeSeriesStore
+from .CurveDownsampler import CurveDownsampler
 
 ### PopupModal is used to display a time-series plot or any other data/message in the app's modal. ###
 class PopupModal(param.Parameterized):
@@ -29,20 +35,40 @@ class PopupModal(param.Parameterized):
     end_data_collection_date = param.Date(default = dt.date(2018, 8, 1), label = "End Date of Collected Data")
     data_category = param.Selector(label = "Category of Selected Time-Series Data")
     displayed_data_file = param.Selector(label = "Path to a Displayed Time-Series Data File")
+    distance_measurement = param.Selector(
+        default = TimeSeriesExtractor.distance_measurements[0], objects = TimeSeriesExtractor.distance_measurements,
+        label = "Method for Measuring Each Data Point's Distance on the Time-Series' X-Axis"
+    )
     
     update_collection_dir_path = param.Event(label = "Action that Triggers the Updating of the Collection Directory and Its Related Objects")
     update_buffer_config = param.Event(label = "Action that Triggers Updating the Buffer Config File")
     update_accordion_section = param.Event(label = "Indicator for Updating the PopupModal's Accordion Sections")
     download_time_series = param.Event(label = "Action that Triggers Downloading the Computed Time-Series for a Selected Transect")
 
+    # -------------------------------------------------- Class Properties --------------------------------------------------
+    # _executors = dictionary mapping each executor's type and maximum number of workers (key) to the thread or process pool (value) that's shared by every session for extracting time-series data
+    _executors = {}
+    # _executors_lock = lock that prevents two sessions from creating the same pool at the same time
+    _executors_lock = threading.Lock()
+
     # -------------------------------------------------- Constructor --------------------------------------------------
-    def __init__(self, data_map: DataMap, template: pn.template, **params) -> None:
+    def __init__(
+        self, data_map: DataMap, template: pn.template, raster_sampling_method: str = TimeSeriesExtractor.raster_sampling_methods[0],
+        time_series_executor: str = "thread", time_series_max_workers: int | None = None, time_series_cache_dir: str | None = None,
+        time_series_max_points: int | None = None, time_series_downsampling: str = "lttb", **params
+    ) -> None:
         """
         Creates a new instance of the PopupModal class with its instance variables.
 
         Args:
             data_map (DataMap): Instance containing methods for converting data files to allow quicker loading onto a map
             template (panel.template): Data visualizer app's template
+            raster_sampling_method (str): Either "nearest" or "bilinear", which determines how GeoTIFFs are sampled along a transect without a buffer
+            time_series_executor (str): Either "thread" or "process", which determines whether data files are clipped on a thread pool or a process pool (better for CPU-heavy clips)
+            time_series_max_workers (int or None): Maximum number of threads or processes used for clipping data files, or None to use the executor's default
+            time_series_cache_dir (str or None): Path to a directory where extracted time-series data is also cached on disk (so it's reused after the server restarts), or None to only cache it in memory
+            time_series_max_points (int or None): Maximum number of points displayed for each data file's curve in the time-series, or None to display all points
+            time_series_downsampling (str): Either "lttb" or "minmax", which determines how curves with more than `time_series_max_points` points are downsampled
         """
         super().__init__(**params)
 
@@ -53,9 +79,9 @@ class PopupModal(param.Parameterized):
         # _outputs_dir_path = path to directory containing all downloaded time-series outputs
         self._outputs_dir_path = os.path.relpath("./outputs")
         # _dist_col_name = name of the column that stores the x-axis values (distance from shore) for the time-series plot
-        self._dist_col_name = "Across-Shore Distance (m)"
+        self._dist_col_name = TimeSeriesExtractor.dist_col_name
         # _default_y_axis_data_col_name = default name of the column that stores the y-axis values for the time-series plot (default is often used for data in ASCII grid files)
-        self._default_y_axis_data_col_name = "Elevation (m)"
+        self._default_y_axis_data_col_name = TimeSeriesExtractor.default_y_axis_data_col_name
         # _point_type_col_name = name of the column that stores the type of transect point (either start or end)
         self._point_type_col_name = "Point Type"
         # The following list of constant variables are keys that appear in the dictionary that DataMap sends into PopupModal's _clicked_transects_pipe stream.
@@ -71,6 +97,19 @@ class PopupModal(param.Parameterized):
         self._placeholder_displayed_data = "None"
         # _elwha_river_delta_collection_id = ScienceBase item id for the root item containing all the Elwha data
         self._elwha_river_delta_collection_id = "5a01f6d0e4b0531197b72cfe"
+        # _latency_tracker = process-wide tracker that records how long each of the modal's operations take
+        self._latency_tracker = LatencyTracker.get_instance()
+        # _session_id = ID of the Panel session that the latencies are recorded for, which is tagged on every recorded latency
+        self._session_id = LatencyTracker.get_session_id()
+        # _raster_sampling_method = method used for sampling GeoTIFFs along a transect without a buffer ("nearest" uses each pixel under the transect, "bilinear" interpolates values at pixel spacing)
+        self._raster_sampling_method = raster_sampling_method
+        # _executor = thread or process pool that clips data files without blocking the server's event loop
+        self._executor = PopupModal._get_executor(time_series_executor, time_series_max_workers)
+        # _time_series_cache = process-wide cache of data that was already extracted along transects
+        self._time_series_cache = TimeSeriesCache.get_instance()
+        if time_series_cache_dir is not None: self._time_series_cache.cache_dir_path = time_series_cache_dir
+        # _time_series_downsampler = downsampler for displayed curves with too many points (downloaded time-series data always contains all points), or None if curves aren't downsampled
+        self._time_series_downsampler = CurveDownsampler(time_series_max_points, time_series_downsampling) if time_series_max_points is not None else None
 
         # -------------------------------------------------- Internal Class Properties --------------------------------------------------        
         # _collection_dir_path = path to the directory containing all the data files used for the time-series
@@ -87,6 +126,16 @@ class PopupModal(param.Parameterized):
         self._data_file_colors = {}
         # _buffers = dictionary mapping each data file's path (key) to the selected transect's buffer/search radius (value) when extracting data around the transect
         self._buffers = {}
+        # _time_series_store = store of time-series data that was precomputed for the selected collection's predefined transects, or None before a collection is selected
+        self._time_series_store = None
+        # _time_series_generation = number of time-series computations that were started or cancelled, which identifies the most recent computation
+        # ^ results from computations of an older generation are stale (e.g. the user clicked another transect) and are discarded instead of being rendered
+        self._time_series_generation = 0
+        # _selection_change_generation = generation that was started by the most recent change of the selected data category or time period
+        # ^ a time-series that was cancelled by this change (and not by another clicked transect) tells the user why it stopped, since only a newly clicked transect replaces it in the modal
+        self._selection_change_generation = None
+        # _time_series_tasks = set of tasks that are clipping data files for the most recent time-series computation
+        self._time_series_tasks = set()
         # _buffer_widget_file_path = dictionary mapping the name of each float input widget (key) to the path (value) of the data file that uses this buffer when extracting data around the transect
         self._buffer_widget_file_path = {}
 
@@ -121,6 +170,11 @@ class PopupModal(param.Parameterized):
             name = "",
             options = {self._placeholder_displayed_data: None}
         )
+        # _distance_measurement_select = widget for selecting whether distances are measured in a straight line from the transect's start point or along the transect (which matters for transects with several line segments)
+        self._distance_measurement_select = pn.widgets.Select.from_param(
+            parameter = self.param.distance_measurement,
+            name = "Time-Series Distance Measurement"
+        )
         # _time_series_data_constant_widgets = list of widgets that always appear at the top of the "Time-Series Data" accordion section
         self._time_series_data_constant_widgets = [
             pn.Row(
@@ -164,8 +218,18 @@ class PopupModal(param.Parameterized):
             show_index = True, auto_edit = False, text_align = "center",
             sizing_mode = "stretch_width", margin = (-20, 5, 10, 5)
         )
-        # _time_series_dataframes = list of pandas DataFrames containing time-series data for each collection date
-        self._time_series_dataframes = []
+        # _time_series_dataframes = dictionary mapping each clipped data file's path (key) to a pandas DataFrame (value) containing its time-series data
+        self._time_series_dataframes = {}
+        # _clipped_data_plots = dictionary mapping each selected data file's path (key) to the plot of its data collected along the current time-series' transect (value), or None if no data was collected
+        self._clipped_data_plots = {}
+        # _time_series_clip_args = dictionary of keyword arguments for _clip_data() that were used for the current time-series, or None if no time-series is open
+        # ^ allows a single data file to be clipped again when its buffer changes
+        self._time_series_clip_args = None
+        # _recompute_tasks = dictionary mapping each data file's path (key) to the task (value) that is clipping it again after its buffer changed
+        self._recompute_tasks = {}
+        # _time_series_progress_text, _time_series_progress = text and progress bar showing how many of the selected data files have been clipped while the time-series plot is being created
+        self._time_series_progress_text = pn.widgets.StaticText(value = "", visible = False)
+        self._time_series_progress = pn.indicators.Progress(value = 0, max = 1, visible = False, sizing_mode = "stretch_width")
         # _time_series_download_button = button for downloading the time-series plot
         self._time_series_download_button = pn.widgets.Button.from_param(
             parameter = self.param.download_time_series,
@@ -176,6 +240,25 @@ class PopupModal(param.Parameterized):
         self._update_collection_objects()
 
     # -------------------------------------------------- Private Class Methods --------------------------------------------------
+    @classmethod
+    def _get_executor(cls, executor_type: str, max_workers: int | None) -> Executor:
+        """
+        Returns the process-wide thread or process pool with the given type and maximum number of workers, which is created the first time it's needed.
+
+        Args:
+            executor_type (str): Either "thread" or "process"
+            max_workers (int or None): Maximum number of threads or processes in the pool, or None to use the executor's default
+        """
+        with cls._executors_lock:
+            if (executor_type, max_workers) not in cls._executors:
+                if executor_type == "process":
+                    # Spawn new worker processes instead of forking the server, which already runs several threads.
+                    executor = ProcessPoolExecutor(max_workers = max_workers, mp_context = multiprocessing.get_context("spawn"))
+                else:
+                    executor = ThreadPoolExecutor(max_workers = max_workers, thread_name_prefix = "time_series")
+                cls._executors[(executor_type, max_workers)] = executor
+            return cls._executors[(executor_type, max_workers)]
+
     def _categorize_data_files(self) -> None:
         """
         Assigns the collection's data files to the multiselect widget that corresponds to their data category.
@@ -234,6 +317,37 @@ class PopupModal(param.Parameterized):
         data_file_path = self._buffer_widget_file_path[event.obj.name]
         # Save the new buffer value.
         self._buffers[data_file_path] = event.new
+        # Update only the data file's curve in the open time-series.
+        if (self._time_series_clip_args is not None) and (data_file_path in self._clipped_data_plots):
+            pn.state.execute(partial(self._recompute_time_series_file, data_file_path))
+
+    async def _recompute_time_series_file(self, file_path: str) -> None:
+        """
+        Clips the given data file again (e.g. with its new buffer) and replaces its plot in the open time-series, reusing the plots of every other data file.
+
+        Args:
+            file_path (str): Path to the data file to clip again
+        """
+        if (self._time_series_clip_args is None) or (file_path not in self._clipped_data_plots): return
+        generation = self._time_series_generation
+        # Only keep the most recent recomputation if the buffer changes again before the data file is clipped.
+        if file_path in self._recompute_tasks: self._recompute_tasks[file_path].cancel()
+        task = asyncio.create_task(self._clip_data(file_path, generation, **self._time_series_clip_args))
+        self._recompute_tasks[file_path] = task
+        self._time_series_tasks.add(task)
+        try:
+            with pn.param.set_values(self._time_series_plot, loading = True):
+                clipped_data_plot = await task
+        except asyncio.CancelledError:
+            return
+        finally:
+            if self._recompute_tasks.get(file_path, None) is task: del self._recompute_tasks[file_path]
+        # Discard the plot if another transect was clicked or the selected data files changed in the meantime.
+        if generation != self._time_series_generation: return
+        self._clipped_data_plots[file_path] = clipped_data_plot
+        plot = self._overlay_time_series_plots(self._clipped_data_plots)
+        self._time_series_plot.object = plot
+        self._time_series_plot.visible = self._time_series_download_button.visible = plot is not None
 
     def _get_transect_search_radius_float_inputs(self) -> pn.Column:
         """
@@ -277,18 +391,6 @@ class PopupModal(param.Parameterized):
                 json.dump(self._buffers, buffers_json_file, indent = 4)
         self._update_buffer_config_file_button.disabled = True
     
-    def _get_data_col_name(self, possible_data_cols: list[str]) -> str:
-        """
-        Gets the column name that exists in _data_map.all_data_cols, which is a list of column names provided by the user
-        (any column in _data_map.all_data_cols could be used for the time-series plot's y-axis values).
-
-        Args:
-            possible_data_cols (list[str]): List of all column names in a time-series data file
-        """
-        for col in possible_data_cols:
-            if col in self._data_map.all_data_cols: return col
-        return self._default_y_axis_data_col_name
-    
     def _get_coordinates_in_meters(self, x_coords: list[float], y_coords: list[float], crs: any) -> list[list[float]]:
         """
         Gets the given coordinates in meters, and transforms coordinates without a CRS into the time-series data's CRS.
@@ -329,204 +431,192 @@ class PopupModal(param.Parameterized):
         else:
             return False
     
-    def _get_data_along_transect(self, data_file_path: str, transect_points: list[list[float]], long_col_name: str, lat_col_name: str, transect_crs: ccrs) -> pd.DataFrame:
+    def _get_cached_time_series(
+        self, file_path: str, transect_points: list[list[float]], transect_crs: ccrs, buffer: float | None, extraction_settings: dict
+    ) -> tuple[str, tuple[pd.DataFrame | None, str] | None]:
         """
-        Gets all data that was collected along the given transect and returns that data as a dataframe.
-        Returns None if no data could be extracted with the given transect.
+        Returns a tuple containing the time-series cache's key for data extracted along the given transect and the cached extraction (or None if it isn't cached).
+        This method checks the data file's modification time and might read a Parquet file, so it shouldn't be called on the server's event loop.
 
         Args:
-            data_file_path (str): Path to the file containing data to extract for the time-series plot
-            transect_points (list[list[float]]): List of coordinates for the transect's start (first item/list) and end (second item/list) points
-                ^ [
-                    [start point's longitude/easting, start point's latitude/northing],
-                    [end point's longitude/easting, end point's latitude/northing]
-                ]
-            long_col_name (str): Name of the column containing the longitude/easting of each data point
-            lat_col_name (str): Name of the column containing the latitude/northing of each data point
+            file_path (str): Path to the data file, which is used to extract data for the time-series
+            transect_points (list[list[float]]): List of coordinates for each of the transect's points
             transect_crs (cartopy.crs): Coordinate reference system of the given transect
+            buffer (float or None): Buffer/search radius around the transect that the data is extracted with
+            extraction_settings (dict): Any other settings that change the extracted data
         """
-        _, data_file = os.path.split(data_file_path)
-        _, extension = os.path.splitext(data_file)
-        extension = extension.lower()
-        if extension in [".tif", ".tiff"]:
-            dataset = rxr.open_rasterio(data_file_path)
-            # Clip data collected along the clicked transect from the given data file.
-            try:
-                transect_buffer = self._buffers.get(data_file_path, 0)
-                if transect_buffer > 0:
-                    padded_transect_polygon = LineString(transect_points).buffer(transect_buffer, cap_style = 2)
-                    clipped_dataset = dataset.rio.clip(
-                        geometries = [padded_transect_polygon],
-                        from_disk = True
-                    )
-                else:
-                    clipped_dataset = dataset.rio.clip(
-                        geometries = [{
-                            "type": "LineString",
-                            "coordinates": transect_points
-                        }],
-                        from_disk = True
-                    )
-            except ValueError:
-                # Given transect doesn't overlap data file, so return None early since the clipped dataset would be empty.
-                return None
-            # Convert clipped data into a GeoDataFrame to easily get each data point's distance from the transect's start point.
-            clipped_dataset = clipped_dataset.squeeze().drop("spatial_ref").drop("band")
-            # Set name of the column with time-series' y-axis values to the default value because ASCII grid files don't have data columns.
-            self._y_axis_data_col_name = self._default_y_axis_data_col_name
-            clipped_dataset.name = self._y_axis_data_col_name
-            clipped_dataframe = clipped_dataset.to_dataframe().reset_index()
-            no_data_val = clipped_dataset.attrs["_FillValue"]
-            clipped_dataframe = clipped_dataframe[clipped_dataframe[self._y_axis_data_col_name] != no_data_val]
-            clipped_geodataframe = gpd.GeoDataFrame(
-                data = clipped_dataframe,
-                geometry = gpd.points_from_xy(
-                    x = clipped_dataframe["x"],
-                    y = clipped_dataframe["y"],
-                    crs = transect_crs
-                )
-            )
-            # Calculate each point's distance from the transect's start point.
-            transect_start_point = Point(transect_points[0])
-            clipped_geodataframe[self._dist_col_name] = [point.distance(transect_start_point) for point in clipped_geodataframe.geometry]
-            # Convert clipped data into a DataFrame for easier plotting.
-            clipped_data_dataframe = clipped_geodataframe.drop(columns = "geometry").rename(
-                columns = {
-                    "x": long_col_name,
-                    "y": lat_col_name
-                }
-            ).sort_values(by = self._dist_col_name).reset_index(drop = True)
-            return clipped_data_dataframe
-        elif extension == ".geojson":
-            data_geodataframe = gpd.read_file(filename = data_file_path)
-            # Reproject the data file to match the transect's projection, if necessary.
-            if data_geodataframe.crs is None: data_geodataframe = data_geodataframe.set_crs(crs = self._data_map.map_default_crs)
-            data_crs = ccrs.CRS(data_geodataframe.crs)
-            if not data_crs.is_exact_same(transect_crs): data_geodataframe = data_geodataframe.to_crs(crs = transect_crs)
-            # Add buffer/padding to the clicked transect, which is created with the given transect's start and end point coordinates.
-            # ^ Buffer allows data points within a certain distance from the clicked transect to be included in the time-series (since it's rare for data points to lie exactly on a transect).
-            padded_transect = LineString(transect_points).buffer(self._buffers.get(data_file_path, 3), cap_style = 2)
-            # Create GeoDataFrame for the padded transect.
-            clicked_transect_geodataframe = gpd.GeoDataFrame(
-                data = {"geometry": [padded_transect]},
-                geometry = "geometry",
-                crs = transect_crs
-            )
-            # Clip data collected along the clicked transect from the given data file.
-            clipped_geodataframe = data_geodataframe.clip(mask = clicked_transect_geodataframe)
-            # Given transect doesn't overlap data file, so return None early since the clipped geodataframe would be empty.
-            if clipped_geodataframe.empty: return None
-            # Calculate each point's distance from the transect's start point.
-            transect_start_point = Point(transect_points[0])
-            clipped_geodataframe.insert(
-                loc = len(clipped_geodataframe.columns),
-                column = self._dist_col_name,
-                value = [point.distance(transect_start_point) for point in clipped_geodataframe.geometry]
-            )
-            # Convert clipped data into a DataFrame for easier plotting.
-            clipped_data_dataframe = clipped_geodataframe.drop(columns = "geometry").sort_values(by = self._dist_col_name).reset_index(drop = True)
-            # Get name of the column with time-series' y-axis values.
-            self._y_axis_data_col_name = self._get_data_col_name(list(clipped_data_dataframe.columns))
-            return clipped_data_dataframe
-        elif extension in [".parq", ".parquet"]:
-            data_dask_geodataframe = dask_geopandas.read_parquet(data_file_path).to_crs(self._data_map.selected_collection_json_info.get("epsg", 4326))
-            # Add buffer/padding to the clicked transect, which is created with the given transect's start and end point coordinates.
-            # ^ Buffer allows data points within a certain distance from the clicked transect to be included in the time-series (since it's rare for data points to lie exactly on a transect).
-            padded_transect = LineString(transect_points).buffer(self._buffers.get(data_file_path, 3), cap_style = 2)
-            # Create Dask GeoDataFrame for the padded transect.
-            clicked_transect_dask_geodataframe = dask_geopandas.from_geopandas(
-                gpd.GeoDataFrame(
-                    data = {"geometry": [padded_transect]},
-                    geometry = "geometry",
-                    crs = transect_crs
-                ),
-                npartitions = 1
-            )
-            # Clip data collected along the clicked transect from the given data file.
-            clipped_geodataframe = data_dask_geodataframe.sjoin(
-                df = clicked_transect_dask_geodataframe,
-                how = "inner", predicate = "intersects"
-            )
-            # Calculate each point's distance from the transect's start point.
-            transect_start_point = Point(transect_points[0])
-            clipped_data_dataframe = clipped_geodataframe.assign(
-                new_dist_col_name = clipped_geodataframe["geometry"].distance(transect_start_point)
-            ).rename(columns = {"new_dist_col_name": self._dist_col_name}).sort_values(by = self._dist_col_name).drop(columns = ["index_right", "geometry"]).compute()
-            # When clipped dataframe is empty, then return None early.
-            if clipped_data_dataframe.empty:
-                return None
-            else:
-                # Get name of the column with time-series' y-axis values.
-                self._y_axis_data_col_name = self._get_data_col_name(list(clipped_data_dataframe.columns))
-                return clipped_data_dataframe
-        # Return None if there's currently no implementation to extract data from the data file yet.
-        print("Error extracting data along a transect from", data_file, ":", "Files with the", extension, "file format are not supported yet.")
-        return None
+        time_series_key = TimeSeriesCache.make_key(
+            data_file_path = file_path, transect_points = transect_points, transect_crs = transect_crs, buffer = buffer,
+            settings = extraction_settings
+        )
+        return time_series_key, self._time_series_cache.get(time_series_key)
 
-    async def _clip_data(self, file_path: str, easting_data: list[float], northing_data: list[float], long_col_name: str, lat_col_name: str, transect_crs: ccrs) -> hv.Overlay:
+    async def _clip_data(
+        self, file_path: str, generation: int, easting_data: list[float], northing_data: list[float], long_col_name: str, lat_col_name: str, transect_crs: ccrs,
+        transect_file: str | None = None, transect_id: any = None
+    ) -> hv.Overlay:
         """
         Clips data from the given file path with the selected transect.
 
         Args:
             file_path (str): Path to the data file, which is used to extract data for the time-series
+            generation (int): Generation of the time-series that the data file is clipped for, which must still be the most recent one for the clipped data to be saved for downloading
             easting_data (list[float]): List of longitude/easting values (in meters) for each transect point
             northing_data (list[float]): List of latitude/northing values (in meters) for each transect point
             long_col_name (str): Name of the column containing the longitude/easting of each data point
             lat_col_name (str): Name of the column containing the latitude/northing of each data point
             transect_crs (cartopy.crs): Coordinate reference system of the given transect
+            transect_file (str or None): Name of the transect file containing the transect, or None for user-drawn transects
+            transect_id (any): ID of the transect in its transect file, which is used to look up precomputed time-series data
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         subdir_path, filename = os.path.split(file_path)
         subdir = os.path.basename(subdir_path)
         file_option = " - ".join([subdir, filename])
         if file_path in self._data_map.selected_collection_json_info:
             file_option = self._data_map.selected_collection_json_info[file_path]
-        # Clip data along the selected transect for each data file.
-        clipped_dataframe = self._get_data_along_transect(
-            data_file_path = file_path,
-            transect_points = list(zip(easting_data, northing_data, strict = True)),
-            long_col_name = long_col_name,
-            lat_col_name = lat_col_name,
-            transect_crs = transect_crs
+        # Clip data along the selected transect for the data file on the thread or process pool, so that the server's event loop isn't blocked.
+        time_series_extractor = TimeSeriesExtractor(
+            dist_col_name = self._dist_col_name,
+            default_y_axis_data_col_name = self._default_y_axis_data_col_name,
+            all_data_cols = list(self._data_map.all_data_cols),
+            default_crs = self._data_map.map_default_crs,
+            distance_measurement = self.distance_measurement,
+            raster_sampling_method = self._raster_sampling_method
+        )
+        transect_points = [list(point) for point in zip(easting_data, northing_data, strict = True)]
+        buffer = self._buffers.get(file_path, None)
+        # Reuse data that was already extracted along the same transect from the same version of the data file with the same settings.
+        extraction_settings = TimeSeriesStore.get_settings(
+            long_col_name, lat_col_name, self._data_map.all_data_cols, self.distance_measurement, self._raster_sampling_method
         )
+        # ^ the key (which checks the data file's modification time) and the on-disk tier's Parquet files are read and written on the default thread pool
+        #   because the cache is shared by this process's sessions, so it can't be used from the (possibly process-based) extraction pool
+        event_loop = asyncio.get_running_loop()
+        time_series_key, cached_time_series = await event_loop.run_in_executor(
+            None, self._get_cached_time_series,
+            file_path, transect_points, transect_crs, buffer, extraction_settings
+        )
+        # Otherwise, look up data that was precomputed for the predefined transect (user-drawn transects or changed buffers aren't precomputed).
+        if (cached_time_series is None) and (transect_file is not None):
+            cached_time_series = await event_loop.run_in_executor(
+                None, self._time_series_store.get,
+                transect_file, transect_id, file_path, buffer, extraction_settings
+            )
+            if cached_time_series is not None: await event_loop.run_in_executor(None, self._time_series_cache.put, time_series_key, *cached_time_series)
+        if cached_time_series is not None:
+            clipped_dataframe, y_axis_col = cached_time_series
+        else:
+            clipped_dataframe, y_axis_col = await event_loop.run_in_executor(
+                self._executor, time_series_extractor.extract,
+                file_path, transect_points, long_col_name, lat_col_name, transect_crs, buffer
+            )
+            await event_loop.run_in_executor(None, self._time_series_cache.put, time_series_key, clipped_dataframe, y_axis_col)
         if clipped_dataframe is not None:
             # Assign the time-series plot's options.
+            self._y_axis_data_col_name = y_axis_col
             x_axis_col = self._dist_col_name
-            y_axis_col = self._y_axis_data_col_name
             other_val_cols = [col for col in clipped_dataframe.columns if col not in [x_axis_col, y_axis_col]]
+            color = self._data_file_colors[file_path]
             # Plot clipped data.
-            clipped_data_curve_plot = hv.Curve(
-                data = clipped_dataframe,
-                kdims = x_axis_col,
-                vdims = y_axis_col,
-                label = file_option
-            ).opts(color = self._data_file_colors[file_path])
-            clipped_data_point_plot = hv.Points(
-                data = clipped_dataframe,
-                kdims = [x_axis_col, y_axis_col],
-                vdims = other_val_cols,
-                label = file_option
-            ).opts(
-                color = self._data_file_colors[file_path],
-                tools = ["hover"],
-                size = 5
-            )
-            # Save the time-series data for the given file as a pandas DataFrame.
-            all_dims = clipped_data_curve_plot.dimensions(selection = "all")
-            data_col_name = "{}: {}".format(file_option, y_axis_col)
-            dataframe = clipped_data_curve_plot.dframe(dimensions = all_dims).rename(columns = {y_axis_col: data_col_name})
-            self._time_series_dataframes.append(dataframe)
+            def plot_clipped_data(dataframe: pd.DataFrame) -> hv.Overlay:
+                clipped_data_curve_plot = hv.Curve(
+                    data = dataframe,
+                    kdims = x_axis_col,
+                    vdims = y_axis_col,
+                    label = file_option
+                ).opts(color = color)
+                clipped_data_point_plot = hv.Points(
+                    data = dataframe,
+                    kdims = [x_axis_col, y_axis_col],
+                    vdims = other_val_cols,
+                    label = file_option
+                ).opts(
+                    color = color,
+                    tools = ["hover"],
+                    size = 5
+                )
+                return clipped_data_curve_plot * clipped_data_point_plot
+            if self._time_series_downsampler is None:
+                clipped_data_plot = plot_clipped_data(clipped_dataframe)
+            else:
+                # Only send a downsampled curve within the visible x-axis range to the browser, which is downsampled again whenever the user zooms or pans.
+                clipped_data_plot = hv.DynamicMap(
+                    lambda x_range: plot_clipped_data(self._time_series_downsampler.downsample(clipped_dataframe, x_axis_col, y_axis_col, x_range)),
+                    streams = [hv.streams.RangeX()]
+                )
+            # Save the time-series data for the given file as a pandas DataFrame (with all points, even if the displayed curve is downsampled).
+            # ^ skipped if another transect was clicked or the selected data files changed while the file was being clipped, so a stale file is never downloaded
+            if generation == self._time_series_generation:
+                data_col_name = "{}: {}".format(file_option, y_axis_col)
+                self._time_series_dataframes[file_path] = clipped_dataframe[[x_axis_col, y_axis_col]].rename(columns = {y_axis_col: data_col_name})
             # Return the clipped data file's plot.
-            clipped_data_plot = clipped_data_curve_plot * clipped_data_point_plot
-            end_time = time.time()
-            print("Creating time-series plot for {} took {} seconds.".format(file_path, end_time - start_time))
+            self._latency_tracker.record("clip_data", time.perf_counter() - start_time, file_path = file_path, collection = os.path.basename(self._collection_dir_path), session = self._session_id)
             return clipped_data_plot
         else:
+            if generation == self._time_series_generation: self._time_series_dataframes.pop(file_path, None)
             return None
 
-    async def _create_time_series_plot(self) -> pn.pane.HoloViews:
+    def _cancel_time_series_tasks(self) -> int:
+        """
+        Cancels any data files that are still being clipped (or clipped again with a new buffer) for the current time-series and starts a new generation, which makes the current time-series stale.
+        The current time-series' clipped plots and clip arguments are also cleared, so a changed buffer doesn't clip data files for a stale time-series.
+        Returns the new generation.
+        """
+        self._time_series_generation += 1
+        for task in self._time_series_tasks: task.cancel()
+        self._time_series_tasks = set()
+        for task in self._recompute_tasks.values(): task.cancel()
+        self._recompute_tasks = {}
+        self._clipped_data_plots, self._time_series_clip_args = {}, None
+        return self._time_series_generation
+
+    def _overlay_time_series_plots(self, clipped_data_plots: dict) -> hv.Overlay | None:
         """
-        Creates and returns a time-series plot for data collected along a clicked transect on the map.
+        Returns the styled overlay of the given data files' plots in the order that the data files were selected, or None if no data file has a plot yet.
+
+        Args:
+            clipped_data_plots (dict): Dictionary mapping each data file's path (key) to the plot of its data collected along the transect (value), or None if no data was collected
+        """
+        start_time = time.perf_counter()
+        plot = None
+        for file_path in self._user_selected_data_files:
+            clipped_data_plot = clipped_data_plots.get(file_path, None)
+            if clipped_data_plot is not None: plot = clipped_data_plot if plot is None else plot * clipped_data_plot
+        if plot is not None:
+            plot = plot.opts(
+                title = "Time-Series of {} Data".format(self.data_category),
+                xlabel = self._dist_col_name,
+                ylabel = self._y_axis_data_col_name,
+                active_tools = ["pan", "wheel_zoom"],
+                legend_position = "bottom", #legend_cols = 3,# or any integer can eventually be used in Bokeh 3.1 so (TODO) make sure to update the package when it gets released!
+                show_legend = True, toolbar = None,
+                height = 500, responsive = True, padding = 0.1
+            )
+        self._latency_tracker.record("overlay_time_series_plots", time.perf_counter() - start_time, collection = os.path.basename(self._collection_dir_path), category = self.data_category, session = self._session_id)
+        return plot
+
+    def _get_time_series_layout(self, num_done_files: int, num_files: int) -> pn.Column:
+        """
+        Returns a column layout containing the time-series plot and, while data is still being extracted, a progress indicator.
+
+        Args:
+            num_done_files (int): Number of selected data files whose data was already extracted
+            num_files (int): Number of selected data files
+        """
+        is_extracting = num_done_files < num_files
+        self._time_series_progress_text.value = "Extracted data from {} of {} selected data files...".format(num_done_files, num_files)
+        self._time_series_progress.max = max(num_files, 1)
+        self._time_series_progress.value = num_done_files
+        self._time_series_progress_text.visible = self._time_series_progress.visible = is_extracting
+        return pn.Column(self._time_series_progress_text, self._time_series_progress, self._time_series_plot, sizing_mode = "stretch_width")
+
+    @param.depends("clicked_transects_info")
+    async def _create_time_series_plot(self) -> AsyncGenerator[pn.Column, None]:
+        """
+        Creates a time-series plot for data collected along a clicked transect on the map.
+        Yields the plot again whenever another data file's data is extracted, so that each data file's data appears without waiting for slower data files.
+        Only a newly clicked transect re-runs this method, so a changed data category or time period stops the current time-series without replacing it.
         """
         # Get informational key-value pairs that aren't part of the time-series plot.
         transect_file = self.clicked_transects_info.get(self._clicked_transects_file, None)
@@ -535,6 +625,9 @@ class PopupModal(param.Parameterized):
         long_col_name = self.clicked_transects_info.get(self._clicked_transects_longitude_col, "Longitude")
         lat_col_name = self.clicked_transects_info.get(self._clicked_transects_latitude_col, "Latitude")
         transect_id_col_name = self.clicked_transects_info.get(self._clicked_transects_id_col, "Transect ID")
+        num_files = num_done_files = 0
+        # Cancel the time-series of the previously clicked transect if it's still being created.
+        generation = self._cancel_time_series_tasks()
         if num_transects == 1:
             # Get the ID of the selected transect without the set's brackets.
             transect_id = str(set(self.clicked_transects_info[transect_id_col_name]))[1:-1]
@@ -548,53 +641,64 @@ class PopupModal(param.Parameterized):
                 )
             # For each data file, plot its data collected along the clicked transect.
             plot = None
+            self._time_series_plot = pn.pane.HoloViews(object = None, visible = False)
             if self._data_within_crs_bounds(x_data = easting_data, y_data = northing_data, crs = transect_crs):
-                # Create a list of tasks (clip all selected data files with the selected transect) to run asynchronously.
-                self._time_series_dataframes = []
-                tasks = [asyncio.create_task(self._clip_data(file_path, easting_data, northing_data, long_col_name, lat_col_name, transect_crs)) for file_path in self._user_selected_data_files]
-                # Gather the returned results of each task.
-                start_time = time.time()
-                results = await asyncio.gather(*tasks)
-                end_time = time.time()
-                print("Creating all time-series plots took {} seconds.".format(end_time - start_time))
-                # Overlay all clipped data files' plots.
-                start_time = time.time()
-                for clipped_data_plot in results:
-                    if clipped_data_plot is not None:
+                # Create tasks (clip all selected data files with the selected transect) to run asynchronously.
+                self._time_series_dataframes = {}
+                # Only predefined transects (which have a CRS) from a transect file could have precomputed time-series data.
+                predefined_transect_file = transect_file if self._clicked_transects_crs in self.clicked_transects_info else None
+                predefined_transect_id = next(iter(set(self.clicked_transects_info[transect_id_col_name])))
+                self._time_series_clip_args = {
+                    "easting_data": easting_data, "northing_data": northing_data,
+                    "long_col_name": long_col_name, "lat_col_name": lat_col_name, "transect_crs": transect_crs,
+                    "transect_file": predefined_transect_file, "transect_id": predefined_transect_id
+                }
+                task_file_paths = {
+                    asyncio.create_task(self._clip_data(file_path, generation, **self._time_series_clip_args)): file_path
+                    for file_path in self._user_selected_data_files
+                }
+                self._time_series_tasks = set(task_file_paths)
+                num_files = len(task_file_paths)
+                yield self._get_time_series_layout(num_done_files, num_files)
+                # Add each data file's plot to the time-series as soon as its data is extracted.
+                start_time = time.perf_counter()
+                pending_tasks = set(task_file_paths)
+                while pending_tasks:
+                    done_tasks, pending_tasks = await asyncio.wait(pending_tasks, return_when = asyncio.FIRST_COMPLETED)
+                    # Stop if another transect was clicked or the selected data files changed in the meantime.
+                    if generation != self._time_series_generation:
+                        # Only the time-series of a newly clicked transect replaces this one, so explain why this time-series stopped if the selected data files changed instead.
+                        if self._selection_change_generation == self._time_series_generation:
+                            self._update_heading_text(
+                                title = "Selected Data Files Changed",
+                                details = "The selected data category or time period changed while the time-series was being created. Click on the transect again to view the time-series of the newly selected data files."
+                            )
+                            self._time_series_plot.visible = self._time_series_download_button.visible = False
+                            yield self._get_time_series_layout(num_files, num_files)
+                        return
+                    for task in done_tasks: self._clipped_data_plots[task_file_paths[task]] = task.result()
+                    num_done_files += len(done_tasks)
+                    if any(self._clipped_data_plots[task_file_paths[task]] is not None for task in done_tasks):
                         if plot is None:
+                            self._latency_tracker.record("time_to_first_curve", time.perf_counter() - start_time, collection = os.path.basename(self._collection_dir_path), category = self.data_category, session = self._session_id)
                             self._update_heading_text(
                                 title = "Time-Series of Data Collected Along Transect {} from {}".format(
                                     transect_id, transect_file
                                 ),
                                 details = "Scroll on the axes or data area to zoom in and out of the plot."
                             )
-                            plot = clipped_data_plot
-                        else:
-                            plot = plot * clipped_data_plot
-                end_time = time.time()
-                print("Overlaying all time-series plots took {} seconds.".format(end_time - start_time))
-            if plot is not None:
-                # Return the overlay plot containing data collected along the transect for all data files.
-                self._time_series_plot = pn.pane.HoloViews(
-                    object = plot.opts(
-                        title = "Time-Series of {} Data".format(self.data_category),
-                        xlabel = self._dist_col_name,
-                        ylabel = self._y_axis_data_col_name,
-                        active_tools = ["pan", "wheel_zoom"],
-                        legend_position = "bottom", #legend_cols = 3,# or any integer can eventually be used in Bokeh 3.1 so (TODO) make sure to update the package when it gets released!
-                        show_legend = True, toolbar = None,
-                        height = 500, responsive = True, padding = 0.1
-                    ),
-                    visible = True
-                )
-            else:
+                        # Update the overlay plot containing data collected along the transect for all extracted data files.
+                        plot = self._overlay_time_series_plots(self._clipped_data_plots)
+                        self._time_series_plot = pn.pane.HoloViews(object = plot, visible = True)
+                    yield self._get_time_series_layout(num_done_files, num_files)
+                self._latency_tracker.record("clip_all_data", time.perf_counter() - start_time, collection = os.path.basename(self._collection_dir_path), category = self.data_category, session = self._session_id)
+            if plot is None:
                 self._update_heading_text(
                     title = "No Time-Series Available",
                     details = "Unfortunately, no data has been collected along your selected transect (Transect {} from {}). Please select another transect or create your own transect.".format(
                         transect_id, transect_file
                     )
                 )
-                self._time_series_plot = pn.pane.HoloViews(object = None, visible = False)
         elif num_transects > 1:
             # Make the selected transects' IDs readable for the error message.
             ids = sorted([str(id) for id in set(self.clicked_transects_info[transect_id_col_name])])
@@ -611,7 +715,7 @@ class PopupModal(param.Parameterized):
         # Set the visibility of the time-series download button based on whether a time-series is computed.
         self._time_series_download_button.visible = self._time_series_plot.visible
         # Return the newly computed time-series plot.
-        return self._time_series_plot
+        yield self._get_time_series_layout(num_done_files, num_files)
 
     @param.depends("download_time_series", watch = True)
     def _download_time_series(self) -> None:
@@ -636,7 +740,7 @@ class PopupModal(param.Parameterized):
         # Save CSV version (combine all time-series dataframes together, group the rows with the same distance together, and round the precision of the distances to at most 2 decimal places).
         csv_name = filename + ".csv"
         csv_path = os.path.join(downloads_dir_path, csv_name)
-        all_time_series_data = pd.concat(objs = self._time_series_dataframes, axis = 0, ignore_index = True).sort_values(by = self._dist_col_name).reset_index(drop = True)
+        all_time_series_data = pd.concat(objs = list(self._time_series_dataframes.values()), axis = 0, ignore_index = True).sort_values(by = self._dist_col_name).reset_index(drop = True)
         all_time_series_data = all_time_series_data.groupby(by = self._dist_col_name, as_index = False).aggregate("first")
         all_time_series_data[self._dist_col_name] = all_time_series_data[self._dist_col_name].apply(lambda dist_val: round(number = dist_val, ndigits = 2))
         with open(csv_path, "a+") as csv_file:
@@ -698,6 +802,8 @@ class PopupModal(param.Parameterized):
         """
         Selects data files for the time-series based on the selected data category and time period.
         """
+        # Data files that are still being clipped for the current time-series may no longer be selected.
+        self._selection_change_generation = self._cancel_time_series_tasks()
         new_selected_data_files_paths = []
         for category in self._data_category_select.options:
             if (self.data_category is not None) and (category == self.data_category):
@@ -749,6 +855,8 @@ class PopupModal(param.Parameterized):
         # Load buffer configuration file's values.
         json_file = open(os.path.join(self._collection_dir_path, self._preprocessed_data_buffer_output))
         self._buffers = json.load(json_file)
+        # Look up time-series data that was precomputed for the collection's predefined transects.
+        self._time_series_store = TimeSeriesStore(self._collection_dir_path)
         # Update widgets in the "Transect Search Radius" section.
         self._transect_search_radius_widgets.objects = self._transect_search_radius_constant_widgets + self._get_transect_search_radius_float_inputs()
     
@@ -786,9 +894,17 @@ class PopupModal(param.Parameterized):
         return [
             self._start_data_collection_date_picker,
             self._end_data_collection_date_picker,
-            self._data_category_select
+            self._data_category_select,
+            self._distance_measurement_select
         ]
 
+    @property
+    def time_series_store_stats(self) -> dict:
+        """
+        Returns the number of lookups that couldn't use the selected collection's precomputed time-series data, counted by reason.
+        """
+        return self._time_series_store.stats if self._time_series_store is not None else {}
+
     def get_accordion_sections(self) -> list[tuple]:
         """
         Returns a list of tuples, each containing the name of the accordion section and its content.
@@ -0,0 +1,217 @@
+# Standard library imports
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable
+
+# External dependencies imports
+import numpy as np
+import pandas as pd
+import holoviews as hv
+from .PlotCache import PlotCache
+
+### SharedDatasetCache is used for sharing loaded datasets between all the app's sessions in the same process. ###
+class SharedDatasetCache:
+    # -------------------------------------------------- Class Properties --------------------------------------------------
+    # _instance = process-wide instance of the SharedDatasetCache class that is shared by every session
+    _instance = None
+    # _instance_lock = lock that prevents two sessions from creating the process-wide instance at the same time
+    _instance_lock = threading.Lock()
+
+    # -------------------------------------------------- Constructor --------------------------------------------------
+    def __init__(self, max_bytes: int = 4 * 1024 ** 3) -> None:
+        """
+        Creates a new instance of the SharedDatasetCache class with its instance variables.
+        Use get_instance() to get the instance that is shared by every session instead of creating a new one.
+
+        Args:
+            max_bytes (int): Maximum number of bytes that all loaded datasets are allowed to use before the least recently used datasets are evicted
+        """
+        # -------------------------------------------------- Constants --------------------------------------------------
+        # _max_bytes = byte budget for all the loaded datasets
+        self._max_bytes = max_bytes
+
+        # -------------------------------------------------- Internal Class Properties --------------------------------------------------
+        # _lock = lock that guards the loaded datasets and counters, which are shared by the threads serving each session
+        self._lock = threading.Lock()
+        # _entries = ordered dictionary mapping each dataset's key (key) to a tuple (value) containing the loaded dataset and its estimated size in bytes
+        # ^ a dataset's key is a tuple containing the data file's absolute path, the file's modification time, and the name of the dataset's variant (e.g. the columns that were loaded)
+        self._entries = OrderedDict()
+        # _loading = dictionary mapping each dataset's key (key) to a future (value) that is resolved once the dataset finishes loading
+        # ^ allows sessions that ask for a dataset that is currently being loaded to wait for it instead of loading it again
+        self._loading = {}
+        # _total_bytes = estimated number of bytes used by all the loaded datasets
+        self._total_bytes = 0
+        # _hits, _misses, _coalesced_loads, _evictions = counters for requested datasets that were loaded, requested datasets that needed loading, requests that waited for another session's load, and datasets removed to stay within the byte budget
+        self._hits = 0
+        self._misses = 0
+        self._coalesced_loads = 0
+        self._evictions = 0
+
+    # -------------------------------------------------- Private Class Methods --------------------------------------------------
+    def _make_array_read_only(self, array: np.ndarray) -> None:
+        """
+        Marks the given NumPy array and every array that it's a view of as read-only, so that the data can't be changed through any other view of it.
+
+        Args:
+            array (np.ndarray): Array containing shared data
+        """
+        while isinstance(array, np.ndarray):
+            array.flags.writeable = False
+            array = array.base
+
+    def _make_read_only(self, dataset: any) -> any:
+        """
+        Prevents a loaded dataset from being modified by the sessions that share it.
+        NumPy arrays (including the ones backing pandas columns, xarray variables, and HoloViews elements) are marked as read-only,
+        and pandas DataFrames are shared through shallow copies, so that sessions can add, drop, or rename columns without changing the DataFrame for other sessions.
+
+        Args:
+            dataset (any): Loaded dataset (or tuple of loaded objects) that will be shared between sessions
+        """
+        if isinstance(dataset, pd.DataFrame):
+            # Changing a column's values in place (e.g. with `.loc[...] = ...`) raises an error instead of changing them for every session.
+            for col in dataset.columns: self._make_array_read_only(dataset[col].values)
+            self._make_array_read_only(dataset.index.values)
+            return dataset.copy(deep = False)
+        elif isinstance(dataset, np.ndarray):
+            self._make_array_read_only(dataset)
+        elif isinstance(dataset, hv.core.dimension.Dimensioned):
+            # HoloViews elements (e.g. images loaded with gv.load_tiff) are shared as they are, so only their data is made read-only.
+            self._make_read_only(dataset.data)
+        elif hasattr(dataset, "variables"):
+            # xarray Dataset or DataArray
+            for variable in dataset.variables.values():
+                self._make_array_read_only(variable.data)
+        elif isinstance(dataset, dict):
+            for value in dataset.values(): self._make_read_only(value)
+        elif isinstance(dataset, tuple):
+            return tuple(self._make_read_only(item) for item in dataset)
+        return dataset
+
+    def _evict_least_recently_used(self) -> None:
+        """
+        Removes the least recently used datasets until the loaded datasets fit within the byte budget.
+        The most recently used dataset is always kept, even if it alone exceeds the byte budget.
+        """
+        while (self._total_bytes > self._max_bytes) and (len(self._entries) > 1):
+            evicted_key, (_, evicted_bytes) = self._entries.popitem(last = False)
+            self._total_bytes -= evicted_bytes
+            self._evictions += 1
+            print("Evicted dataset for {} ({:.1f} MB) from the shared dataset cache.".format(evicted_key[0], evicted_bytes / 1e6))
+
+    def _remove_outdated_entries(self, key: tuple) -> None:
+        """
+        Removes datasets that were loaded from an older version of the same data file as the given key.
+
+        Args:
+            key (tuple): Key of the dataset that was loaded from the latest version of the data file
+        """
+        path, modified_time, variant = key
+        for outdated_key in [entry_key for entry_key in self._entries if (entry_key[0] == path) and (entry_key[2] == variant) and (entry_key[1] != modified_time)]:
+            self._total_bytes -= self._entries.pop(outdated_key)[1]
+
+    # -------------------------------------------------- Public Class Properties & Methods --------------------------------------------------
+    @staticmethod
+    def get_modified_time(file_path: str) -> int:
+        """
+        Returns the latest modification time (in nanoseconds) of the given file, or of any file within the given directory (e.g. a Parquet directory of partition files).
+
+        Args:
+            file_path (str): Path to a data file or directory
+        """
+        modified_time = os.stat(file_path).st_mtime_ns
+        if os.path.isdir(file_path):
+            for dir_path, _, files in os.walk(file_path):
+                for file in files:
+                    modified_time = max(modified_time, os.stat(os.path.join(dir_path, file)).st_mtime_ns)
+        return modified_time
+
+    @classmethod
+    def get_instance(cls) -> "SharedDatasetCache":
+        """
+        Returns the process-wide instance of the SharedDatasetCache class, which is created the first time it's needed.
+        """
+        with cls._instance_lock:
+            if cls._instance is None: cls._instance = cls()
+            return cls._instance
+
+    def get(self, file_path: str, loader: Callable[[], any], variant: str = "") -> any:
+        """
+        Returns the read-only dataset loaded from the given file, calling the given loader only if no session has loaded the current version of the file yet.
+        If another session is already loading the same dataset, then this waits for that load to finish instead of reading the file again.
+
+        Args:
+            file_path (str): Path to the data file (or Parquet directory) to load
+            loader (Callable[[], any]): Function that reads the data file and returns the loaded dataset
+            variant (str): Name that distinguishes different datasets loaded from the same file (e.g. by different loaders)
+        """
+        key = (os.path.abspath(file_path), SharedDatasetCache.get_modified_time(file_path), variant)
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._make_read_only(self._entries[key][0])
+            future = self._loading.get(key, None)
+            is_loading_session = future is None
+            if is_loading_session:
+                self._misses += 1
+                future = Future()
+                self._loading[key] = future
+            else:
+                self._coalesced_loads += 1
+        if not is_loading_session:
+            # Wait for the session that is already loading the dataset.
+            return self._make_read_only(future.result())
+        try:
+            dataset = loader()
+        except Exception as error:
+            with self._lock: del self._loading[key]
+            future.set_exception(error)
+            raise
+        dataset = self._make_read_only(dataset)
+        dataset_bytes = PlotCache.estimate_nbytes(dataset)
+        with self._lock:
+            del self._loading[key]
+            self._remove_outdated_entries(key)
+            self._entries[key] = (dataset, dataset_bytes)
+            self._total_bytes += dataset_bytes
+            self._evict_least_recently_used()
+        future.set_result(dataset)
+        return self._make_read_only(dataset)
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        Returns the byte budget for all the loaded datasets.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, new_max_bytes: int) -> None:
+        """
+        Sets a new byte budget, evicting the least recently used datasets if the loaded datasets don't fit within it.
+
+        Args:
+            new_max_bytes (int): New maximum number of bytes that all loaded datasets are allowed to use
+        """
+        with self._lock:
+            self._max_bytes = new_max_bytes
+            self._evict_least_recently_used()
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns a dictionary containing the cache's hit, miss, coalesced load, and eviction counters, as well as its current and maximum size.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced_loads": self._coalesced_loads,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self._max_bytes
+            }
@@ -0,0 +1,234 @@
+# Standard library imports
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+# External dependencies imports
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from .PlotCache import PlotCache
+from .SharedDatasetCache import SharedDatasetCache
+
+### TimeSeriesCache is used for reusing data that was already extracted along a transect, in memory for all sessions and optionally on disk across server restarts. ###
+class TimeSeriesCache:
+    # -------------------------------------------------- Class Properties --------------------------------------------------
+    # _instance = process-wide instance of the TimeSeriesCache class that is shared by every session
+    _instance = None
+    # _instance_lock = lock that prevents two sessions from creating the process-wide instance at the same time
+    _instance_lock = threading.Lock()
+
+    # -------------------------------------------------- Constructor --------------------------------------------------
+    def __init__(self, max_bytes: int = 512 * 1024 ** 2, cache_dir_path: str | None = None, max_disk_bytes: int = 2 * 1024 ** 3) -> None:
+        """
+        Creates a new instance of the TimeSeriesCache class with its instance variables.
+        Use get_instance() to get the instance that is shared by every session instead of creating a new one.
+
+        Args:
+            max_bytes (int): Maximum number of bytes that all extracted data kept in memory is allowed to use before the least recently used data is evicted
+            cache_dir_path (str or None): Path to the directory where extracted data is also saved as Parquet files, or None to only keep extracted data in memory
+            max_disk_bytes (int): Maximum number of bytes that the Parquet files in the cache directory are allowed to use before the least recently used files are deleted
+                ^ keys include the data file's modification time, so files extracted from outdated versions of a data file are never used again and eventually deleted
+        """
+        # -------------------------------------------------- Constants --------------------------------------------------
+        # _max_bytes = byte budget for the in-memory tier
+        self._max_bytes = max_bytes
+        # _max_disk_bytes = byte budget for the on-disk tier
+        self._max_disk_bytes = max_disk_bytes
+        # _y_axis_col_metadata_key = key of the Parquet metadata that stores the name of the column with the time-series' y-axis values
+        self._y_axis_col_metadata_key = b"time_series_y_axis_col"
+
+        # -------------------------------------------------- Internal Class Properties --------------------------------------------------
+        # _cache_dir_path = path to the directory of the on-disk tier, or None if the on-disk tier is disabled
+        self._cache_dir_path = cache_dir_path
+        # _lock = lock that guards the in-memory tier and counters, which are shared by the threads serving each session
+        self._lock = threading.Lock()
+        # _entries = ordered dictionary mapping each extraction's key (key) to a tuple (value) containing the extracted dataframe (or None if no data was extracted), the name of its y-axis column, and its estimated size in bytes
+        self._entries = OrderedDict()
+        # _total_bytes = estimated number of bytes used by all the extracted data kept in memory
+        self._total_bytes = 0
+        # _memory_hits, _disk_hits, _misses, _evictions = counters for extractions found in memory, extractions found on disk, extractions that needed computing, and extractions removed from memory to stay within the byte budget
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # _disk_evictions = counter for extractions deleted from disk to stay within the on-disk tier's byte budget
+        self._disk_evictions = 0
+
+    # -------------------------------------------------- Private Class Methods --------------------------------------------------
+    def _get_disk_path(self, key: str) -> str | None:
+        """
+        Returns the path to the Parquet file storing the extraction with the given key, or None if the on-disk tier is disabled.
+
+        Args:
+            key (str): Key of the extraction
+        """
+        if self._cache_dir_path is None: return None
+        return os.path.join(self._cache_dir_path, key + ".parquet")
+
+    def _add_to_memory(self, key: str, dataframe: pd.DataFrame | None, y_axis_col: str) -> None:
+        """
+        Keeps the given extraction in memory as the most recently used extraction, and evicts the least recently used extractions if the byte budget is exceeded.
+
+        Args:
+            key (str): Key of the extraction
+            dataframe (pandas.DataFrame or None): Extracted data, or None if no data was extracted
+            y_axis_col (str): Name of the column with the time-series' y-axis values
+        """
+        entry_bytes = PlotCache.estimate_nbytes(dataframe)
+        with self._lock:
+            if key in self._entries: self._total_bytes -= self._entries.pop(key)[2]
+            self._entries[key] = (dataframe, y_axis_col, entry_bytes)
+            self._total_bytes += entry_bytes
+            while (self._total_bytes > self._max_bytes) and (len(self._entries) > 1):
+                _, (_, _, evicted_bytes) = self._entries.popitem(last = False)
+                self._total_bytes -= evicted_bytes
+                self._evictions += 1
+
+    def _prune_disk(self) -> None:
+        """
+        Deletes the least recently used Parquet files from the on-disk tier until the files are within the byte budget.
+        Files are touched whenever they're read, so their modification time is the last time they were used.
+        """
+        disk_files = []
+        for file in os.listdir(self._cache_dir_path):
+            if not file.endswith(".parquet"): continue
+            try:
+                file_stat = os.stat(os.path.join(self._cache_dir_path, file))
+            except FileNotFoundError:
+                continue
+            disk_files.append((file_stat.st_mtime_ns, file_stat.st_size, file))
+        total_disk_bytes = sum(size for _, size, _ in disk_files)
+        for _, size, file in sorted(disk_files):
+            if total_disk_bytes <= self._max_disk_bytes: break
+            try:
+                os.remove(os.path.join(self._cache_dir_path, file))
+            except FileNotFoundError:
+                pass
+            total_disk_bytes -= size
+            with self._lock: self._disk_evictions += 1
+
+    # -------------------------------------------------- Public Class Properties & Methods --------------------------------------------------
+    @classmethod
+    def get_instance(cls) -> "TimeSeriesCache":
+        """
+        Returns the process-wide instance of the TimeSeriesCache class, which is created the first time it's needed.
+        """
+        with cls._instance_lock:
+            if cls._instance is None: cls._instance = cls()
+            return cls._instance
+
+    @staticmethod
+    def make_key(data_file_path: str, transect_points: list[list[float]], transect_crs: any, buffer: float | None, settings: dict = {}) -> str:
+        """
+        Returns the key of the extraction of data along the given transect from the current version of the given data file.
+
+        Args:
+            data_file_path (str): Path to the data file that the data was extracted from
+            transect_points (list[list[float]]): List of coordinates for each of the transect's points
+            transect_crs (any): Coordinate reference system (cartopy or pyproj) of the transect
+            buffer (float or None): Buffer/search radius around the transect that was used for extracting the data
+            settings (dict): Any other settings that change the extracted data (e.g. how distances are measured)
+        """
+        key_info = [
+            os.path.abspath(data_file_path),
+            SharedDatasetCache.get_modified_time(data_file_path),
+            [[round(float(coord), 6) for coord in point[:2]] for point in transect_points],
+            transect_crs.to_wkt() if hasattr(transect_crs, "to_wkt") else str(transect_crs),
+            buffer,
+            sorted(settings.items())
+        ]
+        return hashlib.sha256(json.dumps(key_info).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> tuple[pd.DataFrame | None, str] | None:
+        """
+        Returns a tuple containing the extracted dataframe (which is None if no data was extracted) and the name of its y-axis column for the given key.
+        Returns None if the extraction isn't cached in memory or on disk.
+
+        Args:
+            key (str): Key of the extraction, which is created by make_key()
+        """
+        with self._lock:
+            if key in self._entries:
+                self._memory_hits += 1
+                self._entries.move_to_end(key)
+                dataframe, y_axis_col, _ = self._entries[key]
+                return (None if dataframe is None else dataframe.copy(deep = False)), y_axis_col
+        disk_path = self._get_disk_path(key)
+        if (disk_path is not None) and os.path.exists(disk_path):
+            table = pq.read_table(disk_path)
+            # Mark the file as recently used so that it's deleted last when the on-disk tier is pruned.
+            os.utime(disk_path)
+            y_axis_col = table.schema.metadata[self._y_axis_col_metadata_key].decode("utf-8")
+            dataframe = table.to_pandas()
+            with self._lock: self._disk_hits += 1
+            self._add_to_memory(key, dataframe, y_axis_col)
+            return dataframe.copy(deep = False), y_axis_col
+        with self._lock: self._misses += 1
+        return None
+
+    def put(self, key: str, dataframe: pd.DataFrame | None, y_axis_col: str) -> None:
+        """
+        Caches the given extraction in memory, and saves it on disk if the on-disk tier is enabled and data was extracted.
+        Saving on disk deletes the least recently used files if the on-disk tier's byte budget is exceeded.
+
+        Args:
+            key (str): Key of the extraction, which is created by make_key()
+            dataframe (pandas.DataFrame or None): Extracted data, or None if no data was extracted
+            y_axis_col (str): Name of the column with the time-series' y-axis values
+        """
+        self._add_to_memory(key, dataframe, y_axis_col)
+        disk_path = self._get_disk_path(key)
+        if (disk_path is not None) and (dataframe is not None):
+            os.makedirs(self._cache_dir_path, exist_ok = True)
+            table = pa.Table.from_pandas(dataframe, preserve_index = False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), self._y_axis_col_metadata_key: y_axis_col.encode("utf-8")})
+            # Write to a temporary file first so that other processes never read a partially written file.
+            temp_path = "{}.{}.tmp".format(disk_path, threading.get_ident())
+            pq.write_table(table, temp_path)
+            os.replace(temp_path, disk_path)
+            self._prune_disk()
+
+    def clear(self) -> None:
+        """
+        Removes all extractions kept in memory (extractions saved on disk are kept).
+        """
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def cache_dir_path(self) -> str | None:
+        """
+        Returns the path to the directory of the on-disk tier, or None if the on-disk tier is disabled.
+        """
+        return self._cache_dir_path
+
+    @cache_dir_path.setter
+    def cache_dir_path(self, new_cache_dir_path: str | None) -> None:
+        """
+        Sets the directory of the on-disk tier.
+
+        Args:
+            new_cache_dir_path (str or None): Path to the directory where extracted data is saved as Parquet files, or None to disable the on-disk tier
+        """
+        self._cache_dir_path = new_cache_dir_path
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns a dictionary containing the cache's memory hit, disk hit, miss, and eviction counters, as well as the in-memory tier's current and maximum size.
+        """
+        with self._lock:
+            return {
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "disk_evictions": self._disk_evictions,
+                "entries": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self._max_bytes
+            }
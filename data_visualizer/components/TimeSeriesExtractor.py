@@ -0,0 +1,179 @@
+# Standard library imports
+import os
+
+# External dependencies imports
+import geopandas as gpd
+import pandas as pd
+import numpy as np
+import cartopy.crs as ccrs
+from shapely.geometry import LineString
+from pyproj import Transformer
+from .TransectSampler import TransectSampler
+from .GeoParquetReader import GeoParquetReader
+
+### TimeSeriesExtractor is used for extracting data collected along a transect from a data file, and can be sent to a thread or process pool since it doesn't depend on any session's state. ###
+class TimeSeriesExtractor:
+    # -------------------------------------------------- Class Properties --------------------------------------------------
+    # The following class properties are the time-series settings shared by PopupModal and utils/precompute_time_series.py, so that precomputed time-series match the app's time-series.
+    # dist_col_name = name of the column that stores the x-axis values (distance from shore) for the time-series plot
+    dist_col_name = "Across-Shore Distance (m)"
+    # default_y_axis_data_col_name = default name of the column that stores the y-axis values for the time-series plot (default is often used for data in ASCII grid files)
+    default_y_axis_data_col_name = "Elevation (m)"
+    # distance_measurements = methods for measuring each data point's distance on the time-series' x-axis, where the first method is the default
+    distance_measurements = ["Distance from Start Point", "Distance Along Transect"]
+    # raster_sampling_methods = methods for sampling GeoTIFFs along a transect without a buffer, where the first method is the default
+    raster_sampling_methods = ["nearest", "bilinear"]
+
+    # -------------------------------------------------- Constructor --------------------------------------------------
+    def __init__(
+        self, dist_col_name: str, default_y_axis_data_col_name: str, all_data_cols: list[str], default_crs: ccrs,
+        distance_measurement: str = distance_measurements[0], raster_sampling_method: str = raster_sampling_methods[0]
+    ) -> None:
+        """
+        Creates a new instance of the TimeSeriesExtractor class with its instance variables.
+
+        Args:
+            dist_col_name (str): Name of the column that stores the x-axis values (distance from shore) for the time-series plot
+            default_y_axis_data_col_name (str): Name of the column that stores the y-axis values for data files without a data column (e.g. GeoTIFFs)
+            all_data_cols (list[str]): List of column names that could be used for the time-series plot's y-axis values
+            default_crs (cartopy.crs): Coordinate reference system assigned to GeoJSON files without a CRS
+            distance_measurement (str): Either "Distance from Start Point" or "Distance Along Transect", which determines how each data point's distance is measured
+            raster_sampling_method (str): Either "nearest" or "bilinear", which determines how GeoTIFFs are sampled along a transect without a buffer
+        """
+        # -------------------------------------------------- Constants --------------------------------------------------
+        self._dist_col_name = dist_col_name
+        self._default_y_axis_data_col_name = default_y_axis_data_col_name
+        self._all_data_cols = all_data_cols
+        self._default_crs = default_crs
+        self._distance_measurement = distance_measurement
+        self._raster_sampling_method = raster_sampling_method
+
+    # -------------------------------------------------- Private Class Methods --------------------------------------------------
+    def _get_data_col_name(self, possible_data_cols: list[str]) -> str:
+        """
+        Gets the column name that exists in _all_data_cols, which is a list of column names provided by the user
+        (any column in _all_data_cols could be used for the time-series plot's y-axis values).
+
+        Args:
+            possible_data_cols (list[str]): List of all column names in a time-series data file
+        """
+        for col in possible_data_cols:
+            if col in self._all_data_cols: return col
+        return self._default_y_axis_data_col_name
+
+    def _get_distances(self, transect_sampler: TransectSampler, x_coords: np.ndarray, y_coords: np.ndarray) -> np.ndarray:
+        """
+        Returns each data point's distance for the time-series' x-axis, measured with the selected distance measurement.
+
+        Args:
+            transect_sampler (TransectSampler): Sampler for the transect that the data was extracted along
+            x_coords (np.ndarray): Array of x, longitude, or easting values of the data points
+            y_coords (np.ndarray): Array of y, latitude, or northing values of the data points
+        """
+        if self._distance_measurement == "Distance Along Transect": return transect_sampler.get_chainages(x_coords, y_coords)
+        return transect_sampler.get_distances_from_start(x_coords, y_coords)
+
+    # -------------------------------------------------- Public Class Properties & Methods --------------------------------------------------
+    def extract(
+        self, data_file_path: str, transect_points: list[list[float]], long_col_name: str, lat_col_name: str, transect_crs: ccrs, buffer: float | None = None
+    ) -> tuple[pd.DataFrame | None, str]:
+        """
+        Gets all data that was collected along the given transect and returns a tuple containing that data as a dataframe and the name of the column with the time-series' y-axis values.
+        The dataframe is None if no data could be extracted with the given transect.
+
+        Args:
+            data_file_path (str): Path to the file containing data to extract for the time-series plot
+            transect_points (list[list[float]]): List of coordinates for the transect's start (first item/list) and end (second item/list) points
+                ^ [
+                    [start point's longitude/easting, start point's latitude/northing],
+                    [end point's longitude/easting, end point's latitude/northing]
+                ]
+            long_col_name (str): Name of the column containing the longitude/easting of each data point
+            lat_col_name (str): Name of the column containing the latitude/northing of each data point
+            transect_crs (cartopy.crs): Coordinate reference system of the given transect
+            buffer (float or None): Buffer/search radius around the transect, or None to use the default buffer for the data file's format (0 for GeoTIFFs, 3 otherwise)
+        """
+        _, data_file = os.path.split(data_file_path)
+        _, extension = os.path.splitext(data_file)
+        extension = extension.lower()
+        transect_sampler = TransectSampler(transect_points)
+        if extension in [".tif", ".tiff"]:
+            # Sample only the raster window under the transect instead of clipping the whole raster.
+            sampled_data = transect_sampler.sample_raster(
+                raster_path = data_file_path,
+                buffer = 0 if buffer is None else buffer,
+                method = self._raster_sampling_method
+            )
+            # Set name of the column with time-series' y-axis values to the default value because ASCII grid files don't have data columns.
+            y_axis_data_col_name = self._default_y_axis_data_col_name
+            # Given transect doesn't overlap data file, so return None early since there wouldn't be any sampled data.
+            if (sampled_data is None) or (len(sampled_data[2]) == 0): return None, y_axis_data_col_name
+            x_coords, y_coords, data_vals = sampled_data
+            # Calculate each point's distance from the transect's start point.
+            clipped_data_dataframe = pd.DataFrame(
+                data = {
+                    lat_col_name: y_coords,
+                    long_col_name: x_coords,
+                    y_axis_data_col_name: data_vals,
+                    self._dist_col_name: self._get_distances(transect_sampler, x_coords, y_coords)
+                }
+            ).sort_values(by = self._dist_col_name).reset_index(drop = True)
+            return clipped_data_dataframe, y_axis_data_col_name
+        elif extension == ".geojson":
+            data_geodataframe = gpd.read_file(filename = data_file_path)
+            # Reproject the data file to match the transect's projection, if necessary.
+            if data_geodataframe.crs is None: data_geodataframe = data_geodataframe.set_crs(crs = self._default_crs)
+            data_crs = ccrs.CRS(data_geodataframe.crs)
+            if not data_crs.is_exact_same(transect_crs): data_geodataframe = data_geodataframe.to_crs(crs = transect_crs)
+            # Add buffer/padding to the clicked transect, which is created with the given transect's start and end point coordinates.
+            # ^ Buffer allows data points within a certain distance from the clicked transect to be included in the time-series (since it's rare for data points to lie exactly on a transect).
+            padded_transect = LineString(transect_points).buffer(3 if buffer is None else buffer, cap_style = 2)
+            # Create GeoDataFrame for the padded transect.
+            clicked_transect_geodataframe = gpd.GeoDataFrame(
+                data = {"geometry": [padded_transect]},
+                geometry = "geometry",
+                crs = transect_crs
+            )
+            # Clip data collected along the clicked transect from the given data file.
+            clipped_geodataframe = data_geodataframe.clip(mask = clicked_transect_geodataframe)
+            # Given transect doesn't overlap data file, so return None early since the clipped geodataframe would be empty.
+            if clipped_geodataframe.empty: return None, self._default_y_axis_data_col_name
+            # Calculate each point's distance along the x-axis of the time-series.
+            clipped_geodataframe.insert(
+                loc = len(clipped_geodataframe.columns),
+                column = self._dist_col_name,
+                value = self._get_distances(transect_sampler, clipped_geodataframe.geometry.x.to_numpy(), clipped_geodataframe.geometry.y.to_numpy())
+            )
+            # Convert clipped data into a DataFrame for easier plotting.
+            clipped_data_dataframe = clipped_geodataframe.drop(columns = "geometry").sort_values(by = self._dist_col_name).reset_index(drop = True)
+            # Get name of the column with time-series' y-axis values.
+            return clipped_data_dataframe, self._get_data_col_name(list(clipped_data_dataframe.columns))
+        elif extension in [".parq", ".parquet"]:
+            parquet_reader = GeoParquetReader(data_file_path)
+            # Add buffer/padding to the clicked transect, which is created with the given transect's start and end point coordinates.
+            # ^ Buffer allows data points within a certain distance from the clicked transect to be included in the time-series (since it's rare for data points to lie exactly on a transect).
+            padded_transect = LineString(transect_points).buffer(3 if buffer is None else buffer, cap_style = 2)
+            # Read only the partitions and points within the padded transect's bounding box (in the data file's CRS).
+            is_same_crs = parquet_reader.crs.equals(transect_crs)
+            padded_transect_bbox = padded_transect.bounds
+            if not is_same_crs:
+                padded_transect_bbox = Transformer.from_crs(crs_from = transect_crs, crs_to = parquet_reader.crs, always_xy = True).transform_bounds(*padded_transect_bbox)
+            candidate_geodataframe = parquet_reader.read(bbox = padded_transect_bbox)
+            # Given transect doesn't overlap data file, so return None early since there wouldn't be any clipped data.
+            if candidate_geodataframe.empty: return None, self._default_y_axis_data_col_name
+            # Reproject only the candidate points to match the transect's projection, if necessary.
+            if not is_same_crs: candidate_geodataframe = candidate_geodataframe.to_crs(crs = transect_crs)
+            # Clip data collected along the clicked transect from the candidate points with their spatial index.
+            clipped_indices = np.sort(candidate_geodataframe.sindex.query(padded_transect, predicate = "intersects"))
+            clipped_geodataframe = candidate_geodataframe.iloc[clipped_indices]
+            if clipped_geodataframe.empty: return None, self._default_y_axis_data_col_name
+            # Calculate each point's distance along the x-axis of the time-series.
+            clipped_geodataframe = clipped_geodataframe.assign(**{
+                self._dist_col_name: self._get_distances(transect_sampler, clipped_geodataframe.geometry.x.to_numpy(), clipped_geodataframe.geometry.y.to_numpy())
+            })
+            clipped_data_dataframe = pd.DataFrame(clipped_geodataframe.drop(columns = parquet_reader.geometry_col)).sort_values(by = self._dist_col_name).reset_index(drop = True)
+            # Get name of the column with time-series' y-axis values.
+            return clipped_data_dataframe, self._get_data_col_name(list(clipped_data_dataframe.columns))
+        # Return None if there's currently no implementation to extract data from the data file yet.
+        print("Error extracting data along a transect from", data_file, ":", "Files with the", extension, "file format are not supported yet.")
+        return None, self._default_y_axis_data_col_name
@@ -0,0 +1,175 @@
+# Standard library imports
+import os
+import json
+import hashlib
+import threading
+from collections import Counter
+
+# External dependencies imports
+import pandas as pd
+from .SharedDatasetCache import SharedDatasetCache
+
+### TimeSeriesStore is used for reading and writing time-series data that was precomputed for every predefined transect of a collection (see utils/precompute_time_series.py). ###
+class TimeSeriesStore:
+    # -------------------------------------------------- Constructor --------------------------------------------------
+    def __init__(self, collection_dir_path: str, transect_id_col_name: str = "Transect ID") -> None:
+        """
+        Creates a new instance of the TimeSeriesStore class with its instance variables.
+
+        Args:
+            collection_dir_path (str): Path to the collection's directory, which contains the time-series store's directory
+            transect_id_col_name (str): Name of the column containing the ID of the transect that each row of precomputed data was extracted along
+        """
+        # -------------------------------------------------- Constants --------------------------------------------------
+        # _store_dir_name = name of the collection's subdirectory containing the precomputed time-series data
+        # ^ should be same as `_time_series_store_folder_name` in DataMap.py
+        self._store_dir_name = "time_series_store"
+        # _manifest_name = name of the JSON file that describes which data files, buffers, and settings were used for the precomputed time-series data
+        self._manifest_name = "manifest.json"
+        self._store_dir_path = os.path.join(collection_dir_path, self._store_dir_name)
+        self._manifest_path = os.path.join(self._store_dir_path, self._manifest_name)
+        self._transect_id_col_name = transect_id_col_name
+
+        # -------------------------------------------------- Internal Class Properties --------------------------------------------------
+        # _lock = lock that guards the loaded manifest, which is shared by the threads extracting time-series data
+        self._lock = threading.Lock()
+        # _manifest = dictionary containing the loaded manifest, and _manifest_modified_time = modification time of the manifest file when it was loaded
+        self._manifest = None
+        self._manifest_modified_time = None
+        # _fallback_counts = counter mapping each reason (key) for not using precomputed data to the number of lookups that fell back to extracting data for that reason (value)
+        self._fallback_counts = Counter()
+        # _reported_fallbacks = set of (transect file, data file, reason) tuples that were already reported, so that each stale precomputed time-series is only reported once
+        self._reported_fallbacks = set()
+
+    # -------------------------------------------------- Private Class Methods --------------------------------------------------
+    def _load_manifest(self) -> dict:
+        """
+        Returns the store's manifest, which is reloaded whenever the manifest file changes (e.g. after precomputing time-series data again).
+        Returns an empty manifest if no time-series data was precomputed for the collection.
+        """
+        if not os.path.exists(self._manifest_path): return {"settings": {}, "transect_files": {}}
+        modified_time = os.stat(self._manifest_path).st_mtime_ns
+        with self._lock:
+            if modified_time != self._manifest_modified_time:
+                with open(self._manifest_path) as manifest_file: self._manifest = json.load(manifest_file)
+                self._manifest_modified_time = modified_time
+            return self._manifest
+
+    def _fall_back(self, transect_file: str, data_file_path: str, reason: str) -> None:
+        """
+        Counts a lookup that can't use the precomputed data, and reports the first lookup for each transect file, data file, and reason that means utils/precompute_time_series.py should be run again.
+
+        Args:
+            transect_file (str): Name of the transect file containing the transect
+            data_file_path (str): Path to the data file that the data was extracted from
+            reason (str): Either "settings" or "buffer" (the user chose different settings than the precomputed ones) or "modified_time" (the data file changed after the data was precomputed)
+        """
+        with self._lock:
+            self._fallback_counts[reason] += 1
+            if (reason != "modified_time") or ((transect_file, data_file_path, reason) in self._reported_fallbacks): return
+            self._reported_fallbacks.add((transect_file, data_file_path, reason))
+        print("Precomputed time-series for {} along {} weren't used: the data file changed after they were extracted.".format(data_file_path, transect_file))
+
+    # -------------------------------------------------- Public Class Properties & Methods --------------------------------------------------
+    @staticmethod
+    def get_settings(long_col_name: str, lat_col_name: str, data_cols: list[str], distance_measurement: str, raster_sampling_method: str) -> dict:
+        """
+        Returns the settings that change the extracted data, which must be the same for the precomputed data and the app's time-series.
+
+        Args:
+            long_col_name (str): Name of the column containing the longitude/easting of each transect point
+            lat_col_name (str): Name of the column containing the latitude/northing of each transect point
+            data_cols (list[str]): Names of columns containing data for the collection's time-series
+            distance_measurement (str): Either "Distance from Start Point" or "Distance Along Transect"
+            raster_sampling_method (str): Either "nearest" or "bilinear"
+        """
+        return {
+            "columns": [long_col_name, lat_col_name, *data_cols],
+            "distance_measurement": distance_measurement,
+            "raster_sampling_method": raster_sampling_method
+        }
+
+    def get(self, transect_file: str, transect_id: any, data_file_path: str, buffer: float | None, settings: dict) -> tuple[pd.DataFrame | None, str] | None:
+        """
+        Returns a tuple containing the precomputed dataframe (which is None if no data was collected along the transect) and the name of its y-axis column.
+        Returns None if the data wasn't precomputed with the current version of the data file, the given buffer, and the given settings, so it must be extracted instead.
+
+        Args:
+            transect_file (str): Name of the transect file containing the transect
+            transect_id (any): ID of the transect
+            data_file_path (str): Path to the data file that the data was extracted from
+            buffer (float or None): Buffer/search radius around the transect that the data should be extracted with
+            settings (dict): Any other settings that change the extracted data (e.g. how distances are measured)
+        """
+        manifest = self._load_manifest()
+        entry = manifest["transect_files"].get(transect_file, {}).get(data_file_path, None)
+        if entry is None: return None
+        # Count why existing precomputed data is ignored, and report a changed data file since utils/precompute_time_series.py should be run again.
+        if manifest["settings"] != json.loads(json.dumps(settings)):
+            self._fall_back(transect_file, data_file_path, "settings")
+            return None
+        if entry["buffer"] != buffer:
+            self._fall_back(transect_file, data_file_path, "buffer")
+            return None
+        if (not os.path.exists(data_file_path)) or (SharedDatasetCache.get_modified_time(data_file_path) != entry["modified_time"]):
+            self._fall_back(transect_file, data_file_path, "modified_time")
+            return None
+        store_file_path = os.path.join(self._store_dir_path, entry["store_file"])
+        if not os.path.exists(store_file_path): return None
+        dataframe = pd.read_parquet(store_file_path, filters = [(self._transect_id_col_name, "==", transect_id)])
+        if dataframe.empty: return None, entry["y_axis_col"]
+        return dataframe.drop(columns = self._transect_id_col_name).reset_index(drop = True), entry["y_axis_col"]
+
+    def write_profiles(self, transect_file: str, data_file_path: str, dataframe: pd.DataFrame, buffer: float | None, y_axis_col: str) -> dict:
+        """
+        Saves the data extracted along every transect of a transect file from a data file, and returns the data file's manifest entry.
+        The manifest itself isn't changed, so this can be called by several processes at the same time before save_manifest() is called once with all the entries.
+
+        Args:
+            transect_file (str): Name of the transect file containing the transects
+            data_file_path (str): Path to the data file that the data was extracted from
+            dataframe (pandas.DataFrame): Extracted data for all transects, which has a column containing each row's transect ID
+            buffer (float or None): Buffer/search radius around the transects that the data was extracted with
+            y_axis_col (str): Name of the column with the time-series' y-axis values
+        """
+        transect_file_name, _ = os.path.splitext(transect_file)
+        store_file = os.path.join(transect_file_name, hashlib.sha1(data_file_path.encode("utf-8")).hexdigest()[:16] + ".parquet")
+        store_file_path = os.path.join(self._store_dir_path, store_file)
+        os.makedirs(os.path.dirname(store_file_path), exist_ok = True)
+        # Sort rows by transect so that reading one transect only reads the row groups containing it.
+        dataframe = dataframe.sort_values(by = self._transect_id_col_name, kind = "stable").reset_index(drop = True)
+        temp_path = store_file_path + ".tmp"
+        dataframe.to_parquet(temp_path, index = False, row_group_size = 10000)
+        os.replace(temp_path, store_file_path)
+        return {
+            "store_file": store_file,
+            "buffer": buffer,
+            "modified_time": SharedDatasetCache.get_modified_time(data_file_path),
+            "y_axis_col": y_axis_col
+        }
+
+    def save_manifest(self, entries: dict, settings: dict) -> None:
+        """
+        Saves the manifest describing the precomputed time-series data, keeping entries of transect files and data files that weren't precomputed again.
+
+        Args:
+            entries (dict): Dictionary mapping each transect file's name (key) to a dictionary (value) mapping each data file's path to its manifest entry from write_profiles()
+            settings (dict): Settings that the time-series data was extracted with
+        """
+        manifest = self._load_manifest()
+        # Entries that were extracted with different settings are outdated.
+        transect_files = manifest["transect_files"] if manifest["settings"] == json.loads(json.dumps(settings)) else {}
+        for transect_file, data_file_entries in entries.items():
+            transect_files.setdefault(transect_file, {}).update(data_file_entries)
+        os.makedirs(self._store_dir_path, exist_ok = True)
+        temp_path = self._manifest_path + ".tmp"
+        with open(temp_path, "w") as manifest_file:
+            json.dump({"settings": settings, "transect_files": transect_files}, manifest_file, indent = 4)
+        os.replace(temp_path, self._manifest_path)
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns a dictionary mapping each reason ("settings", "buffer", or "modified_time") to the number of lookups that couldn't use the precomputed data for that reason.
+        """
+        with self._lock: return dict(self._fallback_counts)
@@ -0,0 +1,99 @@
+# Standard library imports
+import os
+import sys
+
+# External dependencies imports
+import geopandas as gpd
+import dask_geopandas
+import cartopy.crs as ccrs
+import numpy as np
+
+### TransectIndex is used for quickly looking up the ID and coordinates of a transect that was clicked on the map. ###
+class TransectIndex:
+    # -------------------------------------------------- Class Properties --------------------------------------------------
+    # longitude_col_name and latitude_col_name = names of the columns containing the easting and northing of a clicked transect's points, which are also part of the precomputed time-series' settings
+    longitude_col_name = "Easting (meters)"
+    latitude_col_name = "Northing (meters)"
+
+    # -------------------------------------------------- Constructor --------------------------------------------------
+    def __init__(self, file_path: str, collection_crs: ccrs.CRS, transect_id_col_name: str) -> None:
+        """
+        Creates a new instance of the TransectIndex class by reading all transects from the given file once.
+
+        Args:
+            file_path (str): Path to the GeoJSON file or Parquet directory containing transects
+            collection_crs (cartopy.crs.CRS): Coordinate reference system of the selected collection, which is used for transects without a projected CRS
+            transect_id_col_name (str): Name of the column containing the ID of each transect
+        """
+        # Read the transect file.
+        if file_path.endswith(".geojson"): transect_file_geodataframe = gpd.read_file(filename = file_path)
+        else: transect_file_geodataframe = dask_geopandas.read_parquet(file_path).compute()
+        # Transform the transects' coordinates into a CRS with meters as a unit.
+        transect_crs, transect_geodataframe_crs = collection_crs, transect_file_geodataframe.crs
+        if transect_geodataframe_crs is not None:
+            geojson_epsg_code = ccrs.CRS(transect_geodataframe_crs).to_epsg()
+            if geojson_epsg_code == 4326: transect_file_geodataframe = transect_file_geodataframe.to_crs(crs = collection_crs)
+            else: transect_crs = ccrs.epsg(geojson_epsg_code)
+
+        # -------------------------------------------------- Internal Class Properties --------------------------------------------------
+        # _file_name = name of the file containing the indexed transects
+        self._file_name = os.path.basename(file_path)
+        # _crs = coordinate reference system of the indexed transects' coordinates
+        self._crs = transect_crs
+        # _ids = array containing the ID of each transect, in the same order as the transects/paths in the file's plot
+        self._ids = transect_file_geodataframe[transect_id_col_name].to_numpy()
+        # _coordinates = list of arrays containing the (easting, northing) coordinates of each transect's points, in the same order as the transects/paths in the file's plot
+        self._coordinates = [np.asarray(transect.coords)[:, :2] for transect in transect_file_geodataframe.geometry]
+        # _id_to_plot_index = dictionary mapping each transect's ID (key) to the index (value) of the first transect with that ID
+        self._id_to_plot_index = {}
+        for plot_index, transect_id in enumerate(self._ids.tolist()):
+            self._id_to_plot_index.setdefault(transect_id, plot_index)
+
+    # -------------------------------------------------- Public Class Properties & Methods --------------------------------------------------
+    def get_id(self, plot_index: int) -> any:
+        """
+        Returns the ID of the transect at the given index of the file's plot.
+
+        Args:
+            plot_index (int): Index of a clicked transect/path in the file's plot
+        """
+        return self._ids[plot_index].item() if hasattr(self._ids[plot_index], "item") else self._ids[plot_index]
+
+    def get_coordinates(self, transect_id: any) -> np.ndarray:
+        """
+        Returns an array of shape (number of points, 2) containing the easting and northing of each point in the transect with the given ID.
+
+        Args:
+            transect_id (any): ID of the transect
+        """
+        return self._coordinates[self._id_to_plot_index[transect_id]]
+
+    @property
+    def crs(self) -> ccrs.CRS:
+        """
+        Returns the coordinate reference system of the indexed transects' coordinates.
+        """
+        return self._crs
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns the number of bytes used by the indexed transects' IDs and coordinates, which is used for sizing the index in the shared dataset cache.
+        """
+        return int(
+            self._ids.nbytes + sum(coordinates.nbytes for coordinates in self._coordinates) +
+            sys.getsizeof(self._coordinates) + sys.getsizeof(self._id_to_plot_index)
+        )
+
+    @property
+    def file_name(self) -> str:
+        """
+        Returns the name of the file containing the indexed transects.
+        """
+        return self._file_name
+
+    def __len__(self) -> int:
+        """
+        Returns the number of indexed transects.
+        """
+        return len(self._ids)
@@ -0,0 +1,189 @@
+# Standard library imports
+
+# External dependencies imports
+import numpy as np
+import rasterio
+from rasterio.windows import Window, from_bounds
+
+### TransectSampler is used for finding and sampling data along a transect with vectorized NumPy operations instead of shapely geometries. ###
+class TransectSampler:
+    # -------------------------------------------------- Constructor --------------------------------------------------
+    def __init__(self, transect_points: list[list[float]]) -> None:
+        """
+        Creates a new instance of the TransectSampler class with its instance variables.
+
+        Args:
+            transect_points (list[list[float]]): List of coordinates for each of the transect's points, from its start point to its end point
+                ^ [[start point's longitude/easting, start point's latitude/northing], ..., [end point's longitude/easting, end point's latitude/northing]]
+        """
+        # -------------------------------------------------- Constants --------------------------------------------------
+        # _vertices = array of shape (number of transect points, 2) containing the transect's points
+        self._vertices = np.asarray(transect_points, dtype = float)[:, :2]
+        # _segment_starts, _segment_vectors = arrays containing the start point and the direction (end point - start point) of each of the transect's line segments
+        self._segment_starts = self._vertices[:-1]
+        self._segment_vectors = np.diff(self._vertices, axis = 0)
+        # _segment_lengths = array containing the length of each line segment
+        self._segment_lengths = np.hypot(self._segment_vectors[:, 0], self._segment_vectors[:, 1])
+
+    # -------------------------------------------------- Private Class Methods --------------------------------------------------
+    def _project_onto_segment(self, segment_index: int, x_coords: np.ndarray, y_coords: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns a tuple containing each point's position along the given line segment (0 at the segment's start, 1 at its end, and outside [0, 1] beyond the segment)
+        and each point's distance from the closest point on the segment.
+
+        Args:
+            segment_index (int): Index of the transect's line segment
+            x_coords (np.ndarray): Array of x, longitude, or easting values of the points
+            y_coords (np.ndarray): Array of y, latitude, or northing values of the points
+        """
+        start_x, start_y = self._segment_starts[segment_index]
+        vector_x, vector_y = self._segment_vectors[segment_index]
+        squared_length = (self._segment_lengths[segment_index] ** 2) or 1.0
+        positions = ((x_coords - start_x) * vector_x + (y_coords - start_y) * vector_y) / squared_length
+        clipped_positions = np.clip(positions, 0, 1)
+        distances = np.hypot(x_coords - (start_x + clipped_positions * vector_x), y_coords - (start_y + clipped_positions * vector_y))
+        return positions, distances
+
+    # -------------------------------------------------- Public Class Properties & Methods --------------------------------------------------
+    def get_bounds(self, buffer: float = 0) -> tuple[float]:
+        """
+        Returns the bounding box (minx, miny, maxx, maxy) of the transect padded by the given buffer.
+
+        Args:
+            buffer (float): Distance to pad the transect's bounding box by
+        """
+        min_x, min_y = self._vertices.min(axis = 0) - buffer
+        max_x, max_y = self._vertices.max(axis = 0) + buffer
+        return (min_x, min_y, max_x, max_y)
+
+    def get_buffer_mask(self, x_coords: np.ndarray, y_coords: np.ndarray, buffer: float) -> np.ndarray:
+        """
+        Returns a boolean array indicating which points lie within the given buffer of the transect.
+        Matches a shapely buffer with flat end caps (cap_style = 2), so points beyond the transect's start and end points aren't included.
+
+        Args:
+            x_coords (np.ndarray): Array of x, longitude, or easting values of the points
+            y_coords (np.ndarray): Array of y, latitude, or northing values of the points
+            buffer (float): Maximum distance from the transect
+        """
+        x_coords, y_coords = np.asarray(x_coords, dtype = float), np.asarray(y_coords, dtype = float)
+        within_buffer = np.zeros(x_coords.shape, dtype = bool)
+        for segment_index in range(len(self._segment_lengths)):
+            positions, distances = self._project_onto_segment(segment_index, x_coords, y_coords)
+            within_buffer |= (positions >= 0) & (positions <= 1) & (distances <= buffer)
+        # Include the rounded corners around the transect's middle points.
+        for vertex_x, vertex_y in self._vertices[1:-1]:
+            within_buffer |= np.hypot(x_coords - vertex_x, y_coords - vertex_y) <= buffer
+        return within_buffer
+
+    def get_distances_from_start(self, x_coords: np.ndarray, y_coords: np.ndarray) -> np.ndarray:
+        """
+        Returns the straight-line distance between each point and the transect's start point.
+
+        Args:
+            x_coords (np.ndarray): Array of x, longitude, or easting values of the points
+            y_coords (np.ndarray): Array of y, latitude, or northing values of the points
+        """
+        start_x, start_y = self._vertices[0]
+        return np.hypot(np.asarray(x_coords, dtype = float) - start_x, np.asarray(y_coords, dtype = float) - start_y)
+
+    def get_chainages(self, x_coords: np.ndarray, y_coords: np.ndarray) -> np.ndarray:
+        """
+        Returns the distance along the transect (from its start point) of each point's projection onto the closest line segment of the transect.
+        Unlike the distance from the start point, this distance keeps increasing along bent transects with several line segments.
+
+        Args:
+            x_coords (np.ndarray): Array of x, longitude, or easting values of the points
+            y_coords (np.ndarray): Array of y, latitude, or northing values of the points
+        """
+        x_coords, y_coords = np.asarray(x_coords, dtype = float), np.asarray(y_coords, dtype = float)
+        segment_start_chainages = np.concatenate([[0], np.cumsum(self._segment_lengths)[:-1]])
+        closest_distances = np.full(x_coords.shape, np.inf)
+        chainages = np.zeros(x_coords.shape)
+        for segment_index, segment_length in enumerate(self._segment_lengths):
+            positions, distances = self._project_onto_segment(segment_index, x_coords, y_coords)
+            is_closer = distances < closest_distances
+            closest_distances[is_closer] = distances[is_closer]
+            chainages[is_closer] = segment_start_chainages[segment_index] + np.clip(positions[is_closer], 0, 1) * segment_length
+        return chainages
+
+    def get_sample_points(self, spacing: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns a tuple containing arrays of x and y coordinates for points placed along the transect every `spacing` units, including each of the transect's points.
+
+        Args:
+            spacing (float): Distance between consecutive sample points
+        """
+        x_samples, y_samples = [], []
+        for segment_index, segment_length in enumerate(self._segment_lengths):
+            num_samples = max(int(np.ceil(segment_length / spacing)), 1)
+            positions = np.linspace(0, 1, num_samples, endpoint = False)
+            x_samples.append(self._segment_starts[segment_index, 0] + positions * self._segment_vectors[segment_index, 0])
+            y_samples.append(self._segment_starts[segment_index, 1] + positions * self._segment_vectors[segment_index, 1])
+        x_samples.append(self._vertices[-1:, 0])
+        y_samples.append(self._vertices[-1:, 1])
+        return np.concatenate(x_samples), np.concatenate(y_samples)
+
+    def sample_raster(self, raster_path: str, buffer: float = 0, method: str = "nearest") -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """
+        Reads only the raster window under the transect and returns a tuple containing arrays of x coordinates, y coordinates, and values sampled along the transect.
+        Returns None if the transect doesn't overlap the raster.
+
+        Args:
+            raster_path (str): Path to the GeoTIFF file, which has the same CRS as the transect
+            buffer (float): Distance around the transect whose pixels are collected
+                ^ when 0, the raster is sampled along the transect at pixel spacing instead
+            method (str): Either "nearest" (values and coordinates of the pixels under each sample point) or "bilinear" (values interpolated at each sample point),
+                which is only used when the buffer is 0
+        """
+        with rasterio.open(raster_path) as dataset:
+            # Read the window covering the transect's (padded) bounding box, plus a pixel on each side for interpolating values.
+            min_x, min_y, max_x, max_y = self.get_bounds(buffer)
+            full_window = Window(0, 0, dataset.width, dataset.height)
+            try:
+                window = from_bounds(min_x, min_y, max_x, max_y, transform = dataset.transform).round_offsets().round_lengths()
+                window = Window(window.col_off - 1, window.row_off - 1, window.width + 2, window.height + 2).intersection(full_window)
+            except rasterio.errors.WindowError:
+                # Given transect doesn't overlap the raster.
+                return None
+            pixels = dataset.read(1, window = window, masked = True).astype("float64").filled(np.nan)
+            transform = dataset.window_transform(window)
+        num_rows, num_cols = pixels.shape
+        pixel_width, pixel_height = transform.a, transform.e
+        if buffer > 0:
+            # Collect every pixel whose center lies within the buffer around the transect.
+            col_x_coords = transform.c + pixel_width * (np.arange(num_cols) + 0.5)
+            row_y_coords = transform.f + pixel_height * (np.arange(num_rows) + 0.5)
+            x_grid, y_grid = np.meshgrid(col_x_coords, row_y_coords)
+            mask = self.get_buffer_mask(x_grid, y_grid, buffer) & np.isfinite(pixels)
+            return x_grid[mask], y_grid[mask], pixels[mask]
+        # Sample the raster along the transect at pixel spacing.
+        x_samples, y_samples = self.get_sample_points(spacing = min(abs(pixel_width), abs(pixel_height)))
+        col_positions = (x_samples - transform.c) / pixel_width
+        row_positions = (y_samples - transform.f) / pixel_height
+        if method == "bilinear":
+            # Interpolate between the four pixel centers surrounding each sample point.
+            col_positions, row_positions = col_positions - 0.5, row_positions - 0.5
+            left_cols, top_rows = np.floor(col_positions).astype(int), np.floor(row_positions).astype(int)
+            within_window = (left_cols >= 0) & (left_cols + 1 < num_cols) & (top_rows >= 0) & (top_rows + 1 < num_rows)
+            left_cols, top_rows = left_cols[within_window], top_rows[within_window]
+            col_weights, row_weights = col_positions[within_window] - left_cols, row_positions[within_window] - top_rows
+            values = (
+                pixels[top_rows, left_cols] * (1 - col_weights) * (1 - row_weights) +
+                pixels[top_rows, left_cols + 1] * col_weights * (1 - row_weights) +
+                pixels[top_rows + 1, left_cols] * (1 - col_weights) * row_weights +
+                pixels[top_rows + 1, left_cols + 1] * col_weights * row_weights
+            )
+            has_value = np.isfinite(values)
+            return x_samples[within_window][has_value], y_samples[within_window][has_value], values[has_value]
+        # Use each pixel under the transect once, with the pixel center as its coordinates.
+        cols, rows = np.floor(col_positions).astype(int), np.floor(row_positions).astype(int)
+        within_window = (cols >= 0) & (cols < num_cols) & (rows >= 0) & (rows < num_rows)
+        pixel_indices = np.unique(rows[within_window] * num_cols + cols[within_window])
+        rows, cols = np.divmod(pixel_indices, num_cols)
+        values = pixels[rows, cols]
+        has_value = np.isfinite(values)
+        rows, cols = rows[has_value], cols[has_value]
+        x_coords = transform.c + pixel_width * (cols + 0.5)
+        y_coords = transform.f + pixel_height * (rows + 0.5)
+        return x_coords, y_coords, values[has_value]
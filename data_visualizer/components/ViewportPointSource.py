@@ -0,0 +1,80 @@
+# Standard library imports
+
+# External dependencies imports
+import geoviews as gv
+import pandas as pd
+import spatialpandas as spd
+from pyproj import Transformer
+from .GeoParquetReader import GeoParquetReader
+from .SharedDatasetCache import SharedDatasetCache
+
+### ViewportPointSource is used for loading only the partitions of a Parquet file that intersect the map's visible extent. ###
+class ViewportPointSource:
+    # -------------------------------------------------- Constructor --------------------------------------------------
+    def __init__(self, parquet_reader: GeoParquetReader, cols: list[str], kdims: list[str], vdims: list[str]) -> None:
+        """
+        Creates a new instance of the ViewportPointSource class with its instance variables.
+
+        Args:
+            parquet_reader (GeoParquetReader): Reader for the Parquet file containing the points
+            cols (list[str]): Names of the columns to read from each partition besides the geometry column
+            kdims (list[str]): Names of the point plot's key dimensions (longitude and latitude)
+            vdims (list[str]): Names of the point plot's value dimensions
+        """
+        # -------------------------------------------------- Constants --------------------------------------------------
+        self._parquet_reader = parquet_reader
+        self._cols = cols
+        self._kdims = kdims
+        self._vdims = vdims
+        # _map_to_data_transformer = transformer for converting the map's Web Mercator coordinates into the Parquet file's CRS
+        self._map_to_data_transformer = Transformer.from_crs(crs_from = "EPSG:3857", crs_to = parquet_reader.crs, always_xy = True)
+
+        # -------------------------------------------------- Internal Class Properties --------------------------------------------------
+        # _num_loaded_partitions = number of partitions used for the most recently loaded point plot
+        self._num_loaded_partitions = 0
+
+    # -------------------------------------------------- Private Class Methods --------------------------------------------------
+    def _read_partition(self, partition_path: str) -> spd.GeoDataFrame:
+        """
+        Reads a partition file as a spatialpandas GeoDataFrame, which is cached for all sessions so that it's reused when the map's extent changes.
+
+        Args:
+            partition_path (str): Path to the partition file
+        """
+        return SharedDatasetCache.get_instance().get(
+            file_path = partition_path,
+            loader = lambda: spd.GeoDataFrame(GeoParquetReader(partition_path).read(columns = self._cols)),
+            variant = "partition:{}".format(",".join(self._cols))
+        )
+
+    # -------------------------------------------------- Public Class Properties & Methods --------------------------------------------------
+    def load(self, x_range: tuple[float] | None = None, y_range: tuple[float] | None = None, visible: bool = True) -> gv.Points:
+        """
+        Returns a point plot containing only the partitions that intersect the map's visible extent.
+        All partitions are used if the map's extent isn't known yet.
+        This method is the callback of a DynamicMap with RangeXY and layer visibility streams.
+
+        Args:
+            x_range (tuple[float] or None): Visible range of the map's x-axis (in Web Mercator)
+            y_range (tuple[float] or None): Visible range of the map's y-axis (in Web Mercator)
+            visible (bool): Whether the points' layer is shown on the map (no partitions are read for hidden layers)
+        """
+        if not visible: return gv.Points([], kdims = self._kdims, vdims = self._vdims)
+        bbox = None
+        if (x_range is not None) and (y_range is not None):
+            bbox = self._map_to_data_transformer.transform_bounds(x_range[0], y_range[0], x_range[1], y_range[1])
+        partition_paths = self._parquet_reader.get_partition_paths(bbox)
+        self._num_loaded_partitions = len(partition_paths)
+        partition_geodataframes = [self._read_partition(path) for path in partition_paths]
+        if partition_geodataframes:
+            geodataframe = pd.concat(partition_geodataframes) if len(partition_geodataframes) > 1 else partition_geodataframes[0]
+        else:
+            geodataframe = spd.GeoDataFrame(self._parquet_reader.read(columns = self._cols, bbox = bbox))
+        return gv.Points(data = geodataframe, kdims = self._kdims, vdims = self._vdims)
+
+    @property
+    def num_loaded_partitions(self) -> int:
+        """
+        Returns the number of partitions used for the most recently loaded point plot.
+        """
+        return self._num_loaded_partitions
@@ -0,0 +1,105 @@
+# Standard library imports
+
+# External dependencies imports
+import geoviews as gv
+import cartopy.crs as ccrs
+import numpy as np
+import rasterio
+from rasterio.windows import from_bounds
+from pyproj import Transformer
+
+### ViewportRasterSource is used for reading only a screen's worth of pixels from the GeoTIFF overview level that matches the map's zoom. ###
+class ViewportRasterSource:
+    # -------------------------------------------------- Constructor --------------------------------------------------
+    def __init__(self, geotiff_path: str, vdim: str, default_plot_size: int = 800) -> None:
+        """
+        Creates a new instance of the ViewportRasterSource class by reading the GeoTIFF's metadata (not its pixels).
+
+        Args:
+            geotiff_path (str): Path to the (cloud optimized) GeoTIFF file
+            vdim (str): Name of the image plot's value dimension
+            default_plot_size (int): Width and height (in screen pixels) used before the map's actual size is known
+        """
+        # -------------------------------------------------- Constants --------------------------------------------------
+        self._geotiff_path = geotiff_path
+        self._vdim = vdim
+        self._default_plot_size = default_plot_size
+        with rasterio.open(geotiff_path) as dataset:
+            # _bounds = bounding box (left, bottom, right, top) of the full-resolution raster in its CRS
+            self._bounds = dataset.bounds
+            # _resolution = width of the full-resolution raster's pixels in its CRS's units
+            self._resolution = abs(dataset.res[0])
+            # _overview_factors = list of decimation factors for each internal overview level (e.g. [2, 4, 8]), which is empty if the GeoTIFF has no overviews
+            self._overview_factors = dataset.overviews(1)
+            raster_crs = dataset.crs
+        # _crs = cartopy version of the raster's CRS, which is used for the image plot
+        # ^ CRSes without an EPSG code are created from their WKT representation, which cartopy passes to pyproj
+        raster_epsg_code = raster_crs.to_epsg()
+        self._crs = ccrs.epsg(raster_epsg_code) if raster_epsg_code is not None else ccrs.CRS(raster_crs.to_wkt())
+        # _map_to_data_transformer = transformer for converting the map's Web Mercator coordinates into the raster's CRS
+        self._map_to_data_transformer = Transformer.from_crs(crs_from = "EPSG:3857", crs_to = raster_crs.to_wkt(), always_xy = True)
+
+    # -------------------------------------------------- Private Class Methods --------------------------------------------------
+    def _select_overview_level(self, pixel_size: float) -> int | None:
+        """
+        Returns the coarsest overview level whose pixels are still at least as small as the given screen pixel size.
+        Returns None if the full-resolution raster should be read.
+
+        Args:
+            pixel_size (float): Size of one screen pixel in the raster's CRS's units
+        """
+        selected_level = None
+        for level, factor in enumerate(self._overview_factors):
+            if self._resolution * factor <= pixel_size: selected_level = level
+        return selected_level
+
+    def _get_view_bounds(self, x_range: tuple[float] | None, y_range: tuple[float] | None) -> tuple[float]:
+        """
+        Returns the bounding box (left, bottom, right, top) of the map's visible extent in the raster's CRS.
+        Returns the raster's full bounding box if the map's extent isn't known yet.
+
+        Args:
+            x_range (tuple[float] or None): Visible range of the map's x-axis (in Web Mercator)
+            y_range (tuple[float] or None): Visible range of the map's y-axis (in Web Mercator)
+        """
+        if (x_range is None) or (y_range is None): return tuple(self._bounds)
+        return self._map_to_data_transformer.transform_bounds(x_range[0], y_range[0], x_range[1], y_range[1])
+
+    # -------------------------------------------------- Public Class Properties & Methods --------------------------------------------------
+    def load(self, x_range: tuple[float] | None = None, y_range: tuple[float] | None = None, width: int | None = None, height: int | None = None, visible: bool = True) -> gv.Image:
+        """
+        Returns an image plot containing the visible window of the raster, read from the overview level that matches the map's resolution.
+        This method is the callback of a DynamicMap with RangeXY, PlotSize, and layer visibility streams.
+
+        Args:
+            x_range (tuple[float] or None): Visible range of the map's x-axis (in Web Mercator)
+            y_range (tuple[float] or None): Visible range of the map's y-axis (in Web Mercator)
+            width (int or None): Width of the map in screen pixels
+            height (int or None): Height of the map in screen pixels
+            visible (bool): Whether the raster's layer is shown on the map (no pixels are read for hidden layers)
+        """
+        if not visible: return gv.Image([], kdims = ["x", "y"], vdims = [self._vdim], crs = self._crs)
+        # Get the size of one screen pixel from the whole visible extent, so that zooming out past the raster still reads a coarse overview.
+        view_left, view_bottom, view_right, view_top = self._get_view_bounds(x_range, y_range)
+        pixel_size = max((view_right - view_left) / (width or self._default_plot_size), (view_top - view_bottom) / (height or self._default_plot_size))
+        # Get the part of the raster that is visible on the map, and don't read any pixels if the raster isn't visible.
+        raster_left, raster_bottom, raster_right, raster_top = self._bounds
+        left, bottom, right, top = max(raster_left, view_left), max(raster_bottom, view_bottom), min(raster_right, view_right), min(raster_top, view_top)
+        if (left >= right) or (bottom >= top): return gv.Image([], kdims = ["x", "y"], vdims = [self._vdim], crs = self._crs)
+        overview_level = self._select_overview_level(pixel_size)
+        # Read only the window of the selected overview level that covers the visible extent.
+        open_options = {} if overview_level is None else {"OVERVIEW_LEVEL": overview_level}
+        with rasterio.open(self._geotiff_path, **open_options) as dataset:
+            window = from_bounds(left, bottom, right, top, transform = dataset.transform).round_offsets().round_lengths()
+            window = window.intersection(rasterio.windows.Window(0, 0, dataset.width, dataset.height))
+            pixels = dataset.read(1, window = window, masked = True).astype("float32").filled(np.nan)
+            window_transform = dataset.window_transform(window)
+        # Get the coordinates of each pixel's center.
+        num_rows, num_cols = pixels.shape
+        x_coords = window_transform.c + window_transform.a * (np.arange(num_cols) + 0.5)
+        y_coords = window_transform.f + window_transform.e * (np.arange(num_rows) + 0.5)
+        return gv.Image(
+            data = (x_coords, y_coords, pixels),
+            kdims = ["x", "y"], vdims = [self._vdim],
+            crs = self._crs
+        )
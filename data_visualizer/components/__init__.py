@@ -1,3 +1,6 @@
 from .Application import Application
 from .DataMap import DataMap
-from .PopupModal import PopupModal
\ No newline at end of file
+from .PopupModal import PopupModal
+from .SharedDatasetCache import SharedDatasetCache
+from .LatencyTracker import LatencyTracker
+from .TimeSeriesCache import TimeSeriesCache
\ No newline at end of file
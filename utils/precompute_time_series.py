@@ -0,0 +1,143 @@
+# cd C:\Users\Venuxk\Projects\data-visualizer
+# conda activate visualizer
+# python ./utils/precompute_time_series.py
+
+# Standard library imports
+import os
+import sys
+import json
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# External dependencies imports
+import pandas as pd
+import cartopy.crs as ccrs
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from data_visualizer.components.TimeSeriesExtractor import TimeSeriesExtractor
+from data_visualizer.components.TimeSeriesStore import TimeSeriesStore
+from data_visualizer.components.TransectIndex import TransectIndex
+
+# -------------------------------------------------- Constants (should match the constants used in DataMap.py and PopupModal.py) --------------------------------------------------
+outputted_collection_json_name = "collection_info.json"
+collection_epsg_property = "epsg"
+collection_data_categories_property = "categories"
+outputted_buffer_json_name = "buffer_config.json"
+
+transects_subdir_name = "Transects"
+transect_id_col_name = "Transect ID"
+# Time-series settings are read from the same class properties that PopupModal uses, so that the app uses the precomputed time-series whenever its default settings are selected.
+transect_long_col_name = TransectIndex.longitude_col_name
+transect_lat_col_name = TransectIndex.latitude_col_name
+
+dist_col_name = TimeSeriesExtractor.dist_col_name
+default_y_axis_data_col_name = TimeSeriesExtractor.default_y_axis_data_col_name
+distance_measurement = TimeSeriesExtractor.distance_measurements[0]
+raster_sampling_method = TimeSeriesExtractor.raster_sampling_methods[0]
+# Dictionary mapping each collection (key) to the names of columns (value) containing data for its time-series.
+# ^ read from the same JSON file as app.ipynb, so that the precomputed time-series are extracted with the same settings as the app's time-series (otherwise the app ignores them)
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "collection_time_series_data.json")) as time_series_data_json_file:
+    collection_time_series_data = json.load(time_series_data_json_file)
+
+# -------------------------------------------------- Helper Methods --------------------------------------------------
+def precompute_data_file_time_series(collection_dir_path: str, transect_file: str, data_file_path: str, buffer: float | None, data_cols: list[str], collection_epsg: int) -> tuple[str, str, dict, int]:
+    """
+    Extracts data along every transect in the given transect file from the given data file, and saves the extracted data in the collection's time-series store.
+    Returns a tuple containing the transect file's name, the data file's path, the data file's manifest entry, and the number of transects with extracted data.
+    This runs in a worker process, so it only saves the extracted data and leaves updating the manifest to the main process.
+
+    Args:
+        collection_dir_path (str): Path to the collection's directory
+        transect_file (str): Name of the transect file in the collection's Transects subdirectory
+        data_file_path (str): Path to the data file to extract data from (as it appears in the collection's JSON files)
+        buffer (float or None): Buffer/search radius around each transect from the collection's buffer config file
+        data_cols (list[str]): Names of columns containing data for the collection's time-series
+        collection_epsg (int): EPSG code of the collection's CRS
+    """
+    transect_index = TransectIndex(
+        file_path = os.path.join(collection_dir_path, transects_subdir_name, transect_file),
+        collection_crs = ccrs.epsg(collection_epsg),
+        transect_id_col_name = transect_id_col_name
+    )
+    time_series_extractor = TimeSeriesExtractor(
+        dist_col_name = dist_col_name,
+        default_y_axis_data_col_name = default_y_axis_data_col_name,
+        all_data_cols = data_cols,
+        default_crs = ccrs.PlateCarree(),
+        distance_measurement = distance_measurement,
+        raster_sampling_method = raster_sampling_method
+    )
+    y_axis_col, transect_dataframes = default_y_axis_data_col_name, []
+    for plot_index in range(len(transect_index)):
+        transect_id = transect_index.get_id(plot_index)
+        clipped_dataframe, clipped_y_axis_col = time_series_extractor.extract(
+            data_file_path, transect_index.get_coordinates(transect_id).tolist(),
+            transect_long_col_name, transect_lat_col_name, transect_index.crs, buffer
+        )
+        if clipped_dataframe is not None:
+            y_axis_col = clipped_y_axis_col
+            transect_dataframes.append(clipped_dataframe.assign(**{transect_id_col_name: transect_id}))
+    if transect_dataframes: all_transects_dataframe = pd.concat(transect_dataframes, ignore_index = True)
+    else: all_transects_dataframe = pd.DataFrame({transect_id_col_name: pd.Series([], dtype = "int64")})
+    manifest_entry = TimeSeriesStore(collection_dir_path, transect_id_col_name).write_profiles(
+        transect_file = transect_file,
+        data_file_path = data_file_path,
+        dataframe = all_transects_dataframe,
+        buffer = buffer,
+        y_axis_col = y_axis_col
+    )
+    return transect_file, data_file_path, manifest_entry, len(transect_dataframes)
+
+# -------------------------------------------------- Main Program --------------------------------------------------
+if __name__ == "__main__":
+    root_data_dir_path = os.path.relpath("./data")
+    collection_dirs = [file for file in os.listdir(root_data_dir_path) if os.path.isdir(os.path.join(root_data_dir_path, file, transects_subdir_name))]
+    num_collection_dirs = len(collection_dirs)
+    if num_collection_dirs > 0:
+        # 1. Get the collection that the user wants to precompute time-series for.
+        print("Collections with predefined transects:")
+        for i, collection_dir in enumerate(collection_dirs): print("\t[{}] {}".format(i + 1, collection_dir))
+        dir_index = input("Please enter your numeric choice: ")
+        if dir_index.isnumeric() and (0 < int(dir_index) <= num_collection_dirs):
+            selected_collection = collection_dirs[int(dir_index) - 1]
+            collection_dir_path = os.path.join(root_data_dir_path, selected_collection)
+            # 2. Get the number of worker processes to extract data with.
+            num_workers_input = input("How many worker processes should be used? (press Enter to use all {} CPUs): ".format(os.cpu_count()))
+            num_workers = int(num_workers_input) if num_workers_input.isnumeric() and (int(num_workers_input) > 0) else os.cpu_count()
+            # 3. Read the collection's data files, buffers, and transect files.
+            with open(os.path.join(collection_dir_path, outputted_collection_json_name)) as collection_json_file: collection_info = json.load(collection_json_file)
+            with open(os.path.join(collection_dir_path, outputted_buffer_json_name)) as buffer_json_file: buffer_config = json.load(buffer_json_file)
+            collection_epsg = collection_info.get(collection_epsg_property, 4326)
+            data_cols = collection_time_series_data.get(selected_collection, [])
+            data_file_paths = list(dict.fromkeys(
+                [path for file_paths in collection_info.get(collection_data_categories_property, {}).values() for path in file_paths] + list(buffer_config.keys())
+            ))
+            transect_files = [file for file in os.listdir(os.path.join(collection_dir_path, transects_subdir_name)) if os.path.splitext(file)[1].lower() in [".parq", ".parquet", ".geojson"]]
+            # 4. Extract data along every transect from every data file in parallel, one data file and transect file per job.
+            jobs = [(transect_file, path) for transect_file in transect_files for path in data_file_paths]
+            print("Precomputing time-series for {} transect file(s) and {} data file(s) with {} worker(s)...".format(len(transect_files), len(data_file_paths), num_workers))
+            manifest_entries = defaultdict(dict)
+            with ProcessPoolExecutor(max_workers = num_workers) as executor:
+                futures = [
+                    executor.submit(
+                        precompute_data_file_time_series,
+                        collection_dir_path, transect_file, path, buffer_config.get(path, None), data_cols, collection_epsg
+                    )
+                    for transect_file, path in jobs
+                ]
+                for num_done, future in enumerate(as_completed(futures), start = 1):
+                    try:
+                        transect_file, path, manifest_entry, num_transects_with_data = future.result()
+                        manifest_entries[transect_file][path] = manifest_entry
+                        print("\t[{}/{}] {} x {}: data found along {} transect(s)".format(num_done, len(jobs), transect_file, path, num_transects_with_data))
+                    except Exception as error:
+                        print("\t[{}/{}] Error precomputing time-series: {}".format(num_done, len(jobs), error))
+            # 5. Save the manifest, which PopupModal uses to check if the precomputed data is still valid.
+            TimeSeriesStore(collection_dir_path, transect_id_col_name).save_manifest(
+                entries = manifest_entries,
+                settings = TimeSeriesStore.get_settings(transect_long_col_name, transect_lat_col_name, data_cols, distance_measurement, raster_sampling_method)
+            )
+            print("Precomputing time-series complete! All precomputed time-series are saved in {}.".format(os.path.join(collection_dir_path, "time_series_store")))
+        else:
+            print("Invalid choice: Your choice {} did not match any of the ones provided above. Please run this script again with a valid numeric choice.".format(dir_index))
+    else:
+        print("Data not found: There are no collections with a `{}` subdirectory. Make sure your preprocessed data is placed in {}.".format(transects_subdir_name, root_data_dir_path))
@@ -8,14 +8,27 @@ import json
 import xml.etree.ElementTree as ET
 import shutil
 import math
+import hashlib
+import time
+import tempfile
 from collections import defaultdict
+from typing import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # External dependencies imports
 import geopandas as gpd
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import cartopy.crs as ccrs
 import rioxarray as rxr
+import rasterio
+from rasterio.windows import Window
 import dask_geopandas
+import numpy as np
+import datashader as ds
+import datashader.transfer_functions as tf
+from bokeh.palettes import Turbo256
 from download_sciencebase_data import outputted_json_name as sb_download_output_json_name
 
 # -------------------------------------------------- Constants (should match the constants used in DataMap.py) --------------------------------------------------
@@ -23,6 +36,8 @@ outputted_collection_json_name = "collection_info.json"
 collection_epsg_property = "epsg"
 collection_data_categories_property = "categories"
 outputted_buffer_json_name = "buffer_config.json"
+# Name of the JSON file describing the source file, settings, and output of each conversion, which is used to only convert data files again after they change.
+outputted_preprocess_manifest_name = "preprocess_manifest.json"
 
 transects_subdir_name = "Transects"
 transect_geojson_id_property = "Transect ID"
@@ -32,6 +47,45 @@ transect_geojson_end_point_property = "End Point"
 elwha_river_delta_item_id = "5a01f6d0e4b0531197b72cfe"
 elwha_epsg = 32148
 
+tiles_subdir_name = "Tiles"
+tile_size = 256
+tile_min_zoom = 10
+tile_max_zoom = 17
+web_mercator_half_extent = 20037508.342789244
+# Dictionary mapping each collection (key) to the names of columns (value) containing data for its time-series, whose values are shaded in the tiles of point data.
+# ^ read from the same JSON file as app.ipynb, so that the tiles always shade the same columns as the app
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "collection_time_series_data.json")) as time_series_data_json_file:
+    collection_time_series_data = json.load(time_series_data_json_file)
+
+# Settings that change the converted data files (a data file is converted again whenever its converter's settings change).
+point_parquet_partition_bytes = 1e9
+# Maximum memory (in bytes) used for the points of a CSV/TXT file while it's converted into Parquet, which also limits the size of each Parquet partition.
+point_parquet_memory_bytes = 1e9
+# Maximum number of points in each row group of a Parquet partition, whose bounding box is saved in the row group's statistics so that readers can skip row groups outside the map's viewport or a transect's buffer.
+point_parquet_row_group_rows = 50000
+# Points are spatially sorted along a Hilbert curve that fills a 2^order by 2^order grid over the points' bounding box.
+hilbert_curve_order = 16
+geotiff_creation_options = {
+    "driver": "COG",
+    "tiled": True,
+    "blocksize": 256,
+    # Save a full pyramid of internal overviews (halving the resolution until the raster fits in one block), which ViewportRasterSource reads when the map is zoomed out.
+    # ^ averaging elevations keeps each overview pixel representative of the area it covers (unlike nearest, which aliases, or cubic, which overshoots at cliffs)
+    "overviews": "AUTO",
+    "overview_resampling": "AVERAGE",
+    "bigtiff": "YES"
+}
+# Compression settings that can be used for a collection's GeoTIFFs (the predictor is a floating-point predictor for floating-point rasters, which greatly improves compressing smooth elevations).
+geotiff_compression_settings = {
+    "NONE": {"compress": "NONE"},
+    "DEFLATE": {"compress": "DEFLATE", "predictor": "YES", "level": 6},
+    "ZSTD": {"compress": "ZSTD", "predictor": "YES", "level": 9}
+}
+default_geotiff_compression = "ZSTD"
+# Dictionary mapping a collection's directory name (key) to the compression settings (value) used for its GeoTIFFs instead of `default_geotiff_compression`.
+# ^ run this script and compare the GeoTIFF compression settings to choose the settings for a collection
+collection_geotiff_compression = {}
+
 # -------------------------------------------------- Global Variables --------------------------------------------------
 collection_dir_name = None
 collection_crs = None
@@ -41,6 +95,10 @@ collection_info = {
     collection_data_categories_property: defaultdict(list)
 }
 buffer_config = {}
+# Conversions found while searching the data directory, which are run in parallel after the search (see convert_data_files()).
+conversion_jobs = []
+# Number of threads that GDAL uses for compressing each GeoTIFF, which is each worker process's share of the CPUs so that the workers don't oversubscribe the CPUs (see set_worker_globals()).
+geotiff_num_threads = "ALL_CPUS"
 
 # -------------------------------------------------- Helper Methods --------------------------------------------------
 def get_crs_from_xml_file(file_path: str) -> ccrs:
@@ -113,67 +171,260 @@ def get_crs_from_xml_file(file_path: str) -> ccrs:
         # Collections should have the same CRS for all their data files, so return the found CRS if it was already previously computed.
         return collection_crs
 
+def get_transect_epsg() -> int:
+    """
+    Returns the EPSG code of the CRS that the collection's transect files use.
+    """
+    if collection_dir_name and (collection_dir_name == elwha_river_delta_item_id or collection_dir_name == "points_test"): return elwha_epsg
+    else: return 4326
+
+def get_geotiff_creation_options() -> dict:
+    """
+    Returns the creation options for the collection's cloud optimized GeoTIFFs, including the collection's compression settings.
+    """
+    compression = collection_geotiff_compression.get(collection_dir_name, default_geotiff_compression)
+    return {**geotiff_creation_options, **geotiff_compression_settings[compression]}
+
+def get_temp_output_path(output_path: str) -> str:
+    """
+    Returns the path where a converter writes its output before it's complete, and removes any output left there by a conversion that didn't finish.
+
+    Args:
+        output_path (str): Path to the converter's output file or directory
+    """
+    temp_path = output_path + ".tmp"
+    if os.path.isdir(temp_path): shutil.rmtree(temp_path)
+    elif os.path.exists(temp_path): os.remove(temp_path)
+    return temp_path
+
+def replace_output(temp_path: str, output_path: str) -> None:
+    """
+    Replaces the converter's previous output with its complete output, so that an unfinished conversion never leaves a partially written file at the output path.
+
+    Args:
+        temp_path (str): Path to the converter's complete output (see get_temp_output_path())
+        output_path (str): Path to the converter's output file or directory
+    """
+    if os.path.isdir(output_path): shutil.rmtree(output_path)
+    os.replace(temp_path, output_path)
+
+def get_hilbert_distances(xs: np.ndarray, ys: np.ndarray, bounds: tuple[float], order: int = hilbert_curve_order) -> np.ndarray:
+    """
+    Returns the distance of each point along a Hilbert curve that fills the given bounding box, so that sorting points by their distances groups neighboring points together.
+
+    Args:
+        xs (np.ndarray): x-coordinates of the points
+        ys (np.ndarray): y-coordinates of the points
+        bounds (tuple[float]): Bounding box (minx, miny, maxx, maxy) of all points
+        order (int): Order of the Hilbert curve, which fills a 2^order by 2^order grid
+    """
+    min_x, min_y, max_x, max_y = bounds
+    num_cells = 2 ** order
+    # Get the grid cell of each point (points with missing coordinates are placed in the first cell).
+    x = np.clip(np.nan_to_num((xs - min_x) / ((max_x - min_x) or 1) * (num_cells - 1)), 0, num_cells - 1).astype(np.int64)
+    y = np.clip(np.nan_to_num((ys - min_y) / ((max_y - min_y) or 1) * (num_cells - 1)), 0, num_cells - 1).astype(np.int64)
+    distances = np.zeros(len(x), dtype = np.int64)
+    cell_size = num_cells // 2
+    while cell_size > 0:
+        rx, ry = ((x & cell_size) > 0).astype(np.int64), ((y & cell_size) > 0).astype(np.int64)
+        distances += cell_size * cell_size * ((3 * rx) ^ ry)
+        # Rotate the quadrant so that the curve's sub-curves connect.
+        flip = (ry == 0) & (rx == 1)
+        x, y = np.where(flip, num_cells - 1 - x, x), np.where(flip, num_cells - 1 - y, y)
+        x, y = np.where(ry == 0, y, x), np.where(ry == 0, x, y)
+        cell_size //= 2
+    return distances
+
+def get_common_dtype(dtype: np.dtype | None, other_dtype: np.dtype) -> np.dtype:
+    """
+    Returns the data type that can store values of both of the given data types, which is used to give a column the same data type in every Parquet partition.
+
+    Args:
+        dtype (np.dtype or None): Data type of the column in the chunks that were already read, or None if no chunks were read
+        other_dtype (np.dtype): Data type of the column in another chunk
+    """
+    if (dtype is None) or (dtype == other_dtype): return other_dtype
+    if pd.api.types.is_numeric_dtype(dtype) and pd.api.types.is_numeric_dtype(other_dtype) and not (pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_bool_dtype(other_dtype)):
+        return np.result_type(dtype, other_dtype)
+    return np.dtype(object)
+
+def read_csv_txt_chunks(file_path: str, chunk_rows: int, dtypes: dict | None = None) -> Iterator[pd.DataFrame]:
+    """
+    Yields the data file's rows in chunks as pandas DataFrames, without any rows with all NaN values or any unnamed columns.
+
+    Args:
+        file_path (str): Path to the file containing data points
+        chunk_rows (int): Maximum number of rows in each chunk
+        dtypes (dict or None): Dictionary mapping each column's name (key) to its data type (value), or None to infer each chunk's data types
+    """
+    for chunk in pd.read_csv(file_path, chunksize = chunk_rows, dtype = dtypes):
+        chunk = chunk.dropna(axis = 0, how = "all")
+        yield chunk.loc[:, ~chunk.columns.str.match("Unnamed")]
+
+def get_spill_schema(dtypes: dict, hilbert_distance_col: str) -> pa.Schema:
+    """
+    Returns the schema of the files that a data file's points are spilled to while they're spatially sorted, which is the same for every chunk of the data file.
+
+    Args:
+        dtypes (dict): Dictionary mapping each column's name (key) to its data type in every chunk (value)
+        hilbert_distance_col (str): Name of the column containing each point's distance along the Hilbert curve
+    """
+    # Non-numeric columns (e.g. of the object data type) were read as strings (see read_csv_txt_chunks()).
+    return pa.schema(
+        [(col, pa.from_numpy_dtype(dtype) if pd.api.types.is_numeric_dtype(dtype) else pa.string()) for col, dtype in dtypes.items()] +
+        [(hilbert_distance_col, pa.int64())]
+    )
+
+def read_sorted_bucket(bucket_path: str, max_rows: int, hilbert_distance_col: str) -> Iterator[pd.DataFrame]:
+    """
+    Yields the points of a spilled bucket in chunks of at most `max_rows` rows as pandas DataFrames, ordered by their distances along the Hilbert curve.
+    Buckets with more than `max_rows` points (e.g. when the sample of points underestimated a dense part of the curve) are split into smaller buckets on disk first,
+    so that a bucket never has to fit into memory. The bucket's file is deleted once its points are read.
+
+    Args:
+        bucket_path (str): Path to the Parquet file containing the bucket's points
+        max_rows (int): Maximum number of points that are read into memory at once
+        hilbert_distance_col (str): Name of the column containing each point's distance along the Hilbert curve
+    """
+    bucket_file = pq.ParquetFile(bucket_path)
+    if bucket_file.metadata.num_rows <= max_rows:
+        bucket_dataframe = bucket_file.read().to_pandas()
+        os.remove(bucket_path)
+        if len(bucket_dataframe): yield bucket_dataframe.sort_values(by = hilbert_distance_col, kind = "stable").reset_index(drop = True)
+        return
+    distances = np.sort(bucket_file.read(columns = [hilbert_distance_col]).column(0).to_numpy())
+    if distances[0] == distances[-1]:
+        # All of the bucket's points have the same distance, so they're already sorted.
+        for batch in bucket_file.iter_batches(batch_size = max_rows): yield batch.to_pandas()
+        os.remove(bucket_path)
+        return
+    # Split the bucket into smaller buckets with about the same number of points each.
+    # ^ boundaries must be larger than the smallest distance, so that every split moves points out of the bucket
+    num_sub_buckets = math.ceil(len(distances) / max_rows)
+    sub_bucket_boundaries = np.unique(distances[(np.arange(1, num_sub_buckets) * len(distances)) // num_sub_buckets])
+    sub_bucket_boundaries = sub_bucket_boundaries[sub_bucket_boundaries > distances[0]]
+    if not len(sub_bucket_boundaries): sub_bucket_boundaries = distances[-1:]
+    del distances
+    sub_bucket_paths = ["{}.{}".format(bucket_path, sub_bucket) for sub_bucket in range(len(sub_bucket_boundaries) + 1)]
+    sub_bucket_writers = {}
+    try:
+        for batch in bucket_file.iter_batches(batch_size = max_rows):
+            sub_buckets = np.searchsorted(sub_bucket_boundaries, batch.column(hilbert_distance_col).to_numpy(), side = "right")
+            for sub_bucket in np.unique(sub_buckets):
+                if sub_bucket not in sub_bucket_writers: sub_bucket_writers[sub_bucket] = pq.ParquetWriter(sub_bucket_paths[sub_bucket], bucket_file.schema_arrow)
+                sub_bucket_writers[sub_bucket].write_table(pa.Table.from_batches([batch]).filter(pa.array(sub_buckets == sub_bucket)))
+    finally:
+        for writer in sub_bucket_writers.values(): writer.close()
+    os.remove(bucket_path)
+    for sub_bucket in sorted(sub_bucket_writers): yield from read_sorted_bucket(sub_bucket_paths[sub_bucket], max_rows, hilbert_distance_col)
+
 def convert_csv_txt_data_into_parquet(file_path: str, parquet_path: str) -> None:
     """
     Creates and saves a directory with Parquet files containing Points for each data point in the given dataframe.
-    
+    The data file is read in chunks and spatially sorted on disk, so that converting it never uses much more than `point_parquet_memory_bytes` of memory, no matter how large it is.
+
     Args:
         file_path (str): Path to the file containing data points
         parquet_path (str): Path to the newly created Parquet directory, which is a FeatureCollection of Points
     """
-    if not os.path.exists(parquet_path):
-        # Get the file's CRS in case there's only point data in the collection (only converting ASCII grid files requires the returned CRS).
-        global collection_crs
-        if collection_crs is None: _ = get_crs_from_xml_file(file_path)
-        # Read the data file as a pandas DataFrame, drop any rows with all NaN values.
-        pd_dataframe = pd.read_csv(file_path).dropna(axis = 0, how = "all")
-        # Ignore any unnamed columns.
-        pd_dataframe = pd_dataframe.loc[:, ~pd_dataframe.columns.str.match("Unnamed")]
-        # Get the latitude and longitude column names.
-        latitude_col, *_ = [col for col in pd_dataframe.columns if "lat" in col.lower()]
-        longitude_col, *_ = [col for col in pd_dataframe.columns if "lon" in col.lower()]
-        # Convert the pandas DataFrame into a geopandas GeoDataFrame.
-        gpd_geodataframe = gpd.GeoDataFrame(
-            data = pd_dataframe,
-            geometry = gpd.points_from_xy(
-                x = pd_dataframe[longitude_col],
-                y = pd_dataframe[latitude_col],
-                crs = ccrs.PlateCarree()
+    temp_path = get_temp_output_path(parquet_path)
+    spill_dir_path = os.path.join(temp_path, "_spill")
+    os.makedirs(spill_dir_path)
+    # Estimate how many rows fit in memory (pandas, geometries, and sorting make a few temporary copies of each row).
+    first_rows = pd.read_csv(file_path, nrows = 1000)
+    row_bytes = first_rows.memory_usage(deep = True).sum() / max(len(first_rows), 1) + 100
+    chunk_rows = max(int(point_parquet_memory_bytes / (4 * row_bytes)), 1000)
+    # 1. Read the data file once to get the points' bounding box, each column's data type, and a sample of the points.
+    latitude_col, longitude_col = None, None
+    dtypes, num_rows, sample_coords = {}, 0, []
+    min_x, min_y, max_x, max_y = np.inf, np.inf, -np.inf, -np.inf
+    for chunk in read_csv_txt_chunks(file_path, chunk_rows):
+        if latitude_col is None:
+            # Get the latitude and longitude column names.
+            latitude_col, *_ = [col for col in chunk.columns if "lat" in col.lower()]
+            longitude_col, *_ = [col for col in chunk.columns if "lon" in col.lower()]
+        for col, dtype in chunk.dtypes.items(): dtypes[col] = get_common_dtype(dtypes.get(col, None), dtype)
+        xs, ys = chunk[longitude_col].to_numpy(dtype = float), chunk[latitude_col].to_numpy(dtype = float)
+        has_coords = np.isfinite(xs) & np.isfinite(ys)
+        if has_coords.any():
+            min_x, max_x = min(min_x, xs[has_coords].min()), max(max_x, xs[has_coords].max())
+            min_y, max_y = min(min_y, ys[has_coords].min()), max(max_y, ys[has_coords].max())
+        step = max(len(chunk) // 1000, 1)
+        sample_coords.append(np.column_stack([xs[::step], ys[::step]]))
+        num_rows += len(chunk)
+    bounds = (min_x, min_y, max_x, max_y) if np.isfinite(min_x) else (0, 0, 0, 0)
+    # 2. Split the Hilbert curve into buckets with about the same number of points each, using the sample of points.
+    num_buckets = max(math.ceil(num_rows / chunk_rows), 1)
+    sample_coords = np.concatenate(sample_coords) if sample_coords else np.empty((0, 2))
+    sample_distances = np.sort(get_hilbert_distances(sample_coords[:, 0], sample_coords[:, 1], bounds))
+    if len(sample_distances) > 0: bucket_boundaries = sample_distances[(np.arange(1, num_buckets) * len(sample_distances)) // num_buckets]
+    else: bucket_boundaries = np.array([], dtype = np.int64)
+    # 3. Read the data file again, and append each chunk's points to their bucket's file on disk (one file per bucket, so the number of spilled files doesn't grow with the number of chunks).
+    hilbert_distance_col = "hilbert_distance"
+    spill_schema = get_spill_schema(dtypes, hilbert_distance_col)
+    bucket_paths = [os.path.join(spill_dir_path, "{}.parquet".format(bucket)) for bucket in range(num_buckets)]
+    bucket_writers = {}
+    try:
+        for chunk in read_csv_txt_chunks(file_path, chunk_rows, dtypes):
+            distances = get_hilbert_distances(chunk[longitude_col].to_numpy(dtype = float), chunk[latitude_col].to_numpy(dtype = float), bounds)
+            buckets = np.searchsorted(bucket_boundaries, distances, side = "right")
+            chunk_table = pa.Table.from_pandas(chunk.assign(**{hilbert_distance_col: distances}), schema = spill_schema, preserve_index = False)
+            for bucket in np.unique(buckets):
+                if bucket not in bucket_writers: bucket_writers[bucket] = pq.ParquetWriter(bucket_paths[bucket], spill_schema)
+                bucket_writers[bucket].write_table(chunk_table.filter(pa.array(buckets == bucket)))
+    finally:
+        for writer in bucket_writers.values(): writer.close()
+    # 4. Sort each bucket's points by their distances along the Hilbert curve, and save them as partitions of the Parquet directory (oversized buckets are split into several partitions).
+    # ^ each partition has the bounding box of its points in its GeoParquet metadata, which GeoParquetReader uses to skip partitions outside the map's viewport
+    # ^ each partition also has a bbox covering column, whose statistics let GeoParquetReader skip row groups (neighboring points along the Hilbert curve) outside the map's viewport
+    num_partitions = 0
+    for bucket in sorted(bucket_writers):
+        for bucket_dataframe in read_sorted_bucket(bucket_paths[bucket], chunk_rows, hilbert_distance_col):
+            bucket_dataframe = bucket_dataframe.drop(columns = hilbert_distance_col)
+            gpd_geodataframe = gpd.GeoDataFrame(
+                data = bucket_dataframe,
+                geometry = gpd.points_from_xy(
+                    x = bucket_dataframe[longitude_col],
+                    y = bucket_dataframe[latitude_col],
+                    crs = ccrs.PlateCarree()
+                )
+            )
+            gpd_geodataframe.to_parquet(
+                os.path.join(temp_path, "part.{}.parquet".format(num_partitions)),
+                index = False,
+                write_covering_bbox = True,
+                row_group_size = point_parquet_row_group_rows
             )
-        )
-        num_parquet_partitions = math.ceil(gpd_geodataframe.memory_usage(deep = True).sum() / 1e9)
-        # Convert the geopandas GeoDataFrame into a Dask GeoDataFrame.
-        dask_geodataframe = dask_geopandas.from_geopandas(gpd_geodataframe, npartitions = num_parquet_partitions)
-        # Spatially optimize partitions of the DaskGeoDataFrame by using a Hilbert R-tree packing method, which groups neighboring data into the same partition.
-        dask_geodataframe = dask_geodataframe.spatial_shuffle(by = "hilbert", npartitions = num_parquet_partitions)
-        # Save the spatially optimized Dask GeoDataFrame.
-        dask_geodataframe.to_parquet(path = parquet_path)
+            num_partitions += 1
+    shutil.rmtree(spill_dir_path)
+    if not num_partitions:
+        # Save an empty partition for data files without any points, so that the Parquet directory still has the data file's columns.
+        gpd.GeoDataFrame(
+            data = first_rows.loc[:, ~first_rows.columns.str.match("Unnamed")].iloc[:0],
+            geometry = gpd.GeoSeries([], crs = ccrs.PlateCarree())
+        ).to_parquet(os.path.join(temp_path, "part.0.parquet"), index = False, write_covering_bbox = True)
+    replace_output(temp_path, parquet_path)
 
-def convert_ascii_grid_data_into_geotiff(file_path: str, geotiff_path: str) -> None:
+def convert_ascii_grid_data_into_geotiff(file_path: str, geotiff_path: str, file_crs: ccrs.CRS) -> None:
     """
     Converts an ASCII grid file into a cloud optimized GeoTIFF file.
 
     Args:
         file_path (str): Path to the ASCII grid file
         geotiff_path (str): Path to the newly created cloud optimized GeoTIFF file
+        file_crs (cartopy.crs.CRS): CRS of the ASCII grid file from its XML file (see get_crs_from_xml_file())
     """
-    if not os.path.exists(geotiff_path):
-        # Get the CRS of the data file using its XML file.
-        file_crs = get_crs_from_xml_file(file_path)
-        # Add found CRS to the data file.
-        dataset = rxr.open_rasterio(file_path)
-        dataset.rio.write_crs(file_crs, inplace = True)
-        # Save the data as a cloud optimized GeoTIFF.
-        dataset.rio.to_raster(
-            raster_path = geotiff_path,
-            driver = "COG",
-            tiled = True,
-            blocksize = 256,
-            # compress = "DEFLATE",
-            # predictor = "YES",
-            num_threads = "ALL_CPUS",
-            bigtiff = "YES"
-        )
+    temp_path = get_temp_output_path(geotiff_path)
+    # Add found CRS to the data file.
+    dataset = rxr.open_rasterio(file_path)
+    dataset.rio.write_crs(file_crs, inplace = True)
+    # Save the data as a cloud optimized GeoTIFF.
+    dataset.rio.to_raster(
+        raster_path = temp_path,
+        num_threads = geotiff_num_threads,
+        **get_geotiff_creation_options()
+    )
+    replace_output(temp_path, geotiff_path)
 
 def convert_transect_data_into_parquet(file_path: str, parquet_path: str) -> None:
     """
@@ -184,46 +435,363 @@ def convert_transect_data_into_parquet(file_path: str, parquet_path: str) -> Non
         file_path (str): Path to the file containing transect data
         parquet_path (str): Path to the newly created Parquet directory
     """
-    if not os.path.exists(parquet_path):
-        # Create a FeatureCollection of LineStrings based on the data file.
-        features_list = []
-        with open(file_path, "r") as file:
-            transect_feature = None
-            for line in file:
-                [point_id, x, y, _] = line.split(",")
-                point = [float(x), float(y)]
-                if transect_feature is None:
-                    # Initialize a new transect feature.
-                    id = int("".join([char for char in point_id if char.isdigit()]))
-                    transect_feature = {
-                        "type": "Feature",
-                        "properties": {transect_geojson_id_property: id},
-                        "geometry": {
-                            "type": "LineString",
-                            "coordinates": []
-                        }
+    temp_path = get_temp_output_path(parquet_path)
+    # Create a FeatureCollection of LineStrings based on the data file.
+    features_list = []
+    with open(file_path, "r") as file:
+        transect_feature = None
+        for line in file:
+            [point_id, x, y, _] = line.split(",")
+            point = [float(x), float(y)]
+            if transect_feature is None:
+                # Initialize a new transect feature.
+                id = int("".join([char for char in point_id if char.isdigit()]))
+                transect_feature = {
+                    "type": "Feature",
+                    "properties": {transect_geojson_id_property: id},
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": []
                     }
-                    # Add the transect's start point.
-                    transect_feature["geometry"]["coordinates"].append(point)
-                    transect_feature["properties"][transect_geojson_start_point_property] = "({}, {})".format(x, y)
-                else:
-                    # Add the transect's end point.
-                    transect_feature["geometry"]["coordinates"].append(point)
-                    transect_feature["properties"][transect_geojson_end_point_property] = "({}, {})".format(x, y)
-                    # Save the transect to the FeatureCollection.
-                    features_list.append(transect_feature)
-                    # Reset the feature for the next transect.
-                    transect_feature = None
-        # Convert the FeatureCollection into a geopandas GeoDataFrame.
-        gpd_geodataframe = gpd.GeoDataFrame.from_features({"type": "FeatureCollection", "features": features_list})
-        if collection_dir_name and (collection_dir_name == elwha_river_delta_item_id or collection_dir_name == "points_test"): transect_epsg = elwha_epsg
-        else: transect_epsg = 4326
-        gpd_geodataframe = gpd_geodataframe.set_crs(transect_epsg)
-        num_parquet_partitions = math.ceil(gpd_geodataframe.memory_usage(deep = True).sum() / 1e9)
-        # Convert the geopandas GeoDataFrame into a Dask GeoDataFrame.
-        dask_geodataframe = dask_geopandas.from_geopandas(gpd_geodataframe, npartitions = num_parquet_partitions)
-        # Save the spatially optimized Dask GeoDataFrame.
-        dask_geodataframe.to_parquet(path = parquet_path)
+                }
+                # Add the transect's start point.
+                transect_feature["geometry"]["coordinates"].append(point)
+                transect_feature["properties"][transect_geojson_start_point_property] = "({}, {})".format(x, y)
+            else:
+                # Add the transect's end point.
+                transect_feature["geometry"]["coordinates"].append(point)
+                transect_feature["properties"][transect_geojson_end_point_property] = "({}, {})".format(x, y)
+                # Save the transect to the FeatureCollection.
+                features_list.append(transect_feature)
+                # Reset the feature for the next transect.
+                transect_feature = None
+    # Convert the FeatureCollection into a geopandas GeoDataFrame.
+    gpd_geodataframe = gpd.GeoDataFrame.from_features({"type": "FeatureCollection", "features": features_list})
+    gpd_geodataframe = gpd_geodataframe.set_crs(get_transect_epsg())
+    num_parquet_partitions = math.ceil(gpd_geodataframe.memory_usage(deep = True).sum() / point_parquet_partition_bytes)
+    # Convert the geopandas GeoDataFrame into a Dask GeoDataFrame.
+    dask_geodataframe = dask_geopandas.from_geopandas(gpd_geodataframe, npartitions = num_parquet_partitions)
+    # Save the spatially optimized Dask GeoDataFrame.
+    dask_geodataframe.to_parquet(path = temp_path)
+    replace_output(temp_path, parquet_path)
+
+def copy_data_file(file_path: str, output_path: str) -> None:
+    """
+    Copies a data file that's already in a format compatible with DataMap.
+
+    Args:
+        file_path (str): Path to the data file
+        output_path (str): Path to the copied data file
+    """
+    temp_path = get_temp_output_path(output_path)
+    shutil.copy2(file_path, temp_path)
+    replace_output(temp_path, output_path)
+
+def get_path_stats(path: str) -> tuple[int, int]:
+    """
+    Returns the total size (in bytes) and the latest modification time (in nanoseconds) of the given file, or of all files in the given directory.
+
+    Args:
+        path (str): Path to a file or directory
+    """
+    if not os.path.isdir(path):
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns
+    total_size, modified_time = 0, os.stat(path).st_mtime_ns
+    for dir_path, _, files in os.walk(path):
+        for file in files:
+            stat = os.stat(os.path.join(dir_path, file))
+            total_size, modified_time = total_size + stat.st_size, max(modified_time, stat.st_mtime_ns)
+    return total_size, modified_time
+
+def get_path_checksum(path: str) -> str:
+    """
+    Returns the SHA-256 hash of the given file's contents, or of the names and contents of all files in the given directory.
+
+    Args:
+        path (str): Path to a file or directory
+    """
+    checksum = hashlib.sha256()
+    if os.path.isdir(path):
+        file_paths = sorted(os.path.join(dir_path, file) for dir_path, _, files in os.walk(path) for file in files)
+    else:
+        file_paths = [path]
+    for file_path in file_paths:
+        if file_path != path: checksum.update(os.path.relpath(file_path, path).replace(os.sep, "/").encode("utf-8"))
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""): checksum.update(chunk)
+    return checksum.hexdigest()
+
+def get_conversion_settings(converter: Callable, args: tuple) -> dict:
+    """
+    Returns the settings that the given converter creates its output with, which are saved in the preprocess manifest.
+
+    Args:
+        converter (Callable): Function that converts the data file
+        args (tuple): Any arguments passed to the converter after the data file's path and output path
+    """
+    converter_settings = {
+        convert_csv_txt_data_into_parquet.__name__: {
+            "memory_bytes": point_parquet_memory_bytes,
+            "row_group_rows": point_parquet_row_group_rows,
+            "hilbert_curve_order": hilbert_curve_order
+        },
+        convert_ascii_grid_data_into_geotiff.__name__: get_geotiff_creation_options(),
+        convert_transect_data_into_parquet.__name__: {"partition_bytes": point_parquet_partition_bytes, "epsg": get_transect_epsg()}
+    }.get(converter.__name__, {})
+    settings = {
+        "converter": converter.__name__,
+        **converter_settings,
+        "args": [arg.to_wkt() if isinstance(arg, ccrs.CRS) else arg for arg in args]
+    }
+    # Convert the settings into JSON values so that they can be compared to the settings loaded from the manifest.
+    return json.loads(json.dumps(settings))
+
+def is_output_unchanged(output_path: str, manifest_entry: dict) -> bool:
+    """
+    Returns whether the converter's output still exists and hasn't changed since its manifest entry was saved.
+
+    Args:
+        output_path (str): Path to the converter's output file or directory
+        manifest_entry (dict): Conversion's entry in the preprocess manifest
+    """
+    return os.path.exists(output_path) and (list(get_path_stats(output_path)) == [manifest_entry["output_size"], manifest_entry["output_modified_time"]])
+
+def is_conversion_up_to_date(file_path: str, output_path: str, settings: dict, manifest_entry: dict | None) -> bool:
+    """
+    Returns whether the data file, its converter's settings, and its output are the same as when its manifest entry was saved, without reading any of their contents.
+
+    Args:
+        file_path (str): Path to the data file
+        output_path (str): Path to the converter's output file or directory
+        settings (dict): Converter's current settings (see get_conversion_settings())
+        manifest_entry (dict or None): Conversion's entry in the preprocess manifest, or None if the data file was never converted
+    """
+    if (manifest_entry is None) or (manifest_entry["settings"] != settings): return False
+    if list(get_path_stats(file_path)) != [manifest_entry["source_size"], manifest_entry["source_modified_time"]]: return False
+    return is_output_unchanged(output_path, manifest_entry)
+
+def run_conversion_job(converter: Callable, file_path: str, output_path: str, args: tuple, settings: dict, manifest_entry: dict | None) -> tuple[dict, bool]:
+    """
+    Converts the data file unless only its modification time changed since it was last converted (e.g. after downloading it again).
+    Returns a tuple containing the conversion's new manifest entry and whether the data file was converted.
+    This runs in a worker process, so it leaves updating the manifest to the main process.
+
+    Args:
+        converter (Callable): Function that converts the data file
+        file_path (str): Path to the data file
+        output_path (str): Path to the converter's output file or directory
+        args (tuple): Any arguments passed to the converter after the data file's path and output path
+        settings (dict): Converter's current settings (see get_conversion_settings())
+        manifest_entry (dict or None): Conversion's previous entry in the preprocess manifest, or None if the data file was never converted
+    """
+    # Get the data file's size and modification time before reading it, so that any changes made while it's converted are found on the next run.
+    source_size, source_modified_time = get_path_stats(file_path)
+    source_checksum = get_path_checksum(file_path)
+    is_unchanged = (
+        (manifest_entry is not None) and (manifest_entry["settings"] == settings) and
+        (manifest_entry["source_checksum"] == source_checksum) and is_output_unchanged(output_path, manifest_entry)
+    )
+    if not is_unchanged: converter(file_path, output_path, *args)
+    output_size, output_modified_time = get_path_stats(output_path)
+    new_manifest_entry = {
+        "source_path": file_path,
+        "source_size": source_size,
+        "source_modified_time": source_modified_time,
+        "source_checksum": source_checksum,
+        "settings": settings,
+        "output_size": output_size,
+        "output_modified_time": output_modified_time,
+        "output_checksum": manifest_entry["output_checksum"] if is_unchanged else get_path_checksum(output_path)
+    }
+    return new_manifest_entry, not is_unchanged
+
+def load_preprocess_manifest(manifest_path: str) -> dict:
+    """
+    Returns the preprocess manifest, which maps each converter's output path (key) to the conversion's entry (value).
+
+    Args:
+        manifest_path (str): Path to the collection's preprocess manifest
+    """
+    if not os.path.exists(manifest_path): return {}
+    with open(manifest_path) as manifest_file: return json.load(manifest_file)
+
+def save_preprocess_manifest(manifest_path: str, manifest: dict) -> None:
+    """
+    Saves the preprocess manifest without leaving a partially written manifest if the program stops while it's saved.
+
+    Args:
+        manifest_path (str): Path to the collection's preprocess manifest
+        manifest (dict): Dictionary mapping each converter's output path (key) to the conversion's entry (value)
+    """
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, "w") as manifest_file: json.dump(manifest, manifest_file, indent = 4)
+    os.replace(temp_path, manifest_path)
+
+def benchmark_geotiff_compression(file_path: str, file_crs: ccrs.CRS, num_reads: int = 5) -> None:
+    """
+    Converts an ASCII grid file into a cloud optimized GeoTIFF with each of the compression settings, and prints each GeoTIFF's size, write time, and read times.
+    The read times are the median times of reading a 1024x1024 window at full resolution (like zooming into the map) and reading the whole raster at 1/16 of its resolution (like zooming out, which reads an overview).
+
+    Args:
+        file_path (str): Path to the ASCII grid file
+        file_crs (cartopy.crs.CRS): CRS of the ASCII grid file from its XML file (see get_crs_from_xml_file())
+        num_reads (int): Number of times that each read is timed
+    """
+    dataset = rxr.open_rasterio(file_path)
+    dataset.rio.write_crs(file_crs, inplace = True)
+    print("Comparing GeoTIFF compression settings for {}...".format(file_path))
+    print("\t{:<10}{:>12}{:>10}{:>12}{:>18}{:>18}".format("Setting", "Size (MB)", "Ratio", "Write (s)", "Zoomed-In (ms)", "Zoomed-Out (ms)"))
+    with tempfile.TemporaryDirectory() as temp_dir_path:
+        for compression, compression_settings in geotiff_compression_settings.items():
+            geotiff_path = os.path.join(temp_dir_path, "{}.tif".format(compression))
+            start_time = time.perf_counter()
+            dataset.rio.to_raster(raster_path = geotiff_path, num_threads = "ALL_CPUS", **geotiff_creation_options, **compression_settings)
+            write_time = time.perf_counter() - start_time
+            file_size = os.path.getsize(geotiff_path)
+            zoomed_in_times, zoomed_out_times = [], []
+            for _ in range(num_reads):
+                with rasterio.open(geotiff_path) as geotiff:
+                    window_width, window_height = min(1024, geotiff.width), min(1024, geotiff.height)
+                    window = Window((geotiff.width - window_width) // 2, (geotiff.height - window_height) // 2, window_width, window_height)
+                    start_time = time.perf_counter()
+                    geotiff.read(1, window = window)
+                    zoomed_in_times.append(time.perf_counter() - start_time)
+                    start_time = time.perf_counter()
+                    geotiff.read(1, out_shape = (max(geotiff.height // 16, 1), max(geotiff.width // 16, 1)))
+                    zoomed_out_times.append(time.perf_counter() - start_time)
+            # The ratio compares the GeoTIFF's size to the size of the raster's values in memory.
+            print("\t{:<10}{:>12.1f}{:>10.2f}{:>12.2f}{:>18.1f}{:>18.1f}".format(
+                compression, file_size / 1e6, dataset.nbytes / file_size, write_time,
+                np.median(zoomed_in_times) * 1000, np.median(zoomed_out_times) * 1000
+            ))
+    print("Set `collection_geotiff_compression[\"{}\"]` in this script to one of the settings above to use it for the collection (currently {}).".format(
+        collection_dir_name, collection_geotiff_compression.get(collection_dir_name, default_geotiff_compression)
+    ))
+
+def set_worker_globals(dir_name: str, crs: ccrs.CRS | None, num_threads: int) -> None:
+    """
+    Sets the global variables that the converters use in a worker process, since worker processes don't run the main program.
+
+    Args:
+        dir_name (str): Name of the collection's directory
+        crs (cartopy.crs.CRS or None): Collection's CRS found while searching the data directory
+        num_threads (int): Number of threads that each worker process can use for compressing a GeoTIFF
+    """
+    global collection_dir_name, collection_crs, geotiff_num_threads
+    collection_dir_name, collection_crs, geotiff_num_threads = dir_name, crs, num_threads
+
+def convert_data_files(num_workers: int, manifest_path: str) -> None:
+    """
+    Runs the conversions found by preprocess_data() in a pool of worker processes, and prints each conversion once it finishes.
+    Conversions whose data file, settings, and output haven't changed since the last run (according to the preprocess manifest) are skipped.
+    The collection's JSON files are filled in while searching the data directory instead of by the workers, so they are the same no matter which conversions finish first.
+
+    Args:
+        num_workers (int): Number of worker processes converting data files at the same time
+        manifest_path (str): Path to the collection's preprocess manifest
+    """
+    manifest = load_preprocess_manifest(manifest_path)
+    jobs_to_run = []
+    for converter, file_path, output_path, *args in conversion_jobs:
+        settings = get_conversion_settings(converter, args)
+        if not is_conversion_up_to_date(file_path, output_path, settings, manifest.get(output_path, None)):
+            jobs_to_run.append((converter, file_path, output_path, args, settings))
+    num_jobs = len(jobs_to_run)
+    print("Converting {} changed or new data file(s) with {} worker(s) ({} data file(s) are up to date)...".format(num_jobs, num_workers, len(conversion_jobs) - num_jobs))
+    # Split the CPUs between the worker processes, since each worker compresses GeoTIFFs with several threads.
+    num_threads_per_worker = max((os.cpu_count() or 1) // num_workers, 1)
+    with ProcessPoolExecutor(max_workers = num_workers, initializer = set_worker_globals, initargs = (collection_dir_name, collection_crs, num_threads_per_worker)) as executor:
+        futures_to_jobs = {
+            executor.submit(run_conversion_job, converter, file_path, output_path, args, settings, manifest.get(output_path, None)): (file_path, output_path)
+            for converter, file_path, output_path, args, settings in jobs_to_run
+        }
+        for num_done, future in enumerate(as_completed(futures_to_jobs), start = 1):
+            file_path, output_path = futures_to_jobs[future]
+            try:
+                manifest[output_path], is_converted = future.result()
+                print("\t[{}/{}] {} -> {}{}".format(num_done, num_jobs, file_path, output_path, "" if is_converted else " (contents unchanged)"))
+            except Exception as error:
+                # Convert the data file again on the next run.
+                manifest.pop(output_path, None)
+                print("\t[{}/{}] Error converting {}: {}".format(num_done, num_jobs, file_path, error))
+            # Save the manifest after each conversion, so that finished conversions are skipped if the program stops before the others finish.
+            save_preprocess_manifest(manifest_path, manifest)
+
+def get_tile_indices(bounds: tuple[float], zoom: int) -> tuple[range, range]:
+    """
+    Returns the ranges of x and y indices (XYZ scheme, where y = 0 is the northernmost row) of the Web Mercator tiles that overlap the given bounds at the given zoom level.
+
+    Args:
+        bounds (tuple[float]): Bounding box (left, bottom, right, top) in Web Mercator coordinates
+        zoom (int): Zoom level of the tiles
+    """
+    num_tiles = 2 ** zoom
+    tile_length = 2 * web_mercator_half_extent / num_tiles
+    left, bottom, right, top = bounds
+    min_x = max(0, int((left + web_mercator_half_extent) // tile_length))
+    max_x = min(num_tiles - 1, int((right + web_mercator_half_extent) // tile_length))
+    min_y = max(0, int((web_mercator_half_extent - top) // tile_length))
+    max_y = min(num_tiles - 1, int((web_mercator_half_extent - bottom) // tile_length))
+    return range(min_x, max_x + 1), range(min_y, max_y + 1)
+
+def bake_xyz_tiles(data_file_path: str, tiles_dir_path: str, min_zoom: int = tile_min_zoom, max_zoom: int = tile_max_zoom) -> None:
+    """
+    Renders the given data file into a pyramid of Web Mercator XYZ PNG tiles (saved as {zoom}/{x}/{y}.png), which DataMap can display instead of rasterizing the file whenever the map changes.
+
+    Args:
+        data_file_path (str): Path to the preprocessed Parquet directory of points or GeoTIFF file
+        tiles_dir_path (str): Path to the directory where the tile pyramid is saved
+        min_zoom (int): Lowest zoom level to render
+        max_zoom (int): Highest zoom level to render
+    """
+    _, extension = os.path.splitext(data_file_path)
+    extension = extension.lower()
+    # Load the data in Web Mercator coordinates (the map's projection).
+    if extension in [".parq", ".parquet"]:
+        gpd_geodataframe = dask_geopandas.read_parquet(data_file_path).compute().to_crs(epsg = 3857)
+        data_col = next((col for col in collection_time_series_data.get(collection_dir_name, []) if col in gpd_geodataframe.columns), None)
+        data = pd.DataFrame({"x": gpd_geodataframe.geometry.x, "y": gpd_geodataframe.geometry.y})
+        if data_col is not None: data["value"] = gpd_geodataframe[data_col].to_numpy()
+        aggregator = ds.mean("value") if data_col is not None else ds.count()
+        data_bounds = (data["x"].min(), data["y"].min(), data["x"].max(), data["y"].max())
+        value_range = (data["value"].min(), data["value"].max()) if data_col is not None else None
+        aggregate = lambda canvas: canvas.points(data, "x", "y", agg = aggregator)
+        # Pixels without points are NaN when averaging values, but 0 when counting points.
+        has_data = (lambda values: np.isfinite(values)) if data_col is not None else (lambda values: values > 0)
+    elif extension in [".tif", ".tiff"]:
+        dataset = rxr.open_rasterio(data_file_path, masked = True).squeeze(drop = True).rio.reproject("EPSG:3857")
+        data_bounds = dataset.rio.bounds()
+        value_range = (float(dataset.min()), float(dataset.max()))
+        aggregate = lambda canvas: canvas.raster(dataset)
+        has_data = lambda values: np.isfinite(values)
+    else:
+        print("Error baking tiles for {}: Data files with the {} file format are not supported yet.".format(data_file_path, extension))
+        return
+    # Render each tile that overlaps the data, using the same color range for all tiles so that colors are consistent between tiles and zoom levels.
+    num_tiles = 0
+    for zoom in range(min_zoom, max_zoom + 1):
+        tile_length = 2 * web_mercator_half_extent / (2 ** zoom)
+        x_indices, y_indices = get_tile_indices(data_bounds, zoom)
+        for x in x_indices:
+            for y in y_indices:
+                tile_left = -web_mercator_half_extent + x * tile_length
+                tile_top = web_mercator_half_extent - y * tile_length
+                canvas = ds.Canvas(
+                    plot_width = tile_size, plot_height = tile_size,
+                    x_range = (tile_left, tile_left + tile_length),
+                    y_range = (tile_top - tile_length, tile_top)
+                )
+                tile_aggregate = aggregate(canvas)
+                # Skip tiles without any data.
+                if not has_data(tile_aggregate.values).any(): continue
+                tile_image = tf.shade(tile_aggregate, cmap = Turbo256, how = "linear", span = value_range)
+                if extension in [".parq", ".parquet"]: tile_image = tf.spread(tile_image, px = 1)
+                tile_dir_path = os.path.join(tiles_dir_path, str(zoom), str(x))
+                if not os.path.exists(tile_dir_path): os.makedirs(tile_dir_path)
+                tile_image.to_pil().save(os.path.join(tile_dir_path, "{}.png".format(y)))
+                num_tiles += 1
+    print("\t{} -> {} ({} tiles)".format(data_file_path, tiles_dir_path, num_tiles))
 
 def set_readable_file_name(file_path: str) -> None:
     """
@@ -306,6 +874,7 @@ def sort_data_files_by_collection_date(categories_to_files: dict) -> None:
 def preprocess_data(src_dir_path: str, dest_dir_path: str, dir_level: int = 1) -> None:
     """
     Recursively preprocess all the data in the given data directory.
+    Data files that need to be converted are added to `conversion_jobs`, which are run afterwards by convert_data_files().
 
     Args:
         src_dir_path (str): Location of the source directory containing data files to convert into formats that are compatible with DataMap
@@ -342,22 +911,23 @@ def preprocess_data(src_dir_path: str, dest_dir_path: str, dir_level: int = 1) -
             # Convert data file into a format that is more compatible for DataMap.
             if file_format in [".csv", ".txt"]:
                 parquet_files_path = os.path.join(new_dest_dir_path, name + ".parq")
-                print("\t{} -> {}".format(file, parquet_files_path))
                 if transects_dir_exists and (src_dir_name == transects_subdir_name):
-                    convert_transect_data_into_parquet(file_path, parquet_files_path)
+                    conversion_jobs.append((convert_transect_data_into_parquet, file_path, parquet_files_path))
                 else:
-                    convert_csv_txt_data_into_parquet(file_path, parquet_files_path)
+                    # Get the file's CRS in case there's only point data in the collection (only converting ASCII grid files requires the returned CRS).
+                    if collection_crs is None: _ = get_crs_from_xml_file(file_path)
+                    conversion_jobs.append((convert_csv_txt_data_into_parquet, file_path, parquet_files_path))
                     buffer_config[parquet_files_path] = 3
                     set_readable_file_name(parquet_files_path)
             elif file_format == ".asc":
                 geotiff_file_path = os.path.join(new_dest_dir_path, name + ".tif")
-                print("\t{} -> {}".format(file, geotiff_file_path))
-                convert_ascii_grid_data_into_geotiff(file_path, geotiff_file_path)
+                # Get the CRS of the data file using its XML file, which is found here instead of in a worker process so that every file gets the same CRS as when converting files one at a time.
+                conversion_jobs.append((convert_ascii_grid_data_into_geotiff, file_path, geotiff_file_path, get_crs_from_xml_file(file_path)))
                 buffer_config[geotiff_file_path] = 0
                 set_readable_file_name(geotiff_file_path)
             elif file_format in [".parq", ".tif", ".tiff"]:
                 geodata_file_path = os.path.join(new_dest_dir_path, file)
-                if not os.path.exists(geodata_file_path): shutil.copy2(file_path, new_dest_dir_path)
+                conversion_jobs.append((copy_data_file, file_path, geodata_file_path))
                 set_readable_file_name(geodata_file_path)
             elif file_format not in [".xml", ".png"]:
                 print("Error converting {}: Data files with the {} file format are not supported yet.".format(file_path, file_format))
@@ -380,12 +950,23 @@ if __name__ == "__main__":
             if transects_input in ["y", "n"]:
                 if transects_input == "y": transects_dir_exists = True
                 elif transects_input == "n": transects_dir_exists = False
-                # 3. Iterate through data directories and convert data files into formats that are compatible with DataMap.
+                # 3. Get the number of worker processes to convert data files with.
+                num_workers_input = input("How many worker processes should be used? (press Enter to use all {} CPUs): ".format(os.cpu_count()))
+                num_workers = int(num_workers_input) if num_workers_input.isnumeric() and (int(num_workers_input) > 0) else os.cpu_count()
+                # 4. Iterate through data directories and convert data files into formats that are compatible with DataMap.
                 data_dir_path = os.path.join(parent_data_dir_path, selected_data_dir)
                 print("All data from {} will be preprocessed momentarily...".format(data_dir_path))
                 root_output_dir_path = os.path.relpath("./data")
                 preprocess_data(src_dir_path = data_dir_path, dest_dir_path = root_output_dir_path)
-                # 4. Save data's CRS in an outputted collection_info.json file.
+                # Optionally compare the size and read times of GeoTIFFs with each compression setting, using the first ASCII grid file.
+                ascii_grid_jobs = [job for job in conversion_jobs if job[0] is convert_ascii_grid_data_into_geotiff]
+                if ascii_grid_jobs:
+                    _, ascii_grid_file_path, _, ascii_grid_crs = ascii_grid_jobs[0]
+                    benchmark_input = input("Do you want to compare GeoTIFF compression settings using {}?\n\t[y] Yes\n\t[n] No\nPlease enter your alphabetic choice: ".format(ascii_grid_file_path))
+                    if benchmark_input == "y": benchmark_geotiff_compression(ascii_grid_file_path, ascii_grid_crs)
+                preprocessed_data_path = os.path.join(root_output_dir_path, selected_data_dir)
+                convert_data_files(num_workers, os.path.join(preprocessed_data_path, outputted_preprocess_manifest_name))
+                # 5. Save data's CRS in an outputted collection_info.json file.
                 if collection_crs is not None: collection_info[collection_epsg_property] = collection_crs.to_epsg()
                 # Also save contents from sciencebase_id_to_title.json if the data was downloaded with download_sciencebase_data.py.
                 sb_download_output_json_file_path = os.path.join(data_dir_path, sb_download_output_json_name)
@@ -396,13 +977,25 @@ if __name__ == "__main__":
                     collection_info.update(item_id_to_title)
                 # Sort data files by their collection date, if possible.
                 sort_data_files_by_collection_date(collection_info[collection_data_categories_property])
-                preprocessed_data_path = os.path.join(root_output_dir_path, selected_data_dir)
                 with open(os.path.join(preprocessed_data_path, outputted_collection_json_name), "w") as collection_json_file:
                     json.dump(collection_info, collection_json_file, indent = 4)
-                # 5. Save buffer configurations for each data file, which is later used to extract data along or near a transect.
+                # 6. Save buffer configurations for each data file, which is later used to extract data along or near a transect.
                 with open(os.path.join(preprocessed_data_path, outputted_buffer_json_name), "w") as buffer_json_file:
                     json.dump(buffer_config, buffer_json_file, indent = 4)
                 print("Converting data complete! All preprocessed data files are saved as a collection in {}.".format(preprocessed_data_path))
+                # 7. Optionally render each data file into a tile pyramid, which DataMap displays instead of rasterizing data whenever the map changes.
+                tiles_input = input("Do you want to bake map tiles for each data file in {}?\n\t[y] Yes\n\t[n] No\nPlease enter your alphabetic choice: ".format(selected_data_dir))
+                if tiles_input == "y":
+                    print("Baking tiles for zoom levels {} to {}...".format(tile_min_zoom, tile_max_zoom))
+                    for subdir in [file for file in os.listdir(preprocessed_data_path) if os.path.isdir(os.path.join(preprocessed_data_path, file)) and (file not in [transects_subdir_name, tiles_subdir_name])]:
+                        subdir_path = os.path.join(preprocessed_data_path, subdir)
+                        for file in os.listdir(subdir_path):
+                            if os.path.splitext(file)[1].lower() in [".parq", ".parquet", ".tif", ".tiff"]:
+                                bake_xyz_tiles(
+                                    data_file_path = os.path.join(subdir_path, file),
+                                    tiles_dir_path = os.path.join(preprocessed_data_path, tiles_subdir_name, file)
+                                )
+                    print("Baking tiles complete! All tiles are saved in {}.".format(os.path.join(preprocessed_data_path, tiles_subdir_name)))
             else:
                 print("Invalid choice: Your choice {} did not match any of the ones provided above. Please run this script again with a valid alphabetic choice.".format(transects_input))
         else: